@@ -0,0 +1,638 @@
+from typing import Any, Callable
+from collections import Counter
+from contextlib import contextmanager
+import types
+
+import networkx as nx
+
+from manim import *
+
+from manim_ds.m_collection.m_collection import MElement
+from manim_ds.m_collection.m_array import MArray
+from manim_ds.m_collection.m_stack import MStack
+from manim_ds.m_graph.m_graph import MGraph, EdgeTable
+from manim_ds.m_variable.m_variable import MVariable
+
+# Logic-only stand-ins for the structures: they keep values, order and
+# highlight flags but build no Text, shape or updater. dry_run() executes
+# a Scene with them and records what would have been played; while it
+# runs, building any structure, mobject or animation builds its stand-in:
+#
+#     timeline = dry_run(DfsIterative)
+#     print(timeline.summary())
+#
+# The Scene itself is not modified, it renders with manim as usual.
+
+_TIMELINE = None
+
+
+def _record(mobject, operation: str):
+    if _TIMELINE is not None:
+        _TIMELINE.counts[f"{mobject._real.__name__}.{operation}"] += 1
+
+
+class HeadlessAnimation:
+    def __init__(self, name: str, run_time: float):
+        self.name = name
+        self.run_time = run_time
+
+
+class Timeline:
+    def __init__(self):
+        self.counts = Counter()
+        # (start time, duration, animation names) for every play and wait
+        self.events = []
+        self.duration = 0.0
+
+
+    def play(self, *anims, run_time: float = None, **kwargs):
+        anims = [_as_animation(anim) for anim in anims]
+        if run_time is None:
+            run_time = max((anim.run_time for anim in anims), default=DEFAULT_ANIMATION_RUN_TIME)
+        self.events.append((self.duration, run_time, [anim.name for anim in anims]))
+        self.duration += run_time
+
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, **kwargs):
+        self.events.append((self.duration, duration, ["Wait"]))
+        self.duration += duration
+
+
+    def summary(self) -> dict:
+        return {
+            "plays": sum(1 for _, _, names in self.events if names != ["Wait"]),
+            "operations": sum(self.counts.values()),
+            "duration": self.duration,
+            "frames": int(self.duration * config.frame_rate),
+            "counts": dict(self.counts),
+        }
+
+
+class _AnimateProxy:
+    # Stands for mobject.animate: calls run at once, play() reads the result
+    def __init__(self, target):
+        self.target = target
+        self.calls = []
+        self.anim_kwargs = {}
+
+
+    def __call__(self, **kwargs):
+        self.anim_kwargs.update(kwargs)
+        return self
+
+
+    def __getattr__(self, name: str):
+        method = getattr(self.target, name)
+        def call(*args, anim_args=None, **kwargs):
+            method(*args, **kwargs)
+            if anim_args:
+                self.anim_kwargs.update(anim_args)
+            self.calls.append(name)
+            return self
+        return call
+
+
+def _as_animation(anim) -> HeadlessAnimation:
+    if isinstance(anim, _AnimateProxy):
+        name = f"{anim.target._real.__name__}.{'.'.join(anim.calls)}"
+        return HeadlessAnimation(name, anim.anim_kwargs.get("run_time", DEFAULT_ANIMATION_RUN_TIME))
+    return anim
+
+
+def _headless_animation(animation: type) -> Callable:
+    def build(*args, run_time: float = None, **kwargs):
+        children = [_as_animation(arg) for arg in args if isinstance(arg, (HeadlessAnimation, _AnimateProxy))]
+        if run_time is None:
+            if issubclass(animation, Succession):
+                run_time = sum(child.run_time for child in children)
+            elif issubclass(animation, AnimationGroup):
+                run_time = max((child.run_time for child in children), default=0)
+            else:
+                run_time = DEFAULT_ANIMATION_RUN_TIME
+        return HeadlessAnimation(animation.__name__, run_time)
+    return build
+
+
+# Geometry, style and presentation calls have nothing to do without a
+# picture, they are accepted and ignored. Anything else the headless class
+# does not implement raises, a dry run must not pass over real logic.
+_IGNORED_CALLS = frozenset({
+    "shift", "move_to", "scale", "rotate", "flip", "stretch", "center",
+    "next_to", "to_edge", "to_corner", "align_to", "arrange", "arrange_in_grid",
+    "set_x", "set_y", "set_z", "set_width", "set_height", "match_width", "match_height",
+    "set_color", "set_fill", "set_stroke", "set_opacity", "set_style", "match_style",
+    "set_z_index", "fade", "add_updater", "remove_updater", "clear_updaters",
+    "suspend_updating", "resume_updating", "add", "remove", "add_to_back",
+    "add_indexes", "add_index", "add_label", "set_square_args", "set_value_args", "set_index_args",
+    "set_node_args", "set_edge_args", "set_weight_args", "set_node_highlight", "set_edge_highlight",
+    "set_level_of_detail", "remove_level_of_detail", "set_culling", "remove_culling",
+    "freeze", "thaw", "batch_edges", "unbatch_edges",
+})
+
+# Point queries answer with the origin, sizes with zero
+_POINT_QUERIES = frozenset({
+    "get_center", "get_start", "get_end", "get_top", "get_bottom", "get_left", "get_right",
+    "get_corner", "get_edge_center", "get_critical_point", "get_boundary_point",
+})
+_SIZE_QUERIES = frozenset({"width", "height", "depth"})
+
+
+class HeadlessMobject:
+    _real = VMobject
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+    def __getattr__(self, name: str):
+        if name in _IGNORED_CALLS:
+            return self._ignore
+        if name in _POINT_QUERIES:
+            return lambda *args, **kwargs: ORIGIN.copy()
+        if name in _SIZE_QUERIES:
+            return 0
+        # _X_animation, as called by the algorithms, applies X and
+        # returns the animation play() would receive
+        if name.startswith("_") and name.endswith("_animation"):
+            operation = name[1:-len("_animation")]
+            method = getattr(type(self), operation, None)
+            if method is not None:
+                def animation(*args, anim_args=None, **kwargs):
+                    method(self, *args, **kwargs)
+                    run_time = (anim_args or {}).get("run_time", DEFAULT_ANIMATION_RUN_TIME)
+                    return HeadlessAnimation(f"{self._real.__name__}.{operation}", run_time)
+                return animation
+        raise AttributeError(f"{self._real.__name__} has no headless attribute {name}")
+
+
+    def _ignore(self, *args, **kwargs):
+        return self
+
+
+    @property
+    def animate(self):
+        return _AnimateProxy(self)
+
+
+def _headless_mobject(mobject: type) -> Callable:
+    def build(*args, **kwargs):
+        headless = HeadlessMobject()
+        headless._real = mobject
+        return headless
+    return build
+
+
+class HeadlessElement(HeadlessMobject):
+    _real = MElement
+
+    def __init__(self, value: Any, *args, **kwargs):
+        self.text = str(value)
+        self.data = value
+        self.square = _headless_mobject(Rectangle)()
+        self.value = _headless_mobject(Text)()
+        self.index = _headless_mobject(Text)()
+        self.highlighted = False
+
+
+    def set_value(self, new_value: Any):
+        _record(self, "set_value")
+        self.text = str(new_value)
+        self.data = new_value
+        return self
+
+
+    def highlight(self, stroke_color: ManimColor = RED, stroke_width: float = 8):
+        _record(self, "highlight")
+        self.highlighted = True
+        return self
+
+
+    def unhighlight(self):
+        _record(self, "unhighlight")
+        self.highlighted = False
+        return self
+
+
+    def is_highlighted(self) -> bool:
+        return self.highlighted
+
+
+class HeadlessVariable(HeadlessElement):
+    _real = MVariable
+
+
+class HeadlessArray(HeadlessMobject):
+    _real = MArray
+
+    def __init__(self, arr: list = [], *args, **kwargs):
+        self.elements = [HeadlessElement(value) for value in arr]
+
+
+    def __getitem__(self, key):
+        if key >= len(self.elements):
+            raise Exception("Index out of bounds!")
+        return self.elements[key]
+
+
+    @property
+    def _size(self) -> int:
+        return len(self.elements)
+
+
+    @property
+    def values(self) -> np.ndarray:
+        return MArray._typed(self, [element.data for element in self.elements])
+
+
+    # The queries only read values, they are shared with MArray
+    _bounds = MArray._bounds
+    argmin = MArray.argmin
+    argmax = MArray.argmax
+    where = MArray.where
+    is_sorted = MArray.is_sorted
+    search = MArray.search
+
+
+    def set_value(self, index: int, value: Any):
+        return self.set_values([index], [value])
+
+
+    def append(self, value: Any):
+        _record(self, "append")
+        self.elements.append(HeadlessElement(value))
+        return self
+
+
+    def extend(self, values: list):
+        _record(self, "extend")
+        self.elements.extend(HeadlessElement(value) for value in values)
+        return self
+
+
+    def insert(self, index: int, value: Any):
+        _record(self, "insert")
+        self.elements.insert(index, HeadlessElement(value))
+        return self
+
+
+    def pop(self, index: int = -1):
+        _record(self, "pop")
+        if self.elements:
+            self.elements.pop(index)
+        return self
+
+
+    def swap(self, i: int, j: int, path_arc: float = PI/2):
+        _record(self, "swap")
+        self.elements[i], self.elements[j] = self.elements[j], self.elements[i]
+        return self
+
+
+    def set_values(self, mask_or_indices, values, sources=None):
+        _record(self, "set_values")
+        selector = np.asarray(mask_or_indices)
+        indices = np.flatnonzero(selector).tolist() if selector.dtype == bool else selector.reshape(-1).tolist()
+        values = np.asarray(values, dtype=object)
+        values = [values.item()] * len(indices) if values.ndim == 0 else list(values)
+        if len(values) != len(indices):
+            raise Exception("The number of values does not match the number of elements!")
+        for index, value in zip(indices, values):
+            self.elements[index].text = str(value)
+            self.elements[index].data = value
+        return self
+
+
+    def assign(self, values: list):
+        _record(self, "assign")
+        self.elements = [HeadlessElement(value) for value in values]
+        return self
+
+
+    def highlight_range(self, i: int, j: int, stroke_color: ManimColor = RED, stroke_width: float = 8):
+        _record(self, "highlight_range")
+        for element in self.elements[i:j]:
+            element.highlighted = True
+        return self
+
+
+    def unhighlight_range(self, i: int, j: int):
+        _record(self, "unhighlight_range")
+        for element in self.elements[i:j]:
+            element.highlighted = False
+        return self
+
+
+    def snapshot(self) -> list:
+        return [(element, element.data, element.highlighted) for element in self.elements]
+
+
+    def restore(self, snapshot: list = None):
+        _record(self, "restore")
+        self.elements = [element for element, _, _ in snapshot]
+        for element, data, highlighted in snapshot:
+            element.text, element.data, element.highlighted = str(data), data, highlighted
+        return self
+
+
+class HeadlessStack(HeadlessArray):
+    _real = MStack
+
+    def pop(self):
+        return super().pop(-1)
+
+
+class HeadlessEdge(HeadlessElement):
+    _real = MGraph.Edge
+
+    def __init__(self, value: Any, weight: float = None, *args, **kwargs):
+        super().__init__(value)
+        self.line = _headless_mobject(Line)()
+        self.weight = weight
+
+
+class HeadlessGraph(HeadlessMobject):
+    _real = MGraph
+
+    def __init__(
+        self,
+        graph: list[list[str]] | dict[str, dict[str, str]] = None,
+        *args,
+        **kwargs
+    ):
+        self.nodes = {}
+        # The same edge table as MGraph, holding headless edges
+        self.edges = EdgeTable()
+        if graph is None:
+            graph = {}
+        adjacency = list(graph.items() if isinstance(graph, dict) else enumerate(graph))
+        for node, _ in adjacency:
+            self.add_node(str(node))
+        for src, destinations in adjacency:
+            for dest in destinations:
+                if isinstance(dest, tuple) and len(dest) == 2 and isinstance(dest[1], (int, float)):
+                    self.add_edge(str(src), str(dest[0]), dest[1])
+                else:
+                    self.add_edge(str(src), str(dest))
+
+
+    def __getitem__(self, key):
+        return self.edges[key] if isinstance(key, tuple) else self.nodes[key]
+
+
+    def __contains__(self, key) -> bool:
+        return key in self.edges or key in self.nodes
+
+
+    def add_node(self, name: str, position: Point3D = ORIGIN):
+        _record(self, "add_node")
+        self.nodes[name] = HeadlessElement(name)
+        return self
+
+
+    def add_nodes_from(self, names: list[str], positions: list[Point3D] = None):
+        _record(self, "add_nodes_from")
+        for name in names:
+            self.nodes[name] = HeadlessElement(name)
+        return self
+
+
+    def _store_edge(self, src: str, dest: str, weight: float = None):
+        if src not in self.nodes or dest not in self.nodes:
+            raise Exception(f"The edge {(src, dest)} joins a node that is not in the graph!")
+        # As in MGraph, an edge added back over its reverse shares its record
+        self.edges.add(src, dest, HeadlessEdge(f"{src}-{dest}", weight))
+
+
+    def add_edge(self, node1_name: str, node2_name: str, weight: float = None, *args, **kwargs):
+        _record(self, "add_edge")
+        self._store_edge(node1_name, node2_name, weight)
+        return self
+
+
+    def add_curved_edge(self, node1_name: str, node2_name: str, weight: float = None, *args, **kwargs):
+        _record(self, "add_curved_edge")
+        self._store_edge(node1_name, node2_name, weight)
+        return self
+
+
+    def add_edges_from(self, sources: list[str], targets: list[str], weights: list[float] = None, *args, **kwargs):
+        _record(self, "add_edges_from")
+        if weights is None:
+            weights = [None] * len(sources)
+        for src, dest, weight in zip(sources, targets, weights):
+            self._store_edge(src, dest, weight)
+        return self
+
+
+    def show_backward_edge(self, node1_name: str, node2_name: str, forward_weight: float, backward_weight: float, *args, **kwargs):
+        _record(self, "show_backward_edge")
+        # Each direction gets its own edge, as MGraph draws them separately
+        self.edges.set((node1_name, node2_name), HeadlessEdge(f"{node1_name}-{node2_name}", forward_weight))
+        self.edges.set((node2_name, node1_name), HeadlessEdge(f"{node2_name}-{node1_name}", backward_weight))
+        return self
+
+
+    def _remove_edges(self, keys: list[tuple[str, str]]):
+        keys = list(dict.fromkeys(keys))
+        for key in keys:
+            if key not in self.edges:
+                raise Exception(f"The edge {key} is not in the graph!")
+        # As in MGraph, the reverse of an undirected pair is stored again
+        # on its own, with its weight, unless it is removed too
+        pending = set(keys)
+        for key in keys:
+            if key not in self.edges:
+                continue
+            edge = self.edges[key]
+            if self.edges.remove(key) is not None:
+                continue
+            self.edges.remove(key[::-1])
+            if key[::-1] not in pending:
+                self._store_edge(key[1], key[0], edge.weight)
+
+
+    def remove_edge(self, node1_name: str, node2_name: str):
+        _record(self, "remove_edge")
+        self._remove_edges([(node1_name, node2_name)])
+        return self
+
+
+    def _remove_nodes(self, names: list[str]):
+        names = list(dict.fromkeys(names))
+        for name in names:
+            if name not in self.nodes:
+                raise Exception(f"The node {name} is not in the graph!")
+        gone = set(names)
+        self._remove_edges([key for key in self.edges if key[0] in gone or key[1] in gone])
+        for name in names:
+            del self.nodes[name]
+
+
+    def remove_node(self, name: str):
+        _record(self, "remove_node")
+        self._remove_nodes([name])
+        return self
+
+
+    def apply(self, graph: list[list[str]] | dict[str, dict[str, str]], nodes_position: dict = None):
+        _record(self, "apply")
+        adjacency = list(graph.items() if isinstance(graph, dict) else enumerate(graph))
+        names = [str(node) for node, _ in adjacency]
+        new_edges = {}
+        for src, destinations in adjacency:
+            for dest in destinations:
+                weight = None
+                if isinstance(dest, tuple) and len(dest) == 2 and isinstance(dest[1], (int, float)):
+                    dest, weight = dest
+                new_edges[(str(src), str(dest))] = weight
+
+        # The same differences as MGraph.apply, without the geometry
+        kept = set(names)
+        self._remove_edges([key for key in self.edges if key not in new_edges])
+        self._remove_nodes([name for name in self.nodes if name not in kept])
+        for name in names:
+            if name not in self.nodes:
+                self.nodes[name] = HeadlessElement(name)
+        for key, weight in new_edges.items():
+            if key in self.edges:
+                self.edges[key].weight = weight
+            else:
+                self._store_edge(key[0], key[1], weight)
+        return self
+
+
+    def node_layout(self, layout: str = 'kamada_kawai_layout', **layout_args):
+        _record(self, "node_layout")
+        if layout not in ('force_directed', 'layered', 'bfs') and not hasattr(nx, layout):
+            raise Exception(f"Layout {layout} not available!")
+        return self
+
+
+    def adjacency(self) -> dict[str, list[str]]:
+        adjacency = {name: [] for name in self.nodes}
+        for src, dest in self.edges:
+            adjacency[src].append(dest)
+        return adjacency
+
+
+    def get_weight(self, node1_name: str, node2_name: str, default: float = 1):
+        weight = self.edges[(node1_name, node2_name)].weight
+        return default if weight is None else weight
+
+
+    def _set_highlight(self, operation: str, items: list, highlighted: bool):
+        _record(self, operation)
+        for item in items:
+            item.highlighted = highlighted
+        return self
+
+
+    def highlight_nodes(self, names: list[str], stroke_color: ManimColor = None, stroke_width: float = None):
+        return self._set_highlight("highlight_nodes", [self.nodes[name] for name in names], True)
+
+
+    def unhighlight_nodes(self, names: list[str]):
+        return self._set_highlight("unhighlight_nodes", [self.nodes[name] for name in names], False)
+
+
+    def highlight_edges(self, keys: list[tuple[str, str]], stroke_color: ManimColor = None, stroke_width: float = None):
+        return self._set_highlight("highlight_edges", [self.edges[key] for key in keys], True)
+
+
+    def unhighlight_edges(self, keys: list[tuple[str, str]]):
+        return self._set_highlight("unhighlight_edges", [self.edges[key] for key in keys], False)
+
+
+    def highlight_path(self, node_list: list[str], stroke_color: ManimColor = None, stroke_width: float = None):
+        path = [self.nodes[name] for name in node_list] + [self.edges[key] for key in zip(node_list[:-1], node_list[1:])]
+        return self._set_highlight("highlight_path", path, True)
+
+
+    def unhighlight_path(self, node_list: list[str]):
+        path = [self.nodes[name] for name in node_list] + [self.edges[key] for key in zip(node_list[:-1], node_list[1:])]
+        return self._set_highlight("unhighlight_path", path, False)
+
+
+_HEADLESS_STRUCTURES = {
+    MArray: HeadlessArray,
+    MStack: HeadlessStack,
+    MGraph: HeadlessGraph,
+    MVariable: HeadlessVariable,
+    MElement: HeadlessElement,
+}
+
+
+def _headless_new(cls, *args, **kwargs):
+    # Whatever name the class is reached through (an alias, a module
+    # attribute, a helper module), the stand-in is what gets built
+    for base in cls.__mro__:
+        if base in _HEADLESS_STRUCTURES:
+            if base is not cls:
+                raise Exception(f"{cls.__name__} has no headless stand-in, it cannot be built in a dry run!")
+            return _HEADLESS_STRUCTURES[base](*args, **kwargs)
+    if cls.__module__.startswith("manim_ds."):
+        raise Exception(f"{cls.__name__} has no headless stand-in, it cannot be built in a dry run!")
+    if issubclass(cls, Animation):
+        return _headless_animation(cls)(*args, **kwargs)
+    return _headless_mobject(cls)(*args, **kwargs)
+
+
+@contextmanager
+def _headless_classes():
+    # The stand-in is not an instance of cls, so cls.__init__ never runs
+    # and no real mobject or animation is built inside the block
+    patched = {cls: vars(cls).get("__new__") for cls in (Mobject, Animation)}
+    for cls in patched:
+        cls.__new__ = staticmethod(_headless_new)
+    try:
+        yield
+    finally:
+        for cls, new in patched.items():
+            if new is None:
+                del cls.__new__
+            else:
+                cls.__new__ = new
+
+
+class HeadlessScene:
+    def __init__(self, timeline: Timeline):
+        self.timeline = timeline
+        self.camera = types.SimpleNamespace(frame=HeadlessMobject())
+
+
+    def play(self, *anims, **kwargs):
+        self.timeline.play(*anims, **kwargs)
+
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, **kwargs):
+        self.timeline.wait(duration)
+
+
+    def __getattr__(self, name: str):
+        # add, remove, bring_to_front, ... have nothing to do without geometry
+        if name.startswith("__") or not hasattr(Scene, name):
+            raise AttributeError(f"Scene has no attribute {name}")
+        return lambda *args, **kwargs: None
+
+
+def dry_run(scene: type) -> Timeline:
+    global _TIMELINE
+    # Every function defined on the Scene subclass (construct and its
+    # helpers) runs on a headless scene, manim's own are skipped
+    methods = {}
+    for cls in reversed(scene.__mro__):
+        if cls is object or cls.__module__.startswith("manim."):
+            continue
+        for name, value in vars(cls).items():
+            if isinstance(value, types.FunctionType) and not name.startswith("__"):
+                methods[name] = value
+
+    timeline = Timeline()
+    headless_scene = type(scene.__name__, (HeadlessScene,), methods)(timeline)
+    previous, _TIMELINE = _TIMELINE, timeline
+    try:
+        with _headless_classes():
+            headless_scene.construct()
+    finally:
+        _TIMELINE = previous
+    return timeline
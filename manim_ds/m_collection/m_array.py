@@ -1,4 +1,4 @@
-from typing import override, Any
+from typing import override, Any, Callable
 
 from manim import *
 from manim.typing import Point3D, Vector3D
@@ -16,6 +16,9 @@ class MArray(MCollection):
         value_args: dict = DEFAULT_VALUE_ARGS
     ):
         self.__index_enabled: bool = False
+        # Typed copy of the values, the first _size slots of _data are used
+        self._data = np.empty(0)
+        self._size = 0
         super().__init__(arr, direction, square_args, value_args)
     
 
@@ -23,16 +26,84 @@ class MArray(MCollection):
         self.index_args = index_args.copy()
     
 
+    def _make_element(self, value: str):
+        return MIndexedElement(value, self.square_args, self.value_args)
+
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[:self._size]
+
+
+    def _typed(self, values: list) -> np.ndarray:
+        typed = np.asarray(values)
+        # Strings would be truncated to the longest one seen so far
+        return typed if typed.dtype.kind in "biuf" else np.asarray(values, dtype=object)
+
+
+    def _store_reserve(self, new_values: np.ndarray, count: int):
+        dtype = new_values.dtype if not self._size else np.result_type(self._data.dtype, new_values.dtype)
+        needed = self._size + count
+        if dtype != self._data.dtype or needed > len(self._data):
+            # The buffer grows geometrically, so appends are amortized O(1)
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=dtype)
+            grown[:self._size] = self.values
+            self._data = grown
+
+
+    def _store_extend(self, values: list):
+        new_values = self._typed(values)
+        self._store_reserve(new_values, len(new_values))
+        self._data[self._size:self._size + len(new_values)] = new_values
+        self._size += len(new_values)
+
+
+    def _store_insert(self, index: int, value: Any):
+        new_values = self._typed([value])
+        self._store_reserve(new_values, 1)
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]
+        self._data[index] = new_values[0]
+        self._size += 1
+
+
+    def _store_delete(self, index: int):
+        index = index % self._size
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._size -= 1
+
+
+    def _store_values(self, indices: list[int], values: list):
+        new_values = self._typed(values)
+        self._store_reserve(new_values, 0)
+        self.values[indices] = new_values
+
+
+    def extend(self, values: list):
+        values = list(values)
+        self._store_extend(values)
+        start = len(self.elements)
+        super().extend(values)
+        if self.__index_enabled:
+            prerender_texts(range(start, len(self.elements)), self.index_args)
+            for i in range(start, len(self.elements)):
+                index = get_text(str(i), self.index_args)
+                index.font_size = index.font_size * self.elements[i].square.width
+                self.elements[i].add_index(index, self.__index_dir, self.__index_buff)
+        return self
+
+
     def append(
         self,
         value: Any
     ):
+        self._sync_frozen()
         new_elem = MIndexedElement(
             str(value),
             self.square_args,
             self.value_args
         )
                 
+        self._store_extend([value])
         self.elements.append(new_elem)
 
         if len(self.elements) > 1:
@@ -63,10 +134,12 @@ class MArray(MCollection):
     ):
         if not len(self.elements):
             return
-        popped_element = self.elements[index].copy()
+        # The popped element leaves the array, its index label can be reused as is
+        popped_element = self.elements[index]
         super().pop(index) 
 
         if self.__index_enabled:
+            popped_element -= popped_element.index
             self.__set_index_from(index, len(self.elements) - 1, popped_element.index)
     
 
@@ -95,11 +168,88 @@ class MArray(MCollection):
         )
     
 
+    def _insert_movers(self, tail: list) -> list:
+        if not self.__index_enabled:
+            return tail
+        # Index labels stay in their slots, only the cells slide
+        return [mob for element in tail for mob in element.submobjects if mob is not element.index]
+
+
+    def _logic_insert(self, index: int, value: Any):
+        element, movers, offset = super()._logic_insert(index, value)
+        if movers:
+            # An insertion at the end went through extend, which stores the value
+            self._store_insert(self.elements.index(element), value)
+        if self.__index_enabled and movers:
+            # Every label shifts one cell up and a single new one is
+            # rendered for the last slot, the others are reused as is
+            position = self.elements.index(element)
+            tail = self.elements[position + 1:]
+            labels = [curr.index for curr in tail]
+            labels.append(set_text(labels[-1], str(len(self.elements) - 1)).shift(offset))
+            for curr in tail:
+                curr -= curr.index
+            for curr, label in zip([element] + tail, labels):
+                curr.index = label
+                curr += curr.index
+        return element, movers, offset
+
+
+    def _logic_pop(self, index):
+        self._store_delete(index)
+        return super()._logic_pop(index)
+
+
+    def set_value(self, index: int, value: Any):
+        self._update_values([index], [value])
+        return self
+
+
+    @override_animate(set_value)
+    def _set_value_animation(self, index: int, value: Any, anim_args=None):
+        return self._set_values_animation([index], [value], anim_args=anim_args)
+
+
+    def _bounds(self, i: int, j: int) -> np.ndarray:
+        if not self._size:
+            raise Exception("The array is empty!")
+        return self.values[i:j]
+
+
+    def argmin(self, i: int = 0, j: int = None) -> int:
+        # Index in the whole array of the minimum of values[i:j]
+        return int(np.argmin(self._bounds(i, j))) + range(self._size)[i]
+
+
+    def argmax(self, i: int = 0, j: int = None) -> int:
+        return int(np.argmax(self._bounds(i, j))) + range(self._size)[i]
+
+
+    def where(self, predicate: Callable[[np.ndarray], np.ndarray]) -> list[int]:
+        # The predicate gets the whole array, e.g. lambda values: values > 3
+        return np.flatnonzero(predicate(self.values)).tolist()
+
+
+    def is_sorted(self, reverse: bool = False) -> bool:
+        values = self.values
+        if reverse:
+            return bool(np.all(values[:-1] >= values[1:]))
+        return bool(np.all(values[:-1] <= values[1:]))
+
+
+    def search(self, value: Any) -> int | None:
+        # Binary search, the array has to be sorted in ascending order
+        index = int(np.searchsorted(self.values, value))
+        if index < self._size and self.values[index] == value:
+            return index
+        return None
+
+
     def __set_index_from(self, start, end, popped_index):
         old_index = popped_index
         for i in range(start, end + 1):
             curr = self.elements[i]
-            new_index = old_index.copy().move_to(curr.index)
+            new_index = old_index.move_to(curr.index)
             old_index = curr.index
             curr -= curr.index
             curr.index = new_index
@@ -131,10 +281,10 @@ class MArray(MCollection):
         elem_i = self.elements[i]
         elem_j = self.elements[j]
         elem_i_group = VGroup(elem_i.square, elem_i.value)
-        temp = elem_i_group.copy()
+        point = elem_i_group.get_critical_point(DOWN)
         elem_j_group = VGroup(elem_j.square, elem_j.value)
         elem_i_group.move_to(elem_j_group, DOWN)
-        elem_j_group.move_to(temp, DOWN)
+        elem_j_group.move_to(point, DOWN)
 
     
     def _logic_swap(self, i, j):        
@@ -144,6 +294,7 @@ class MArray(MCollection):
         self -= self.elements[j]
         
         self.elements[i], self.elements[j] = self.elements[j], self.elements[i]
+        self.values[[i, j]] = self.values[[j, i]]
         
         if self.__index_enabled:
             # Index swap
@@ -162,6 +313,74 @@ class MArray(MCollection):
         self += self.elements[j]
     
 
+    def _detail_parts(self) -> dict:
+        parts = super()._detail_parts()
+        if self.__index_enabled:
+            parts["index"] = [(element, "index", element.square) for element in self.elements]
+        return parts
+
+
+    def snapshot(self) -> dict:
+        snapshot = super().snapshot()
+        snapshot["data"] = self.values.copy()
+        if self.__index_enabled:
+            snapshot["indexes"] = [element.index for element in self.elements]
+            snapshot["index_centers"] = np.array([element.index.get_center() for element in self.elements]).reshape(-1, 3)
+        return snapshot
+
+
+    def _restore_elements(self, snapshot: dict):
+        changes = super()._restore_elements(snapshot)
+        self._data = snapshot["data"].copy()
+        self._size = len(self._data)
+        if "indexes" in snapshot:
+            for element, index, center in zip(self.elements, snapshot["indexes"], snapshot["index_centers"]):
+                if element.index is not index:
+                    element -= element.index
+                    element.index = index
+                    element += element.index
+                element.index.move_to(center)
+        return changes
+
+
+    def _save_header(self) -> dict:
+        header = super()._save_header()
+        header["index"] = {
+            "direction": np.asarray(self.__index_dir).tolist(),
+            "buff": self.__index_setting[0] * self._get_square_else_spawnpoint(0).width / self.__index_setting[1],
+            "index_args": encode_args(self.index_args),
+        } if self.__index_enabled else None
+        return header
+
+
+    def _save_arrays(self) -> dict:
+        arrays = super()._save_arrays()
+        # Object arrays cannot be stored without pickle, they are rebuilt from the texts
+        if self.values.dtype != object:
+            arrays["data"] = self.values.copy()
+        return arrays
+
+
+    def _restore_saved(self, header: dict, arrays: dict):
+        super()._restore_saved(header, arrays)
+        if "data" in arrays:
+            self._data = arrays["data"].copy()
+            self._size = len(self._data)
+
+
+    @classmethod
+    def _from_saved(cls, values: list, header: dict):
+        mArray = super()._from_saved(values, header)
+        if header["index"] is not None:
+            index = header["index"]
+            mArray.add_indexes(
+                np.array(index["direction"]),
+                index["buff"] * header["square_args"].get("width", 1) / header["width"],
+                decode_args(index["index_args"])
+            )
+        return mArray
+
+
     def add_indexes(
         self,
         direction: Vector3D = UP,
@@ -173,12 +392,16 @@ class MArray(MCollection):
         if np.array_equal(np.abs(self._dir), np.abs(direction)):
             raise Exception("The direction given is parallel to array growth direction!")
         
+        prerender_texts(range(len(self.elements)), index_args)
         for i in range(len(self.elements)):
-            self.elements[i].add_index(Text(str(i), **index_args), direction, buff)
+            self.elements[i].add_index(get_text(str(i), index_args), direction, buff)
         
         self.__index_enabled = True
         self.__index_dir = direction
         self.__index_buff = buff
+        # The updater below turns the buff into an offset vector, the
+        # configured one is kept with the width it was given for
+        self.__index_setting = (buff, self._get_square_else_spawnpoint(0).width)
         self.set_index_args(index_args)
         def update_attr(obj):
             if obj.elements:
@@ -5,6 +5,7 @@ from manim.typing import Point3D, Vector3D
 
 from manim_ds.constants import *
 from manim_ds.utils.utils import *
+from manim_ds.utils.serialization import *
 
 class MElement(VGroup, Highlightable):
     def __init__(
@@ -15,7 +16,7 @@ class MElement(VGroup, Highlightable):
     ):
         super().__init__()
         self.square = Rectangle(**square_args)
-        self.value = Text(value, **value_args)
+        self.value = get_text(value, value_args)
         self.value.font_size = self.value.font_size * self.square.width
         self.value.move_to(self.square)
         self._add_highlight(self.square)
@@ -33,6 +34,9 @@ class MElement(VGroup, Highlightable):
 
     @override_animate(set_value)
     def _set_value_animation(self, new_value, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
         self.set_value(new_value)
         return Indicate(self.value, **anim_args)
 
@@ -49,7 +53,7 @@ class MIndexedElement(MElement):
 
     def set_index(self, new_index):
         self -= self.index
-        self.index = utils.set_text(self.index, str(new_index))
+        self.index = set_text(self.index, str(new_index))
         self += self.index
     
 
@@ -63,7 +67,7 @@ class MIndexedElement(MElement):
         self += self.index
 
 
-class MCollection(VGroup, Labelable):
+class MCollection(VGroup, Labelable, LevelOfDetail, Footprint):
     def __init__(
         self,
         arr: list,
@@ -73,6 +77,8 @@ class MCollection(VGroup, Labelable):
     ):
         super().__init__()
         self.elements = []
+        # Frozen cells are drawn through a few merged mobjects, see freeze()
+        self._frozen = None
         
         self.set_square_args(square_args)
         self.set_value_args(value_args)
@@ -89,16 +95,18 @@ class MCollection(VGroup, Labelable):
         }
 
         def update_args(obj):
-            square_width = self._get_square_else_spawnpoint(0).width
-            if "width" and "height" in obj.square_args:
-                obj.square_args["width"] = obj.square_args["height"] = square_width
+            # Frozen cells are detached and may be stale, the spawn point is not
+            square = self.spawn_point if self._frozen is not None else self._get_square_else_spawnpoint(0)
+            square_width = square.width
+            # The dict is replaced rather than mutated, copies may share it
+            if "width" and "height" in obj.square_args and obj.square_args["width"] != square_width:
+                obj.square_args = {**obj.square_args, "width": square_width, "height": square_width}
         self.add_updater(update_args)
 
         if not hasattr(self, "margin"):
             self.margin = 0
 
-        for v in arr:
-            self.append(v)
+        self.extend(arr)
         self.move_to(ORIGIN)
 
 
@@ -114,6 +122,7 @@ class MCollection(VGroup, Labelable):
         self,
         value: int | float | str
     ):
+        self._sync_frozen()
         new_elem = MElement(
             str(value),
             self.square_args,
@@ -131,6 +140,50 @@ class MCollection(VGroup, Labelable):
         return self
     
 
+    def _make_element(self, value: str):
+        return MElement(value, self.square_args, self.value_args)
+
+
+    def _extent(self, square: VMobject) -> float:
+        # Size of a cell along the growth direction
+        return abs(self._dir[0]) * square.width + abs(self._dir[1]) * square.height
+
+
+    def _place_elements(self, new_elements: list):
+        # Cells are one pitch apart along the growth direction, so all
+        # positions come from a single offset computation
+        self._sync_frozen()
+        size = self._extent(new_elements[0].square)
+        if self.elements:
+            reference = self.elements[-1].square
+            first = reference.get_center() + self._dir * ((self._extent(reference) + size) / 2 + self.margin)
+        else:
+            first = self.spawn_point.get_center()
+        centers = first + np.outer(np.arange(len(new_elements)), self._dir * (size + self.margin))
+        for element, center in zip(new_elements, centers):
+            element.shift(center - element.square.get_center())
+
+
+    def extend(self, values: list):
+        if not len(values):
+            return self
+        # Elements sharing a value are copied from a single prototype,
+        # the distinct values are rendered up front in parallel
+        prerender_texts(values, self.value_args)
+        prototypes = {}
+        new_elements = []
+        for value in values:
+            key = str(value)
+            if key not in prototypes:
+                prototypes[key] = self._make_element(key)
+            new_elements.append(prototypes[key].copy())
+
+        self._place_elements(new_elements)
+        self.elements.extend(new_elements)
+        self.add(*new_elements)
+        return self
+
+
     @override_animate(append)
     def _append_animation(
         self,
@@ -142,6 +195,8 @@ class MCollection(VGroup, Labelable):
 
 
     def _logic_pop(self, index):
+        # The popped cell and the ones shifting after it must be drawn on their own
+        self.thaw(index)
         popped_element = self.elements[index]
         self -= popped_element
         self.elements.pop(index)
@@ -182,12 +237,158 @@ class MCollection(VGroup, Labelable):
         )
 
 
+    def _resolve_indices(self, mask_or_indices) -> list[int]:
+        selector = np.asarray(mask_or_indices)
+        if selector.dtype == bool:
+            if len(selector) != len(self.elements):
+                raise Exception("The mask length does not match the number of elements!")
+            return np.flatnonzero(selector).tolist()
+        return selector.reshape(-1).tolist()
+
+
+    def _store_values(self, indices: list[int], values: list):
+        # Subclasses keeping the values outside the mobjects update them here
+        pass
+
+
+    def _update_values(self, mask_or_indices, values):
+        indices = self._resolve_indices(mask_or_indices)
+        values = np.asarray(values, dtype=object)
+        if values.ndim == 0:
+            values = [values.item()] * len(indices)
+        elif len(values) != len(indices):
+            raise Exception("The number of values does not match the number of elements!")
+        self._store_values(indices, list(values))
+
+        # Unchanged cells are skipped, the new texts come from the cache
+        changed = [
+            (index, value) for index, value in zip(indices, values)
+            if self.elements[index].value.original_text != str(value)
+        ]
+        if not changed:
+            return []
+        self._thaw_elements([self.elements[index] for index, _ in changed])
+        prerender_texts([value for _, value in changed], text_args_of(self.elements[changed[0][0]].value))
+        updates = []
+        for index, value in changed:
+            element = self.elements[index]
+            old_value = element.value
+            element.set_value(value)
+            updates.append((index, element, old_value))
+        return updates
+
+
+    def set_values(self, mask_or_indices, values, sources=None):
+        # sources only matter to the animation
+        self._update_values(mask_or_indices, values)
+        return self
+
+
+    @override_animate(set_values)
+    def _set_values_animation(self, mask_or_indices, values, sources=None, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        indices = self._resolve_indices(mask_or_indices)
+        updates = self._update_values(indices, values)
+        if sources is None:
+            return batch_animation([Indicate(element.value) for _, element, _ in updates], self, **anim_args)
+
+        # Each new text starts on its source (a mobject or a point) and
+        # slides into its cell while the old one fades out, nothing is copied
+        source_of = dict(zip(indices, sources))
+        movers, targets, old_values = [], [], []
+        for index, element, old_value in updates:
+            targets.append(element.value.get_center())
+            movers.append(element.value.move_to(source_of[index]))
+            old_values.append(old_value)
+        anims = [BatchMove(movers, targets, group=self)] if movers else []
+        anims += [FadeOut(old_value) for old_value in old_values]
+        return batch_animation(anims, VGroup(self, *old_values), **anim_args)
+
+
+    def _logic_assign(self, values: list):
+        values = list(values)
+        common = min(len(values), len(self.elements))
+        updates = self._update_values(range(common), values[:common])
+        removed = [self._logic_pop(-1) for _ in range(len(self.elements) - common)]
+        start = len(self.elements)
+        self.extend(values[common:])
+        return updates, removed, self.elements[start:]
+
+
+    def assign(self, values: list):
+        self._logic_assign(values)
+        return self
+
+
+    @override_animate(assign)
+    def _assign_animation(self, values: list, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        updates, removed, added = self._logic_assign(values)
+        anims = [Indicate(element.value) for _, element, _ in updates]
+        anims += [FadeOut(element) for element in removed]
+        anims += [Write(element) for element in added]
+        return batch_animation(anims, VGroup(self, *removed), **anim_args)
+
+
+    def _pitch(self) -> float:
+        reference = self.elements[0].square if self.elements else self.spawn_point
+        return self._extent(reference) + self.margin
+
+
+    def _insert_movers(self, tail: list) -> list:
+        # The parts that slide one pitch to make room for a new cell
+        return tail
+
+
+    def _logic_insert(self, index: int, value: Any):
+        if index < 0:
+            index = max(len(self.elements) + index, 0)
+        if index >= len(self.elements):
+            self.extend([value])
+            return self.elements[-1], [], ORIGIN
+
+        # The tail is only moved by the caller, all in one translation
+        self.thaw(index)
+        element = self._make_element(str(value))
+        element.shift(self.elements[index].square.get_center() - element.square.get_center())
+        movers = self._insert_movers(self.elements[index:])
+        self.elements.insert(index, element)
+        self += element
+        return element, movers, self._dir * self._pitch()
+
+
+    def insert(self, index: int, value: Any):
+        _, movers, offset = self._logic_insert(index, value)
+        for mob in movers:
+            mob.shift(offset)
+        return self
+
+
+    @override_animate(insert)
+    def _insert_animation(self, index: int, value: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        element, movers, offset = self._logic_insert(index, value)
+        anims = [Write(element)]
+        if movers:
+            targets = np.array([mob.get_center() for mob in movers]) + offset
+            anims.insert(0, BatchMove(movers, targets, group=self))
+        # The cell is written once the tail has cleared its slot; unlike a
+        # Succession, every animation begins at once, so it is hidden meanwhile
+        return AnimationGroup(*anims, group=self, **{"lag_ratio": 1, **anim_args})
+
+
     def _visual_swap(self, i, j):
         elem_i = self.elements[i]
         elem_j = self.elements[j]
-        temp = elem_i.copy()
+        point = elem_i.get_critical_point(DOWN)
         elem_i.move_to(elem_j, DOWN)
-        elem_j.move_to(temp, DOWN)
+        elem_j.move_to(point, DOWN)
     
 
     def _logic_swap(self, i, j):        
@@ -204,25 +405,299 @@ class MCollection(VGroup, Labelable):
 
 
     def swap(self, i, j):
+        self._thaw_elements([self.elements[i], self.elements[j]])
         self._visual_swap(i, j)
         self._logic_swap(i, j)
     
 
     @override_animate(swap)
     def _swap_animation(self, i, j, path_arc=PI/2, anim_args=None):
+        self._thaw_elements([self.elements[i], self.elements[j]])
         anim = ApplyMethod(self._visual_swap, i, j, path_arc=path_arc, **anim_args)
         self._logic_swap(i, j)
         return anim
     
 
+    def highlight_range(
+        self,
+        i: int,
+        j: int,
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8
+    ):
+        self.thaw(i, j)
+        for element in self.elements[i:j]:
+            element.highlight(stroke_color, stroke_width)
+        return self
+
+
+    @override_animate(highlight_range)
+    def _highlight_range_animation(
+        self,
+        i: int,
+        j: int,
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        self.highlight_range(i, j, stroke_color, stroke_width)
+        return batch_animation([Create(element.highlighting) for element in self.elements[i:j]], self, **anim_args)
+
+
+    def unhighlight_range(self, i: int, j: int):
+        self.thaw(i, j)
+        for element in self.elements[i:j]:
+            element.unhighlight()
+        return self
+
+
+    @override_animate(unhighlight_range)
+    def _unhighlight_range_animation(self, i: int, j: int, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        self.unhighlight_range(i, j)
+        return batch_animation([FadeOut(element.highlighting) for element in self.elements[i:j]], self, **anim_args)
+
+
+    def _sync_frozen(self):
+        # Frozen cells are detached, so a shift or scale applied to the
+        # collection meanwhile is replayed on them from the spawn point
+        if self._frozen is None:
+            return
+        center, width = self._frozen["anchor"]
+        factor = self.spawn_point.width / width
+        offset = self.spawn_point.get_center() - center
+        if factor != 1 or np.any(offset):
+            for element in self._frozen["elements"]:
+                element.scale(factor, about_point=center).shift(offset)
+        self._frozen["anchor"] = (self.spawn_point.get_center(), self.spawn_point.width)
+
+
+    def _merge_frozen(self):
+        group = self._frozen["group"]
+        self.submobjects = [mob for mob in self.submobjects if mob is not group]
+        frozen = [element for element in self.elements if element in self._frozen["elements"]]
+        if not frozen:
+            self._frozen = None
+            return
+        self._frozen["group"] = MergedGroup(frozen)
+        self.submobjects.append(self._frozen["group"])
+
+
+    def freeze(self):
+        self.thaw()
+        if not self.elements:
+            return self
+        self._frozen = {
+            "elements": set(self.elements),
+            "anchor": (self.spawn_point.get_center(), self.spawn_point.width),
+            "group": None,
+        }
+        self.submobjects = [mob for mob in self.submobjects if mob not in self._frozen["elements"]]
+        self._merge_frozen()
+        return self
+
+
+    def _thaw_elements(self, elements: list):
+        self._show_details(mobjects=elements)
+        if self._frozen is None:
+            return
+        elements = [element for element in elements if element in self._frozen["elements"]]
+        if not elements:
+            return
+        self._sync_frozen()
+        self._frozen["elements"].difference_update(elements)
+        self.submobjects.extend(elements)
+        # Only the chunks holding these cells are merged again, the cells
+        # stay on their own until the next freeze()
+        if self._frozen["elements"]:
+            self._frozen["group"].cut(elements)
+        else:
+            self._merge_frozen()
+
+
+    def thaw(self, i: int = None, j: int = None):
+        # Cells i:j are drawn on their own again, the rest stays merged
+        self._thaw_elements(self.elements[i:j])
+        return self
+
+
+    def _detail_reference(self):
+        return self.elements[0].square if self.elements else None
+
+
+    def _detail_parts(self) -> dict:
+        parts = {"value": [(element, "value", element.square) for element in self.elements]}
+        if getattr(self, "label", None) is not None:
+            parts["label"] = [(self, "label", self.spawn_point)]
+        return parts
+
+
+    def _cull_parts(self) -> list[Mobject]:
+        # Frozen cells stay in their merged mobject and are always drawn
+        if self._frozen is None:
+            return list(self.elements)
+        return [element for element in self.elements if element not in self._frozen["elements"]]
+
+
+    def _footprint_parts(self) -> dict:
+        return {
+            "highlights": [element._highlighting for element in self.elements],
+            "indices": [getattr(element, "index", None) for element in self.elements],
+            "values": [element.value for element in self.elements],
+            "squares": [element.square for element in self.elements],
+            "label": [getattr(self, "label", None)],
+            "merged": [self._frozen["group"]] if self._frozen is not None else [],
+        }
+
+
+    def snapshot(self) -> dict:
+        # Only references and a few small arrays are kept, no mobject is copied
+        self._sync_frozen()
+        return {
+            "elements": list(self.elements),
+            "values": [element.value for element in self.elements],
+            "centers": np.array([element.square.get_center() for element in self.elements]).reshape(-1, 3),
+            "highlights": [element.highlight_state() for element in self.elements],
+        }
+
+
+    def _restore_elements(self, snapshot: dict):
+        self.thaw()
+        kept = set(snapshot["elements"])
+        present = set(self.elements)
+        removed = [element for element in self.elements if element not in kept]
+        added = [element for element in snapshot["elements"] if element not in present]
+        if removed:
+            removed_set = set(removed)
+            self.submobjects = [mob for mob in self.submobjects if mob not in removed_set]
+        self.elements = list(snapshot["elements"])
+        self.submobjects.extend(added)
+
+        for element, value, center, state in zip(
+            self.elements, snapshot["values"], snapshot["centers"], snapshot["highlights"]
+        ):
+            element.shift(center - element.square.get_center())
+            if element.value is not value:
+                element -= element.value
+                element.value = value.move_to(element.square)
+                element += element.value
+            element.restore_highlight(state)
+        return removed, added
+
+
+    def restore(self, snapshot: dict = None):
+        # Without a snapshot this is Mobject.restore, used by save_state
+        if snapshot is None:
+            return super().restore()
+        self._restore_elements(snapshot)
+        return self
+
+
+    @override_animate(restore)
+    def _restore_animation(self, snapshot: dict = None, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+        if snapshot is None:
+            return Restore(self, **anim_args)
+
+        removed, added = [], []
+        def update():
+            changes = self._restore_elements(snapshot)
+            removed.extend(changes[0])
+            added.extend(changes[1])
+        kept = set(snapshot["elements"])
+        moved = [element for element in self.elements if element in kept]
+        # Overlays the snapshot does not have are faded out, not dropped
+        overlays = [
+            element.highlighting for element, state in zip(snapshot["elements"], snapshot["highlights"])
+            if state is None and element in moved and element.is_highlighted()
+        ]
+        anims = [BatchMorph(moved, update, group=self)]
+        anims += [FadeOut(element) for element in removed]
+        anims += [FadeIn(element) for element in added]
+        anims += [FadeOut(overlay) for overlay in overlays]
+        return AnimationGroup(*anims, group=VGroup(self, *removed, *overlays), **anim_args)
+
+
     def _get_square_else_spawnpoint(self, index):
         return self.elements[index].square if self.elements else self.spawn_point
 
 
+    def _save_header(self) -> dict:
+        anchor = self._get_square_else_spawnpoint(0)
+        return {
+            "direction": self._dir.tolist(),
+            "margin": self.margin,
+            "square_args": encode_args(self.square_args),
+            "value_args": encode_args(self.value_args),
+            "anchor": anchor.get_center().tolist(),
+            "width": anchor.width,
+        }
+
+
+    def _save_arrays(self) -> dict:
+        highlighted = [element for element in self.elements if element.is_highlighted()]
+        return {
+            "values": np.array([element.value.original_text for element in self.elements], dtype=str),
+            "highlighted": np.array([element.is_highlighted() for element in self.elements], dtype=bool),
+            "highlight_colors": encode_colors([element.highlighting.get_stroke_color() for element in highlighted]),
+            "highlight_widths": np.array([element.highlighting.get_stroke_width() for element in highlighted]),
+        }
+
+
+    def save(self, path: str):
+        self._sync_frozen()
+        save_structure(path, type(self).__name__, self._save_header(), **self._save_arrays())
+        return self
+
+
+    @classmethod
+    def _from_saved(cls, values: list, header: dict):
+        return cls(
+            values,
+            np.array(header["direction"]),
+            decode_args(header["square_args"]),
+            decode_args(header["value_args"])
+        )
+
+
+    def _restore_saved(self, header: dict, arrays: dict):
+        anchor = self._get_square_else_spawnpoint(0)
+        self.scale(header["width"] / anchor.width)
+        self.shift(np.array(header["anchor"]) - anchor.get_center())
+
+        highlighted = np.flatnonzero(arrays["highlighted"])
+        for i, color, width in zip(highlighted, arrays["highlight_colors"], arrays["highlight_widths"]):
+            self.elements[i].highlight(decode_color(str(color)), float(width))
+
+
+    @classmethod
+    def load(cls, path: str):
+        header, arrays = load_structure(path, cls.__name__)
+        collection = cls._from_saved([str(value) for value in arrays["values"]], header)
+        collection._restore_saved(header, arrays)
+        return collection
+
+
+    def copy(self):
+        return shared_copy(self)
+
+
     def __getitem__(self, key):
         if(key >= len(self.elements)):
             raise Exception("Index out of bounds!")
-        return self.elements[key]
+        element = self.elements[key]
+        if self._frozen is not None and element in self._frozen["elements"]:
+            # Only the chunk holding this cell is merged again
+            self._thaw_elements([element])
+        # Out of the camera frame it is attached again, in its current place
+        self._uncull([element])
+        return element
     
     @override
     def add_label(
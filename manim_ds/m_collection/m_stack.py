@@ -15,6 +15,7 @@ class MStack(MCollection):
         square_args: dict = DEFAULT_SQUARE_ARGS,
         value_args: dict = DEFAULT_VALUE_ARGS
     ):
+        self.buff: float = buff
         self.margin: float = buff
         super().__init__(arr, UP, square_args, value_args)
 
@@ -45,6 +46,22 @@ class MStack(MCollection):
         self.add_updater(update_stack_attr)
     
     
+    def _save_header(self) -> dict:
+        header = super()._save_header()
+        header["buff"] = self.buff
+        return header
+
+
+    @classmethod
+    def _from_saved(cls, values: list, header: dict):
+        return cls(
+            values,
+            header["buff"],
+            decode_args(header["square_args"]),
+            decode_args(header["value_args"])
+        )
+
+
     def get_spawn_point(self):
         return self.bottom_line.get_center() + (UP * self.right_line.height) + UP * self.spawn_point.width
     
@@ -72,7 +89,8 @@ class MStack(MCollection):
 
     @override_animate(pop)
     def _pop_animation(self, anim_args=None):
-        popped_element = self.elements[-1].copy()
+        # The element is detached by pop, so it can be animated out directly
+        popped_element = self.elements[-1]
         self.pop()
         return Succession(
             ApplyMethod(popped_element.move_to, self.stack_spawnpoint),
@@ -0,0 +1,253 @@
+from typing import Any, Iterator
+import heapq
+
+from manim import *
+
+from manim_ds.m_graph.m_graph import MGraph
+from manim_ds.m_collection.m_collection import MCollection
+
+# Every animator is a generator yielding one animation per step
+# (frontier level, relaxation round, ...), so it can be played with
+#
+#     for step in bfs(mGraph, '0'):
+#         self.play(step)
+#
+# Steps are built lazily: highlights are applied to the graph only
+# when the step is requested, right before it is played. Animators that
+# compute something (distances, an order) fill a Result given to them:
+#
+#     result = Result()
+#     for step in dijkstra(mGraph, '0', result=result):
+#         self.play(step)
+#     result.dist, result.prev
+
+
+class Result:
+    # Filled by an animator once its last step has been requested
+    def __init__(self):
+        self.done = False
+
+
+    def _set(self, **values):
+        self.__dict__.update(values)
+        self.done = True
+
+
+def _highlight_step(
+    mGraph: MGraph,
+    nodes: list[str],
+    edges: list[tuple[str, str]],
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED
+):
+    return AnimationGroup(
+        mGraph._highlight_edges_animation(edges, edge_color),
+        mGraph._highlight_nodes_animation(nodes, node_color),
+        group=mGraph
+    )
+
+
+def _physical_edges(mGraph: MGraph):
+    # Every drawn edge once, as it is drawn: an undirected pair is a single
+    # record, the two directions of show_backward_edge are two
+    for _, src, dest, _ in mGraph.edges.records():
+        yield (src, dest)
+
+
+def bfs(
+    mGraph: MGraph,
+    start: str,
+    mQueue: MCollection = None,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED
+) -> Iterator[Animation]:
+    adjacency = mGraph.adjacency()
+    visited = {start}
+    level, level_edges = [start], []
+    if mQueue is not None:
+        yield mQueue._append_animation(start, anim_args={})
+
+    while level:
+        next_level, next_edges = [], []
+        for node in level:
+            for neighbor in adjacency[node]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_level.append(neighbor)
+                    next_edges.append((node, neighbor))
+
+        step = _highlight_step(mGraph, level, level_edges, node_color, edge_color)
+        if mQueue is not None:
+            # The whole level leaves the queue and the next one enters it in one
+            # batched animation, so a step lasts the same whatever the level size
+            step = Succession(step, mQueue._assign_animation(next_level, anim_args={}), group=VGroup(mGraph, mQueue))
+        yield step
+        level, level_edges = next_level, next_edges
+
+
+def dfs(
+    mGraph: MGraph,
+    start: str,
+    mStack: MCollection = None,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED
+) -> Iterator[Animation]:
+    adjacency = mGraph.adjacency()
+    visited = set()
+    stack = [(start, None)]
+    if mStack is not None:
+        yield mStack._append_animation(start, anim_args={})
+
+    while stack:
+        node, prev = stack.pop()
+        anims = [mStack._pop_animation(anim_args={})] if mStack is not None else []
+        if node in visited:
+            if anims:
+                yield Succession(*anims, group=VGroup(mGraph, mStack))
+            continue
+
+        visited.add(node)
+        anims.append(_highlight_step(mGraph, [node], [(prev, node)] if prev is not None else [], node_color, edge_color))
+        # Neighbors are pushed in reverse, so they are visited in adjacency order
+        for neighbor in reversed(adjacency[node]):
+            if neighbor not in visited:
+                stack.append((neighbor, node))
+                if mStack is not None:
+                    anims.append(mStack._append_animation(neighbor, anim_args={}))
+        yield Succession(*anims, group=VGroup(mGraph, mStack) if mStack is not None else mGraph)
+
+
+def dijkstra(
+    mGraph: MGraph,
+    source: str,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED,
+    relax_color: ManimColor = YELLOW,
+    result: Result = None
+) -> Iterator[Animation]:
+    adjacency = mGraph.adjacency()
+    dist = {source: 0}
+    prev = {}
+    settled = set()
+    heap = [(0, source)]
+
+    # One round settles a node and relaxes all its outgoing edges
+    while heap:
+        d, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled.add(node)
+
+        relaxed = []
+        for neighbor in adjacency[node]:
+            if neighbor in settled:
+                continue
+            nd = d + mGraph.get_weight(node, neighbor)
+            if nd < dist.get(neighbor, float("inf")):
+                dist[neighbor] = nd
+                prev[neighbor] = node
+                relaxed.append((node, neighbor))
+                heapq.heappush(heap, (nd, neighbor))
+
+        step = _highlight_step(mGraph, [node], [(prev[node], node)] if node in prev else [], node_color, edge_color)
+        if relaxed:
+            step = Succession(
+                step,
+                AnimationGroup(*[Indicate(mGraph[edge].line, color=relax_color) for edge in relaxed]),
+                group=mGraph
+            )
+        yield step
+    if result is not None:
+        result._set(dist=dist, prev=prev)
+
+
+def prim(
+    mGraph: MGraph,
+    start: str = None,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED
+) -> Iterator[Animation]:
+    adjacency = mGraph.adjacency()
+    if start is None:
+        start = next(iter(mGraph.nodes))
+    in_tree = {start}
+    heap = [(mGraph.get_weight(start, neighbor), start, neighbor) for neighbor in adjacency[start]]
+    heapq.heapify(heap)
+    yield _highlight_step(mGraph, [start], [], node_color, edge_color)
+
+    while heap:
+        weight, src, dest = heapq.heappop(heap)
+        if dest in in_tree:
+            continue
+        in_tree.add(dest)
+        for neighbor in adjacency[dest]:
+            if neighbor not in in_tree:
+                heapq.heappush(heap, (mGraph.get_weight(dest, neighbor), dest, neighbor))
+        yield _highlight_step(mGraph, [dest], [(src, dest)], node_color, edge_color)
+
+
+def kruskal(
+    mGraph: MGraph,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED
+) -> Iterator[Animation]:
+    parent = {name: name for name in mGraph.nodes}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    edges = sorted(_physical_edges(mGraph), key=lambda edge: mGraph.get_weight(*edge))
+
+    # Any order among edges of equal weight yields a minimum spanning
+    # tree, so each weight class is accepted in a single step
+    i = 0
+    while i < len(edges):
+        weight = mGraph.get_weight(*edges[i])
+        accepted = []
+        while i < len(edges) and mGraph.get_weight(*edges[i]) == weight:
+            src, dest = edges[i]
+            root_src, root_dest = find(src), find(dest)
+            if root_src != root_dest:
+                parent[root_src] = root_dest
+                accepted.append(edges[i])
+            i += 1
+        if accepted:
+            nodes = list(dict.fromkeys(node for edge in accepted for node in edge))
+            yield _highlight_step(mGraph, nodes, accepted, node_color, edge_color)
+
+
+def topological_sort(
+    mGraph: MGraph,
+    node_color: ManimColor = RED,
+    edge_color: ManimColor = RED,
+    result: Result = None
+) -> Iterator[Animation]:
+    adjacency = mGraph.adjacency()
+    in_degree = {name: 0 for name in mGraph.nodes}
+    for src in adjacency:
+        for dest in adjacency[src]:
+            in_degree[dest] += 1
+
+    # Kahn's algorithm, one step per wave of nodes without incoming edges
+    order = []
+    wave = [name for name, degree in in_degree.items() if degree == 0]
+    wave_edges = []
+    while wave:
+        order.extend(wave)
+        next_wave, next_edges = [], []
+        for node in wave:
+            for dest in adjacency[node]:
+                in_degree[dest] -= 1
+                if in_degree[dest] == 0:
+                    next_wave.append(dest)
+                    next_edges.append((node, dest))
+        yield _highlight_step(mGraph, wave, wave_edges, node_color, edge_color)
+        wave, wave_edges = next_wave, next_edges
+
+    if len(order) != len(mGraph.nodes):
+        raise Exception("The graph contains a cycle!")
+    if result is not None:
+        result._set(order=order)
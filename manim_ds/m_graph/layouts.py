@@ -0,0 +1,257 @@
+from collections import deque
+
+import numpy as np
+
+# Layouts work on plain arrays: node positions are an (n, 2) array and
+# edges an (m, 2) array of node indices, so they do not depend on MGraph.
+
+
+def _accumulate(index: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+    # Sums the rows of values into the rows given by index
+    return np.stack([
+        np.bincount(index, weights=values[:, 0], minlength=n),
+        np.bincount(index, weights=values[:, 1], minlength=n)
+    ], axis=1)
+
+
+def grid_pairs(points: np.ndarray, cell: float, cap: int = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # All pairs (i, j), i != j, of points lying in the same or in
+    # neighbouring cells of a square grid, without comparing every pair.
+    # With a cap, a point meets at most cap points of a crowded cell, a
+    # different window of it for every point, and the weight of the pair
+    # is the number of points it stands for
+    n = len(points)
+    cells = np.floor(points / cell).astype(np.int64)
+    cells -= cells.min(axis=0)
+    # One empty column and row of padding on each side, so a neighbour
+    # key never wraps around to the other end of a row
+    width = cells[:, 0].max() + 3
+    keys = (cells[:, 1] + 1) * width + cells[:, 0] + 1
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    sources, targets, weights = [], [], []
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            neighbor = keys + dy * width + dx
+            start = np.searchsorted(sorted_keys, neighbor, 'left')
+            counts = np.searchsorted(sorted_keys, neighbor, 'right') - start
+            taken = counts if cap is None else np.minimum(counts, cap)
+            total = taken.sum()
+            if not total:
+                continue
+            offsets = np.arange(total) - np.repeat(np.cumsum(taken) - taken, taken)
+            if cap is not None:
+                offsets = (offsets + np.repeat(np.arange(n), taken)) % np.repeat(counts, taken)
+            sources.append(np.repeat(np.arange(n), taken))
+            targets.append(order[np.repeat(start, taken) + offsets])
+            weights.append(np.repeat(counts / np.maximum(taken, 1), taken))
+
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    i, j, weight = np.concatenate(sources), np.concatenate(targets), np.concatenate(weights)
+    mask = i != j
+    return i[mask], j[mask], weight[mask]
+
+
+def force_directed_layout(
+    positions: np.ndarray,
+    edges: np.ndarray,
+    pinned: np.ndarray = None,
+    k: float = 1,
+    iterations: int = 50,
+    temperature: float = None,
+    bounds: tuple[float, float] = None,
+    seed: int = 0,
+    cap: int = 16
+) -> np.ndarray:
+    # Fruchterman-Reingold started from the given positions. Repulsion is
+    # only computed between points found in neighbouring cells of a grid
+    # sized for a few points per cell, and with at most cap points of a
+    # crowded cell, so one iteration costs O(V + E) even on clustered input.
+    # Points move freely; with bounds and nothing pinned, a result that
+    # overflows them is scaled down about the previous centre, never clipped.
+    points = np.array(positions, dtype=float)[:, :2]
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    n = len(points)
+    if n == 0:
+        return points
+    movable = np.ones(n, dtype=bool) if pinned is None else ~np.asarray(pinned, dtype=bool)
+    centre = (points.min(axis=0) + points.max(axis=0)) / 2
+
+    # Coincident points (e.g. new nodes all added at the origin) are
+    # spread slightly, otherwise no force can separate them
+    rng = np.random.default_rng(seed)
+    _, first = np.unique(points, axis=0, return_index=True)
+    duplicate = np.ones(n, dtype=bool)
+    duplicate[first] = False
+    duplicate &= movable
+    points[duplicate] += rng.uniform(-0.1 * k, 0.1 * k, (duplicate.sum(), 2))
+
+    # A warm start only needs small moves, the step shrinks linearly to zero
+    if temperature is None:
+        temperature = k
+    for step in range(iterations):
+        # The cutoff is 2k once the points are spread, smaller while they
+        # are dense, so the number of pairs stays linear in n
+        extent = np.maximum(points.max(axis=0) - points.min(axis=0), k)
+        cell = min(2 * k, 2 * np.sqrt(extent[0] * extent[1] / n))
+        i, j, weight = grid_pairs(points, cell, cap)
+        delta = points[i] - points[j]
+        dist2 = np.maximum(np.einsum('ij,ij->i', delta, delta), 1e-9)
+        # Repulsion k^2 / d along delta / d
+        disp = _accumulate(i, delta * (weight * k * k / dist2)[:, None], n)
+
+        if len(edges):
+            delta = points[edges[:, 0]] - points[edges[:, 1]]
+            dist = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+            # Attraction d^2 / k along delta / d
+            force = delta * (dist / k)[:, None]
+            disp -= _accumulate(edges[:, 0], force, n)
+            disp += _accumulate(edges[:, 1], force, n)
+
+        length = np.maximum(np.sqrt(np.einsum('ij,ij->i', disp, disp)), 1e-9)
+        limit = temperature * (1 - step / iterations)
+        step_disp = disp * (np.minimum(length, limit) / length)[:, None]
+        points[movable] += step_disp[movable]
+
+    if bounds is not None and movable.all():
+        bounds = np.asarray(bounds, dtype=float)
+        low, high = points.min(axis=0), points.max(axis=0)
+        if (low < -bounds).any() or (high > bounds).any():
+            half = np.maximum((high - low) / 2, 1e-9)
+            scale = min(1, (bounds / half).min())
+            points = centre + (points - centre) * scale
+            # Then moved only as far as needed to be inside the bounds
+            low, high = points.min(axis=0), points.max(axis=0)
+            points -= np.maximum(high - bounds, 0) - np.maximum(-bounds - low, 0)
+    return points
+
+
+def longest_path_layers(n: int, edges: np.ndarray) -> np.ndarray:
+    # Kahn's algorithm, every node one layer below its deepest predecessor.
+    # On a cycle the first pending node is taken as if its remaining
+    # incoming edges were reversed, so any graph gets layers in O(V + E).
+    successors = [[] for _ in range(n)]
+    in_degree = [0] * n
+    for src, dest in np.asarray(edges, dtype=np.int64).reshape(-1, 2).tolist():
+        if src != dest:
+            successors[src].append(dest)
+            in_degree[dest] += 1
+
+    layer = [0] * n
+    done = [False] * n
+    queue = deque(node for node in range(n) if in_degree[node] == 0)
+    pending, processed = 0, 0
+    while processed < n:
+        if not queue:
+            while done[pending]:
+                pending += 1
+            queue.append(pending)
+        node = queue.popleft()
+        if done[node]:
+            continue
+        done[node] = True
+        processed += 1
+        for succ in successors[node]:
+            if done[succ]:
+                continue
+            layer[succ] = max(layer[succ], layer[node] + 1)
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                queue.append(succ)
+    return np.array(layer, dtype=np.int64)
+
+
+def bfs_layers(n: int, edges: np.ndarray, root: int) -> tuple[np.ndarray, np.ndarray]:
+    # BFS distance from the root and the discovery order, nodes that
+    # cannot be reached go to one extra layer at the bottom
+    successors = [[] for _ in range(n)]
+    for src, dest in np.asarray(edges, dtype=np.int64).reshape(-1, 2).tolist():
+        successors[src].append(dest)
+
+    layer = [-1] * n
+    layer[root] = 0
+    order = [root]
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for succ in successors[node]:
+            if layer[succ] < 0:
+                layer[succ] = layer[node] + 1
+                order.append(succ)
+                queue.append(succ)
+
+    layer = np.array(layer, dtype=np.int64)
+    unreachable = np.flatnonzero(layer < 0)
+    layer[unreachable] = layer.max() + 1
+    order.extend(unreachable.tolist())
+    return layer, np.array(order, dtype=np.int64)
+
+
+def _ranks(layer: np.ndarray, key: np.ndarray) -> np.ndarray:
+    # Position of every node inside its layer once sorted by key
+    order = np.lexsort((key, layer))
+    sizes = np.bincount(layer)
+    starts = np.cumsum(sizes) - sizes
+    rank = np.empty(len(layer), dtype=np.int64)
+    rank[order] = np.arange(len(layer)) - starts[layer[order]]
+    return rank
+
+
+def reduce_crossings(
+    layer: np.ndarray,
+    edges: np.ndarray,
+    initial: np.ndarray,
+    sweeps: int = 4
+) -> np.ndarray:
+    # Barycenter heuristic, alternating downward and upward sweeps. Each
+    # sweep updates all layers at once, so it costs O(E + V log V).
+    n = len(layer)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    src, dest = edges[:, 0], edges[:, 1]
+    upper = np.where(layer[src] < layer[dest], src, dest)
+    lower = np.where(layer[src] < layer[dest], dest, src)
+    across = layer[upper] != layer[lower]
+    upper, lower = upper[across], lower[across]
+
+    sizes = np.bincount(layer)
+    rank = _ranks(layer, np.asarray(initial, dtype=float))
+    for sweep in range(2 * sweeps):
+        # Relative positions, so layers of different widths are comparable
+        position = rank / np.maximum(sizes[layer] - 1, 1)
+        targets, sources = (lower, upper) if sweep % 2 == 0 else (upper, lower)
+        total = np.bincount(targets, weights=position[sources], minlength=n)
+        count = np.bincount(targets, minlength=n)
+        key = np.where(count > 0, total / np.maximum(count, 1), position)
+        rank = _ranks(layer, key)
+    return rank
+
+
+def layer_coordinates(layer: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    # Layers from top to bottom, each one centred horizontally
+    sizes = np.bincount(layer)
+    x = rank - (sizes[layer] - 1) / 2
+    y = layer.max() / 2 - layer
+    return np.stack([x, y], axis=1).astype(float)
+
+
+def layered_layout(n: int, edges: np.ndarray, sweeps: int = 4) -> np.ndarray:
+    # Sugiyama-style: longest-path layering, then crossing reduction.
+    # Long edges are not split into dummy nodes, they only weigh in the
+    # barycenters of their endpoints.
+    if n == 0:
+        return np.zeros((0, 2))
+    layer = longest_path_layers(n, edges)
+    rank = reduce_crossings(layer, edges, np.arange(n), sweeps)
+    return layer_coordinates(layer, rank)
+
+
+def bfs_layout(n: int, edges: np.ndarray, root: int, sweeps: int = 4) -> np.ndarray:
+    if n == 0:
+        return np.zeros((0, 2))
+    layer, order = bfs_layers(n, edges, root)
+    initial = np.empty(n)
+    initial[order] = np.arange(n)
+    rank = reduce_crossings(layer, edges, initial, sweeps)
+    return layer_coordinates(layer, rank)
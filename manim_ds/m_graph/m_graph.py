@@ -8,43 +8,394 @@ from abc import ABC, abstractmethod
 
 from manim_ds.constants import *
 from manim_ds.utils.utils import *
+from manim_ds.utils.serialization import *
 from manim_ds.m_collection.m_collection import *
+from manim_ds.m_graph.layouts import force_directed_layout, layered_layout, bfs_layout
 
-class MGraph(VDict, Labelable):
+def format_weight(weight: Any) -> str:
+    # Integral weights are shown without a trailing ".0"
+    if isinstance(weight, (float, np.floating)) and float(weight).is_integer():
+        return str(int(weight))
+    return str(weight.item() if isinstance(weight, np.generic) else weight)
+
+
+class EdgeTable:
+    # One record per physical edge: an undirected pair is a single record
+    # with both direction flags set, reachable from either orientation.
+    # Records are addressed by integer ids that stay valid for the graph lifetime.
+    FORWARD = 1
+    BACKWARD = 2
+
+    def __init__(self):
+        self._ids = {}
+        self.sources = []
+        self.targets = []
+        self.flags = []
+        self.mobjects = []
+        # Only used when the backward direction is drawn as a separate edge
+        self.reverse_mobjects = {}
+        self._size = 0
+
+
+    def _find(self, key: tuple[str, str]):
+        if key in self._ids:
+            return self._ids[key], True
+        if key[::-1] in self._ids:
+            return self._ids[key[::-1]], False
+        return None, None
+
+
+    def id_of(self, key: tuple[str, str]) -> int | None:
+        edge_id, forward = self._find(key)
+        if edge_id is None:
+            return None
+        if not self.flags[edge_id] & (self.FORWARD if forward else self.BACKWARD):
+            return None
+        return edge_id
+
+
+    def key(self, edge_id: int) -> tuple[str, str]:
+        return (self.sources[edge_id], self.targets[edge_id])
+
+
+    def canonical(self, key: tuple[str, str]) -> tuple[str, str] | None:
+        edge_id, _ = self._find(key)
+        return None if edge_id is None else self.key(edge_id)
+
+
+    def is_undirected(self, key: tuple[str, str]) -> bool:
+        edge_id = self.id_of(key)
+        return edge_id is not None and self.flags[edge_id] == self.FORWARD | self.BACKWARD
+
+
+    def add(self, src: str, dest: str, mobject: VMobject) -> int:
+        edge_id, forward = self._find((src, dest))
+        if edge_id is None:
+            edge_id = len(self.flags)
+            self._ids[(src, dest)] = edge_id
+            self.sources.append(src)
+            self.targets.append(dest)
+            self.flags.append(0)
+            self.mobjects.append(None)
+            forward = True
+
+        flag = self.FORWARD if forward else self.BACKWARD
+        if not self.flags[edge_id] & flag:
+            self._size += 1
+        self.flags[edge_id] |= flag
+        # Both directions share the mobject of the physical edge
+        self.mobjects[edge_id] = mobject
+        self.reverse_mobjects.pop(edge_id, None)
+        return edge_id
+
+
+    def set(self, key: tuple[str, str], mobject: VMobject) -> int:
+        edge_id, forward = self._find(key)
+        if edge_id is None:
+            return self.add(key[0], key[1], mobject)
+
+        flag = self.FORWARD if forward else self.BACKWARD
+        if not self.flags[edge_id] & flag:
+            self._size += 1
+        self.flags[edge_id] |= flag
+        if forward:
+            self.mobjects[edge_id] = mobject
+        else:
+            self.reverse_mobjects[edge_id] = mobject
+        return edge_id
+
+
+    def remove(self, key: tuple[str, str]) -> VMobject | None:
+        # Returns the mobject that is no longer drawn, None when the
+        # other direction still uses the shared mobject
+        edge_id, forward = self._find(key)
+        flag = self.FORWARD if forward else self.BACKWARD
+        if edge_id is None or not self.flags[edge_id] & flag:
+            raise KeyError(key)
+        self.flags[edge_id] &= ~flag
+        self._size -= 1
+        if not self.flags[edge_id]:
+            # The id is not reused, a later edge between the nodes gets a new one
+            mobject = self.mobjects[edge_id]
+            self.mobjects[edge_id] = None
+            del self._ids[self.key(edge_id)]
+            return mobject
+        if edge_id in self.reverse_mobjects:
+            reverse = self.reverse_mobjects.pop(edge_id)
+            if not forward:
+                return reverse
+            # The record is re-keyed to the surviving direction, so records()
+            # and key() keep reporting the edge as it is drawn
+            mobject = self.mobjects[edge_id]
+            src, dest = self.key(edge_id)
+            del self._ids[(src, dest)]
+            self._ids[(dest, src)] = edge_id
+            self.sources[edge_id], self.targets[edge_id] = dest, src
+            self.flags[edge_id] = self.FORWARD
+            self.mobjects[edge_id] = reverse
+            return mobject
+        return None
+
+
+    def copy(self) -> "EdgeTable":
+        # Shallow: the records are copied, the mobjects are shared
+        table = EdgeTable()
+        table._ids = dict(self._ids)
+        table.sources = list(self.sources)
+        table.targets = list(self.targets)
+        table.flags = list(self.flags)
+        table.mobjects = list(self.mobjects)
+        table.reverse_mobjects = dict(self.reverse_mobjects)
+        table._size = self._size
+        return table
+
+
+    def records(self):
+        # Every drawn mobject exactly once, oriented as it is drawn
+        for edge_id, flags in enumerate(self.flags):
+            if not flags:
+                continue
+            src, dest = self.sources[edge_id], self.targets[edge_id]
+            yield edge_id, src, dest, self.mobjects[edge_id]
+            if edge_id in self.reverse_mobjects:
+                yield edge_id, dest, src, self.reverse_mobjects[edge_id]
+
+
+    def __getitem__(self, key: tuple[str, str]) -> VMobject:
+        edge_id, forward = self._find(key)
+        if edge_id is None or not self.flags[edge_id] & (self.FORWARD if forward else self.BACKWARD):
+            raise KeyError(key)
+        if not forward and edge_id in self.reverse_mobjects:
+            return self.reverse_mobjects[edge_id]
+        return self.mobjects[edge_id]
+
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return self.id_of(key) is not None
+
+
+    def __iter__(self):
+        for edge_id, flags in enumerate(self.flags):
+            if flags & self.FORWARD:
+                yield (self.sources[edge_id], self.targets[edge_id])
+            if flags & self.BACKWARD:
+                yield (self.targets[edge_id], self.sources[edge_id])
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def keys(self):
+        return iter(self)
+
+
+    def items(self):
+        for key in self:
+            yield key, self[key]
+
+
+    def values(self):
+        for key in self:
+            yield self[key]
+
+
+class MGraph(VDict, Labelable, LevelOfDetail, Footprint):
     def __init__(
             self,
-            graph: list[list[str]] | dict[str, dict[str, str]],
-            nodes_position: dict,
+            graph: list[list[str]] | dict[str, dict[str, str]] = None,
+            nodes_position: dict = None,
             node_args: dict = DEFAULT_CIRCLE_ARGS,
             value_args: dict = DEFAULT_VALUE_ARGS,
             edge_args: dict = DEFAULT_EDGE_ARGS
         ):
         super().__init__()
         self.nodes = {}
-        self.edges = {}
+        self.edges = EdgeTable()
+        # Batched edges are drawn through a few merged mobjects, see batch_edges()
+        self._edge_batch = None
+        # Invisible reference for culling, see LevelOfDetail._cull_anchor()
+        self._cull_frame = None
 
         self.set_node_args(node_args)
         self.set_value_args(value_args)
         self.set_edge_args(edge_args)
         self.set_weight_args(DEFAULT_WEIGHT_ARGS)
+        self.set_node_highlight()
+        self.set_edge_highlight()
+
+        if graph is None:
+            graph = {}
+        if nodes_position is None:
+            nodes_position = {}
+
+        # The graph can be list of list or dict of list
+        adjacency = graph.items() if isinstance(graph, dict) else enumerate(graph)
+        for node, _ in adjacency:
+            pos = nodes_position[str(node)] if str(node) in nodes_position else ORIGIN
+            self.add_node(str(node), pos)
+
+        for src, destinations in graph.items() if isinstance(graph, dict) else enumerate(graph):
+            for dest in destinations:
+                # If the graph is weighted
+                # Example: {'0': [('1', 2), ('2', 4.5)]}
+                if isinstance(dest, tuple) and len(dest) == 2 and isinstance(dest[1], (int, float)):
+                    dest, weight = dest
+                    self.add_edge(str(src), str(dest), weight)
+                # If the graph is not weighted
+                # Example: {'0': ['1', '2']}
+                else:
+                    self.add_edge(str(src), str(dest))
+
+
+    @classmethod
+    def from_networkx(
+        cls,
+        G: nx.Graph,
+        nodes_position: dict = None,
+        weight: str = "weight",
+        layout: str = 'kamada_kawai_layout',
+        node_args: dict = DEFAULT_CIRCLE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        edge_args: dict = DEFAULT_EDGE_ARGS
+    ):
+        if nodes_position is None:
+            nodes_position = nx.get_node_attributes(G, "pos")
+
+        names = [str(node) for node in G.nodes]
+        positions = None
+        if nodes_position:
+            # networkx positions are usually 2D and keyed by the original node objects
+            positions = []
+            for node in G.nodes:
+                pos = nodes_position.get(node, nodes_position.get(str(node), ORIGIN))
+                positions.append(np.append(np.asarray(pos, dtype=float)[:2], 0))
+
+        sources, targets, weights = [], [], []
+        for src, dest, w in G.edges(data=weight):
+            sources.append(str(src))
+            targets.append(str(dest))
+            weights.append(w)
+            # An undirected edge is stored in both directions, so it is drawn without arrow
+            if not G.is_directed():
+                sources.append(str(dest))
+                targets.append(str(src))
+                weights.append(w)
+
+        mGraph = cls(node_args=node_args, value_args=value_args, edge_args=edge_args)
+        mGraph.add_nodes_from(names, positions)
+        mGraph.add_edges_from(sources, targets, weights)
+        if positions is None:
+            mGraph.node_layout(layout)
+        return mGraph
+
+
+    @classmethod
+    def from_sparse_matrix(
+        cls,
+        matrix: Any,
+        node_names: list[str] = None,
+        nodes_position: dict = None,
+        weighted: bool = None,
+        directed: bool = True,
+        layout: str = 'kamada_kawai_layout',
+        node_args: dict = DEFAULT_CIRCLE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        edge_args: dict = DEFAULT_EDGE_ARGS
+    ):
+        try:
+            from scipy import sparse
+        except ImportError:
+            raise Exception("scipy is required to import a sparse matrix!")
+
+        coo = sparse.coo_matrix(matrix, copy=True)
+        coo.sum_duplicates()
+        size = max(coo.shape)
+        names = [str(name) for name in node_names] if node_names is not None else [str(i) for i in range(size)]
+        if len(names) != size:
+            raise Exception("The number of node names does not match the matrix size!")
+
+        # Self loops cannot be drawn as straight edges
+        keep = coo.row != coo.col
+        rows, cols, data = coo.row[keep], coo.col[keep], coo.data[keep]
+        # A plain adjacency matrix holds only ones, it is not weighted
+        if weighted is None:
+            weighted = bool(np.any(data != 1))
+        if not directed:
+            # (i, j) and (j, i) are the same undirected edge, as in a symmetric matrix
+            low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+            _, first = np.unique(low * size + high, return_index=True)
+            rows, cols, data = low[first], high[first], data[first]
+            rows, cols, data = np.concatenate([rows, cols]), np.concatenate([cols, rows]), np.concatenate([data, data])
+
+        names_arr = np.array(names, dtype=object)
+        positions = [nodes_position.get(name, ORIGIN) for name in names] if nodes_position else None
+
+        mGraph = cls(node_args=node_args, value_args=value_args, edge_args=edge_args)
+        mGraph.add_nodes_from(names, positions)
+        mGraph.add_edges_from(names_arr[rows], names_arr[cols], data if weighted else None)
+        if positions is None:
+            mGraph.node_layout(layout)
+        return mGraph
+
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        path: str,
+        delimiter: str = None,
+        has_header: bool = False,
+        comment: str = "#",
+        directed: bool = True,
+        nodes_position: dict = None,
+        layout: str = 'kamada_kawai_layout',
+        node_args: dict = DEFAULT_CIRCLE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        edge_args: dict = DEFAULT_EDGE_ARGS
+    ):
+        import csv
+
+        if delimiter is None:
+            delimiter = "\t" if str(path).endswith(".tsv") else ","
+
+        # Rows are streamed into flat columns, nodes are collected in order of appearance
+        names = {}
+        undirected = set()
+        sources, targets, weights = [], [], []
+        with open(path, newline="") as file:
+            lines = (line for line in file if line.strip() and not line.lstrip().startswith(comment))
+            reader = csv.reader(lines, delimiter=delimiter, skipinitialspace=True)
+            if has_header:
+                next(reader, None)
+            for row in reader:
+                if len(row) < 2:
+                    continue
+                src, dest = row[0].strip(), row[1].strip()
+                w = float(row[2]) if len(row) > 2 and row[2].strip() else None
+                names.setdefault(src)
+                names.setdefault(dest)
+                # Undirected, "a,b" and "b,a" are the same edge
+                if not directed:
+                    if (dest, src) in undirected:
+                        continue
+                    undirected.add((src, dest))
+                sources.append(src)
+                targets.append(dest)
+                weights.append(w)
+                if not directed:
+                    sources.append(dest)
+                    targets.append(src)
+                    weights.append(w)
+
+        positions = [nodes_position.get(name, ORIGIN) for name in names] if nodes_position else None
+
+        mGraph = cls(node_args=node_args, value_args=value_args, edge_args=edge_args)
+        mGraph.add_nodes_from(list(names), positions)
+        mGraph.add_edges_from(sources, targets, weights)
+        if positions is None:
+            mGraph.node_layout(layout)
+        return mGraph
 
-        for node in graph.keys():
-            pos = nodes_position[node] if node in nodes_position else ORIGIN
-            self.add_node(node, pos)
-        
-        if isinstance(graph, list) or isinstance(graph, dict):
-            # The graph can be list of list or dict of list
-            for src, destinations in graph.items() if isinstance(graph, dict) else enumerate(graph):
-                for dest in destinations:
-                    # If the graph is not weighted
-                    # Example: {'0': ['1', '2']}
-                    if isinstance(dest, str):
-                        self.add_edge(str(src), dest)
-                    # If the graph is weighted
-                    # Example: {'0': [('1', 2), ('2', 4)]}
-                    elif isinstance(dest, tuple) and len(dest) == 2 and isinstance(dest[0], str) and isinstance(dest[1], int):
-                        dest, weight = dest
-                        self.add_edge(str(src), dest, weight)
 
     class Node(VGroup, Highlightable):
         def __init__(
@@ -58,7 +409,7 @@ class MGraph(VDict, Labelable):
             self.name = name
 
             self.label = (
-                Text(str(name), **value_args)
+                get_text(str(name), value_args)
                 .move_to(position)
                 .set_z_index(3)
             )
@@ -99,16 +450,19 @@ class MGraph(VDict, Labelable):
             weight: float = 0,
             weight_args: dict = DEFAULT_WEIGHT_ARGS
         ):
-            self.label = Text(str(weight), **weight_args)
+            self.weight = weight
+            self.label = get_text(format_weight(weight), weight_args)
             self += self.label
             return self
         
         
-        def set_highlight(self, stroke_color: ManimColor = RED, stroke_width: float = 8):
-            super().set_highlight(stroke_color, stroke_width)
-            if hasattr(self.line, 'tip'):
+        def _style_highlight(self):
+            super()._style_highlight()
+            # The tip may be detached by the level of detail
+            if hasattr(self.line, 'tip') and self.line.has_tip():
                 arrow_width = self.line.get_tip().get_width()
-                self.highlighting.get_tip().set_stroke(width=arrow_width).set_color(stroke_color).set_opacity(1)
+                stroke_color = self._highlight_stroke[0]
+                self._highlighting.get_tip().set_stroke(width=arrow_width).set_color(stroke_color).set_opacity(1)
 
 
         @abstractmethod
@@ -163,7 +517,7 @@ class MGraph(VDict, Labelable):
             node1_radius: float,
             node2_radius: float
         ):
-            direction = Line(node1_center, node2_center).get_unit_vector()
+            direction = normalize(np.asarray(node2_center) - np.asarray(node1_center))
             start = node1_center + direction * node1_radius
             end = node2_center - direction * node2_radius
             return start, end
@@ -219,7 +573,7 @@ class MGraph(VDict, Labelable):
             node2_radius: float,
             start_angle: float = PI/3
         ):
-            edge_direction = Line(node1_center, node2_center).get_unit_vector()
+            edge_direction = normalize(np.asarray(node2_center) - np.asarray(node1_center))
             edge_angle = acos(edge_direction[0])
             if(edge_direction[1] < 0):
                 edge_angle = -edge_angle
@@ -278,6 +632,148 @@ class MGraph(VDict, Labelable):
         return Create(self.nodes[name], **anim_args)
     
 
+    def _register(self, pairs: list[tuple]):
+        # The mobjects are new, so the linear duplicate check that
+        # VDict.add runs for every single key is not needed
+        self.submob_dict.update(pairs)
+        self.submobjects.extend(mob for _, mob in pairs)
+
+
+    def add_nodes_from(
+        self,
+        names: list[str],
+        positions: list[Point3D] = None
+    ):
+        if positions is None:
+            positions = [ORIGIN] * len(names)
+        prerender_texts(names, self.value_args)
+        pairs = []
+        for name, position in zip(names, positions):
+            new_node = self.Node(name, position, self.node_args, self.value_args)
+            self.nodes[name] = new_node
+            pairs.append((name, new_node))
+        self._register(pairs)
+        return self
+
+
+    def add_edges_from(
+        self,
+        sources: list[str],
+        targets: list[str],
+        weights: list[float] = None,
+        label_distance: float | list[float] = 0.3,
+        endpoints: tuple[np.ndarray, np.ndarray] = None
+    ):
+        sources = list(sources)
+        targets = list(targets)
+        if not sources:
+            return self
+        if weights is None:
+            weights = [None] * len(sources)
+        if np.ndim(label_distance) == 0:
+            label_distance = [label_distance] * len(sources)
+
+        if endpoints is not None:
+            starts, ends = endpoints
+        else:
+            # All line endpoints are computed at once from the node centres
+            index = {name: i for i, name in enumerate(self.nodes)}
+            circles = [node.circle for node in self.nodes.values()]
+            centers = np.array([circle.get_center() for circle in circles])
+            radii = np.array([circle.width / 2 for circle in circles])
+
+            src_idx = np.fromiter((index[name] for name in sources), dtype=int, count=len(sources))
+            dest_idx = np.fromiter((index[name] for name in targets), dtype=int, count=len(targets))
+            directions = centers[dest_idx] - centers[src_idx]
+            lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+            directions = np.divide(directions, lengths, out=np.zeros_like(directions), where=lengths > 0)
+            starts = centers[src_idx] + directions * radii[src_idx, None]
+            ends = centers[dest_idx] - directions * radii[dest_idx, None]
+
+        keys = set()
+        for edge_name in zip(sources, targets):
+            if edge_name in self.edges or edge_name in keys:
+                raise Exception(f"The edge {edge_name} is already in the graph!")
+            keys.add(edge_name)
+
+        prerender_texts([format_weight(weight) for weight in weights if weight is not None and weight == weight], self.weight_args)
+        existing = set(self.edges)
+        pairs = []
+        for i, edge_name in enumerate(zip(sources, targets)):
+            edge_name_rev = edge_name[::-1]
+            weight = weights[i]
+            # Missing weights are read as NaN from numeric columns
+            if weight is not None and weight != weight:
+                weight = None
+            # An edge whose reverse existed before the batch goes
+            # through the regular path, which replaces the old edge
+            if edge_name_rev in existing:
+                self.add_edge(edge_name[0], edge_name[1], weight, label_distance[i])
+                continue
+            # The reverse of an edge of the batch shares its record
+            if edge_name_rev in self.edges:
+                self.edges.add(edge_name[0], edge_name[1], self.edges[edge_name_rev])
+                continue
+
+            new_edge = self.StraightEdge(
+                starts[i],
+                ends[i],
+                0,
+                0,
+                edge_name_rev not in keys,
+                self.edge_args
+            )
+            if weight is not None:
+                new_edge.weighted(
+                    weight,
+                    label_distance[i],
+                    self.weight_args
+                )
+            self.edges.add(edge_name[0], edge_name[1], new_edge)
+            pairs.append((edge_name, new_edge))
+        self._register(pairs)
+        return self
+
+
+    def _store_edge(
+        self,
+        node1_name: str,
+        node2_name: str,
+        new_edge: VMobject
+    ):
+        edge_name = (node1_name, node2_name)
+        self._split_edges([edge_name])
+        edge_id = self.edges.add(node1_name, node2_name, new_edge)
+        canonical = self.edges.key(edge_id)
+        # Only the canonical key is registered in the VDict,
+        # lookups with the other orientation go through self.edges
+        if edge_name[::-1] != canonical and edge_name[::-1] in self.submob_dict:
+            self.remove(edge_name[::-1])
+        if edge_name != canonical and edge_name in self.submob_dict:
+            self.remove(edge_name)
+        self[canonical] = new_edge
+
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and key in self.edges:
+            # A batched edge is split in its current place, a hidden tip
+            # must be there if the edge gets highlighted
+            mEdge = self.edges[key]
+            self._split_edges([key])
+            self._uncull([mEdge])
+            return mEdge
+        mob = super().__getitem__(key)
+        # Out of the camera frame it is attached again, in its current place
+        self._uncull([mob])
+        return mob
+
+
+    def __contains__(self, key):
+        if isinstance(key, tuple) and key in self.edges:
+            return True
+        return super().__contains__(key)
+
+
     def add_edge(
         self,
         node1_name: str,
@@ -304,19 +800,14 @@ class MGraph(VDict, Labelable):
             arrow,
             self.edge_args
         )
-        if weight:
+        if weight is not None:
             new_edge.weighted(
                 weight,
                 label_distance,
                 self.weight_args
             )
         
-        self.edges[edge_name] = new_edge
-        
-        if(edge_name_rev in self.edges):
-            self.edges[edge_name_rev] = self[edge_name_rev] = new_edge
-        
-        self.add([(edge_name, new_edge)])
+        self._store_edge(node1_name, node2_name, new_edge)
         return self
 
 
@@ -372,19 +863,14 @@ class MGraph(VDict, Labelable):
             arc_angle,
             self.edge_args
         )
-        if weight:
+        if weight is not None:
             new_edge.weighted(
                 weight,
                 label_distance,
                 self.weight_args
             )
         
-        self.edges[edge_name] = new_edge
-        
-        if(edge_name_rev in self.edges):
-            self.edges[edge_name_rev] = self[edge_name_rev] = new_edge
-        
-        self.add([(edge_name, new_edge)])
+        self._store_edge(node1_name, node2_name, new_edge)
         return self
 
 
@@ -426,6 +912,7 @@ class MGraph(VDict, Labelable):
     ):
         edge_name = (node1_name, node2_name)
         edge_name_rev = (node2_name, node1_name)
+        self._split_edges([edge_name])
         
         node1 = self.nodes[node1_name].circle
         node2 = self.nodes[node2_name].circle
@@ -462,9 +949,11 @@ class MGraph(VDict, Labelable):
             self.weight_args
         )
         
-        self.edges[edge_name] = self[edge_name] = new_edge_1
-        self.edges[edge_name_rev] = new_edge_2
-        self.add([(edge_name_rev, new_edge_2)])
+        self.edges.set(edge_name, new_edge_1)
+        self.edges.set(edge_name_rev, new_edge_2)
+        # Each direction is now drawn separately, so both keys are registered
+        self[edge_name] = new_edge_1
+        self[edge_name_rev] = new_edge_2
         return self
 
 
@@ -502,64 +991,489 @@ class MGraph(VDict, Labelable):
         )
     
 
+    def _unregister(self, mobjects: list, keys: list):
+        # Only the given VDict keys can refer to the mobjects,
+        # the submobjects are filtered in a single pass
+        gone = set(mobjects)
+        for key in keys:
+            if self.submob_dict.get(key) in gone:
+                del self.submob_dict[key]
+        self.submobjects = [mob for mob in self.submobjects if mob not in gone]
+
+
+    def _rebuild_edge(self, key: tuple[str, str], mEdge: VMobject):
+        # The direction left by a removal is drawn again with its own tip
+        weight = getattr(mEdge, 'weight', None)
+        label_distance = getattr(mEdge, 'label_distance', 0.3)
+        if isinstance(mEdge, self.CurvedEdge):
+            self.add_curved_edge(key[0], key[1], weight, label_distance, mEdge.node_angle, mEdge.arc_angle)
+        else:
+            self.add_edge(key[0], key[1], weight, label_distance)
+        return self.edges[key]
+
+
+    def _logic_remove_edges(self, keys: list[tuple[str, str]]):
+        keys = list(dict.fromkeys(keys))
+        for key in keys:
+            if key not in self.edges:
+                raise Exception(f"The edge {key} is not in the graph!")
+        self._split_edges(keys)
+
+        pending = set(keys)
+        removed, rebuilt = [], []
+        for key in keys:
+            # Already gone together with its reverse
+            if key not in self.edges:
+                continue
+            mEdge = self.edges[key]
+            gone = self.edges.remove(key)
+            if gone is not None:
+                removed.append(gone)
+                continue
+            self.edges.remove(key[::-1])
+            removed.append(mEdge)
+            if key[::-1] not in pending:
+                rebuilt.append((key[::-1], mEdge))
+        if removed:
+            self._unregister(removed, [k for key in keys for k in (key, key[::-1])])
+        added = [self._rebuild_edge(key, mEdge) for key, mEdge in rebuilt]
+        return removed, added
+
+
+    def remove_edge(self, node1_name: str, node2_name: str):
+        self._logic_remove_edges([(node1_name, node2_name)])
+        return self
+
+
+    @override_animate(remove_edge)
+    def _remove_edge_animation(self, node1_name: str, node2_name: str, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        removed, added = self._logic_remove_edges([(node1_name, node2_name)])
+        anims = [FadeOut(mob) for mob in removed] + [Create(mob) for mob in added]
+        return AnimationGroup(*anims, group=VGroup(self, *removed), **anim_args)
+
+
+    def _logic_remove_nodes(self, names: list[str]):
+        names = list(dict.fromkeys(names))
+        for name in names:
+            if name not in self.nodes:
+                raise Exception(f"The node {name} is not in the graph!")
+        gone = set(names)
+        # Both directions of every incident edge go, so nothing is rebuilt
+        removed, _ = self._logic_remove_edges([key for key in self.edges if key[0] in gone or key[1] in gone])
+        nodes = [self.nodes.pop(name) for name in names]
+        if nodes:
+            self._unregister(nodes, names)
+        return removed + nodes
+
+
+    def remove_node(self, name: str):
+        self._logic_remove_nodes([name])
+        return self
+
+
+    @override_animate(remove_node)
+    def _remove_node_animation(self, name: str, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        removed = self._logic_remove_nodes([name])
+        return AnimationGroup(*[FadeOut(mob) for mob in removed], group=VGroup(self, *removed), **anim_args)
+
+
+    def _set_weight(self, key: tuple[str, str], weight: float = None):
+        # Returns the old and the new label, either may be None
+        mEdge = self.edges[key]
+        old_label = getattr(mEdge, 'label', None)
+        if old_label is not None:
+            mEdge -= old_label
+            del mEdge.label
+        mEdge.weight = weight
+        if weight is None:
+            return old_label, None
+        mEdge.weighted(weight, getattr(mEdge, 'label_distance', 0.3), self.weight_args)
+        return old_label, mEdge.label
+
+
+    def _logic_apply(self, graph: list[list[str]] | dict[str, dict[str, str]], nodes_position: dict = None):
+        if nodes_position is None:
+            nodes_position = {}
+        # Same formats as the constructor
+        adjacency = list(graph.items() if isinstance(graph, dict) else enumerate(graph))
+        names = [str(node) for node, _ in adjacency]
+        new_edges = {}
+        for src, destinations in adjacency:
+            for dest in destinations:
+                weight = None
+                if isinstance(dest, tuple) and len(dest) == 2 and isinstance(dest[1], (int, float)):
+                    dest, weight = dest
+                new_edges[(str(src), str(dest))] = weight
+
+        # Only the differences are touched: what is gone, what is new,
+        # the weights that changed and the nodes given a new position
+        kept = set(names)
+        removed, added = self._logic_remove_edges([key for key in self.edges if key not in new_edges])
+        removed += self._logic_remove_nodes([name for name in self.nodes if name not in kept])
+
+        new_names = [name for name in names if name not in self.nodes]
+        self.add_nodes_from(new_names, [nodes_position.get(name, ORIGIN) for name in new_names])
+        added += [self.nodes[name] for name in new_names]
+        self._move_nodes({
+            name: position for name, position in nodes_position.items()
+            if name in self.nodes and name not in new_names
+        })
+
+        reweighted = [
+            key for key, weight in new_edges.items()
+            if key in self.edges and getattr(self.edges[key], 'weight', None) != weight
+        ]
+        self._split_edges(reweighted)
+        labels = [self._set_weight(key, new_edges[key]) for key in reweighted]
+
+        missing = [key for key in new_edges if key not in self.edges]
+        self.add_edges_from(
+            [src for src, _ in missing],
+            [dest for _, dest in missing],
+            [new_edges[key] for key in missing]
+        )
+        added += list(dict.fromkeys(self.edges[key] for key in missing))
+        return removed, added, labels
+
+
+    def apply(self, graph: list[list[str]] | dict[str, dict[str, str]], nodes_position: dict = None):
+        self._logic_apply(graph, nodes_position)
+        return self
+
+
+    @override_animate(apply)
+    def _apply_animation(
+        self,
+        graph: list[list[str]] | dict[str, dict[str, str]],
+        nodes_position: dict = None,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        # Only the nodes that move and their edges are morphed
+        moving = {
+            name for name, position in (nodes_position or {}).items()
+            if name in self.nodes and np.any(np.asarray(position) - self.nodes[name].circle.get_center())
+        }
+        incident = [(src, dest, mEdge) for _, src, dest, mEdge in self.edges.records() if src in moving or dest in moving]
+        self._split_edges([(src, dest) for src, dest, _ in incident])
+        changes = []
+        morph = BatchMorph(
+            [self.nodes[name] for name in moving] + [mEdge for _, _, mEdge in incident],
+            lambda: changes.extend(self._logic_apply(graph, nodes_position)),
+            group=self
+        )
+        removed, added, labels = changes
+        old_labels = [old for old, _ in labels if old is not None]
+
+        anims = [morph]
+        anims += [FadeOut(mob) for mob in removed + old_labels]
+        anims += [Create(mob) for mob in added]
+        anims += [Write(new) for _, new in labels if new is not None]
+        return AnimationGroup(*anims, group=VGroup(self, *removed, *old_labels), **anim_args)
+
+
     def node_layout(
         self,
-        layout: str = 'kamada_kawai_layout'
+        layout: str = 'kamada_kawai_layout',
+        **layout_args
     ):
+        # The force-directed layout starts from the current positions,
+        # the other ones are computed from scratch and fitted to the frame
+        if layout == 'force_directed':
+            self._move_nodes(self._force_directed_positions(**layout_args))
+            return self
+        if layout in ('layered', 'bfs'):
+            self._move_nodes(self._fit_to_frame(self._level_positions(layout, **layout_args)))
+            return self
+
         G = nx.DiGraph()
-        G.add_edges_from(self.edges.keys())
+        G.add_edges_from((src, dest) for _, src, dest, _ in self.edges.records())
 
-        try:
-            layout_function = eval(f'nx.{layout}')
-            pos = layout_function(G)
-        
-        except:
-            print('Layout not available')
-            pos = nx.kamada_kawai_layout(G)
+        layout_function = getattr(nx, layout, None)
+        if layout_function is None:
+            raise Exception(f"Layout {layout} not available!")
+        pos = layout_function(G, **layout_args)
+        self._move_nodes(self._fit_to_frame(pos))
+        return self
 
-            
-        labels = list(pos.keys())
 
-        x = [x for x, y in pos.values()]
-        y = [y for x, y in pos.values()]
+    def _fit_to_frame(self, pos: dict) -> dict:
+        if not pos:
+            return {}
+        points = np.array(list(pos.values()), dtype=float)
+        span = np.abs(points.max(axis=0) - points.min(axis=0))
+        coeff_x = config.frame_x_radius / span[0] if span[0] else 0
+        coeff_y = config.frame_y_radius / span[1] if span[1] else 0
+        return {
+            label: np.array([x * coeff_x, y * coeff_y, 0]) for label, (x, y) in zip(pos, points)
+        }
+
+
+    def _level_positions(self, layout: str, root: str = None, sweeps: int = 4) -> dict:
+        names = list(self.nodes)
+        index = {name: i for i, name in enumerate(names)}
+        if layout == 'layered':
+            # Physical edges, oriented as they are drawn
+            edges = [(index[src], index[dest]) for _, src, dest, _ in self.edges.records()]
+            points = layered_layout(len(names), np.array(edges, dtype=np.int64), sweeps)
+        else:
+            # Every direction an edge can be walked in
+            edges = [(index[src], index[dest]) for src, dest in self.edges]
+            root = root if root is not None else names[0]
+            points = bfs_layout(len(names), np.array(edges, dtype=np.int64), index[root], sweeps)
+        return dict(zip(names, points))
+
+
+    @override_animate(node_layout)
+    def _node_layout_animation(
+        self,
+        layout: str = 'kamada_kawai_layout',
+        anim_args=None,
+        **layout_args
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        # Nodes and edges are interpolated in place, batched edges are split out to follow
+        self.unbatch_edges()
+        return BatchMorph(
+            list(self.submobjects),
+            lambda: self.node_layout(layout, **layout_args),
+            group=self,
+            **anim_args
+        )
+
+
+    def _force_directed_positions(
+        self,
+        pinned: list[str] = None,
+        iterations: int = 50,
+        edge_length: float = None,
+        temperature: float = None
+    ) -> dict:
+        names = list(self.nodes)
+        if not names:
+            return {}
+        index = {name: i for i, name in enumerate(names)}
+        circles = [self.nodes[name].circle for name in names]
+        positions = np.array([circle.get_center() for circle in circles])
+        edges = np.array(
+            [(index[src], index[dest]) for _, src, dest, _ in self.edges.records()],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        pinned = set(pinned) if pinned else set()
+        pinned_mask = np.array([name in pinned for name in names], dtype=bool)
+
+        # By default an edge is about two node diameters long
+        radius = max(circle.width for circle in circles) / 2
+        if edge_length is None:
+            edge_length = 4 * radius
+        bounds = (config.frame_x_radius - radius, config.frame_y_radius - radius)
+        points = force_directed_layout(
+            positions[:, :2], edges, pinned_mask, edge_length, iterations, temperature, bounds
+        )
+        return {
+            name: np.array([x, y, positions[i, 2]]) for i, (name, (x, y)) in enumerate(zip(names, points))
+        }
 
-        coeff_x = config.frame_x_radius/(abs(max(x)-min(x)))
-        coeff_y = config.frame_y_radius/(abs(max(y)-min(y)))
 
-        positions = []
+    def _move_nodes(self, positions: dict):
+        # Only the edges attached to a node that actually moved are recomputed
+        moved = set()
+        for name, position in positions.items():
+            node = self.nodes[name]
+            offset = np.asarray(position) - node.circle.get_center()
+            if np.any(offset):
+                node.shift(offset)
+                moved.add(name)
+        self._refresh_edges(moved)
 
-        for label in labels:
-            positions.append(np.array([pos.get(label)[0]*coeff_x, pos.get(label)[1]*coeff_y, 0]))
 
-        nodes_and_positions = dict(zip(labels, positions))
-        for node in nodes_and_positions:
-            self.nodes[node].move_to(nodes_and_positions[node])
-        for edge in self.edges:
-            node1 = self.nodes[edge[0]].circle
-            node2 = self.nodes[edge[1]].circle
-            start, end = self.edges[edge].get_line_start_end(
+    def _refresh_edges(self, moved: set = None):
+        self._sync_edge_batch()
+        # Each physical edge is refreshed once, following the direction it is drawn in
+        for _, src, dest, mEdge in self.edges.records():
+            if moved is not None and src not in moved and dest not in moved:
+                continue
+            node1 = self.nodes[src].circle
+            node2 = self.nodes[dest].circle
+            start, end = mEdge.get_line_start_end(
                 node1.get_center(),
                 node2.get_center(),
                 node1.width / 2,
                 node2.width / 2
             )
-            mEdge = self.edges[edge]
             mEdge.line.put_start_and_end_on(start, end)
-            mEdge.highlighting.put_start_and_end_on(start, end)
+            if mEdge.is_highlighted():
+                mEdge.highlighting.put_start_and_end_on(start, end)
+            else:
+                mEdge.reset_highlight()
             if(hasattr(mEdge, 'label')):
                 label_position = mEdge.get_label_position(mEdge.label_distance)
                 mEdge.label.move_to(label_position)
-        
-        return self
+        if self._edge_batch is not None:
+            self._merge_edge_batch()
     
 
+    def _merge_edge_batch(self):
+        group = self._edge_batch["group"]
+        self.submobjects = [mob for mob in self.submobjects if mob is not group]
+        mobjects = [mEdge for mEdges in self._edge_batch["edges"].values() for mEdge in mEdges]
+        if not mobjects:
+            self._edge_batch = None
+            return
+        # Edges are drawn below the nodes
+        group = MergedGroup(mobjects)
+        self._edge_batch["group"] = group
+        self._edge_batch["anchor"] = (group.get_center(), max(group.width, group.height))
+        self.submobjects.insert(0, group)
+
+
+    def _sync_edge_batch(self):
+        # Batched edges are detached, so a shift or scale applied to the
+        # graph meanwhile is replayed on them from the merged mobjects
+        if self._edge_batch is None:
+            return
+        group = self._edge_batch["group"]
+        center, size = self._edge_batch["anchor"]
+        factor = max(group.width, group.height) / size if size else 1
+        offset = group.get_center() - center
+        if factor != 1 or np.any(offset):
+            for mEdges in self._edge_batch["edges"].values():
+                for mEdge in mEdges:
+                    mEdge.scale(factor, about_point=center).shift(offset)
+        self._edge_batch["anchor"] = (group.get_center(), max(group.width, group.height))
+
+
+    def batch_edges(self):
+        # Every edge that is not highlighted is detached and drawn through
+        # one multi-path VMobject per style, the edges are indexed by edge id
+        self.unbatch_edges()
+        batch = {}
+        for edge_id, _, _, mEdge in self.edges.records():
+            if not mEdge.is_highlighted():
+                batch.setdefault(edge_id, []).append(mEdge)
+        if not batch:
+            return self
+        members = {mEdge for mEdges in batch.values() for mEdge in mEdges}
+        self.submobjects = [mob for mob in self.submobjects if mob not in members]
+        self._edge_batch = {"edges": batch, "group": None, "anchor": None}
+        self._merge_edge_batch()
+        return self
+
+
+    def _split_edges(self, keys: list[tuple[str, str]]):
+        # The given edges are drawn on their own again, the rest stays merged;
+        # only their hidden details are shown, they are about to change
+        mobjects = [self.edges[key] for key in keys if key in self.edges]
+        self._show_details(mobjects=mobjects)
+        if self._edge_batch is None:
+            return
+        self._sync_edge_batch()
+        split = []
+        for key in keys:
+            edge_id = self.edges.id_of(key)
+            if edge_id is not None:
+                split.extend(self._edge_batch["edges"].pop(edge_id, []))
+        if not split:
+            return
+        self.submobjects.extend(split)
+        # Only the chunks holding these edges are merged again
+        if self._edge_batch["edges"]:
+            group = self._edge_batch["group"].cut(split)
+            self._edge_batch["anchor"] = (group.get_center(), max(group.width, group.height))
+        else:
+            self._merge_edge_batch()
+
+
+    def unbatch_edges(self):
+        self._show_details()
+        if self._edge_batch is None:
+            return self
+        self._sync_edge_batch()
+        mobjects = [mEdge for mEdges in self._edge_batch["edges"].values() for mEdge in mEdges]
+        self.submobjects.extend(mobjects)
+        self._edge_batch["edges"].clear()
+        self._merge_edge_batch()
+        return self
+
+
+    def _detail_reference(self):
+        return next(iter(self.nodes.values())).circle if self.nodes else None
+
+
+    def _detail_parts(self) -> dict:
+        mobjects = [mEdge for _, _, _, mEdge in self.edges.records()]
+        return {
+            "label": [(node, "label", node.circle) for node in self.nodes.values()],
+            "weight": [(mEdge, "label", mEdge.line) for mEdge in mobjects if hasattr(mEdge, "label")],
+            "tip": [(mEdge.line, "tip", mEdge.line) for mEdge in mobjects if hasattr(mEdge.line, "tip")],
+        }
+
+
+    def _detail_parents(self, mobjects: list[Mobject]) -> set[Mobject]:
+        # Tips hang from the line of their edge
+        parents = set(mobjects)
+        parents.update(mob.line for mob in mobjects if isinstance(mob, MGraph.Edge))
+        return parents
+
+
+    def _cull_parts(self) -> list[Mobject]:
+        # Nodes and the edges drawn on their own, batched edges stay merged
+        batched = set() if self._edge_batch is None else {
+            mEdge for mEdges in self._edge_batch["edges"].values() for mEdge in mEdges
+        }
+        edges = [mEdge for _, _, _, mEdge in self.edges.records() if mEdge not in batched]
+        return list(self.nodes.values()) + edges
+
+
+    def _cull_owned(self) -> set[Mobject]:
+        return set(self.submob_dict.values())
+
+
+    def _footprint_parts(self) -> dict:
+        # Batched edges are still referenced by the edge table
+        nodes = list(self.nodes.values())
+        mobjects = [mEdge for _, _, _, mEdge in self.edges.records()]
+        return {
+            "highlights": [mob._highlighting for mob in nodes + mobjects],
+            "labels": [node.label for node in nodes],
+            "circles": [node.circle for node in nodes],
+            "tips": [getattr(mEdge.line, "tip", None) for mEdge in mobjects],
+            "lines": [mEdge.line for mEdge in mobjects],
+            "weights": [getattr(mEdge, "label", None) for mEdge in mobjects],
+            "label": [getattr(self, "label", None)],
+            "merged": [self._edge_batch["group"]] if self._edge_batch is not None else [],
+        }
+
+
+    def adjacency(self) -> dict[str, list[str]]:
+        adjacency = {name: [] for name in self.nodes}
+        for src, dest in self.edges:
+            adjacency[src].append(dest)
+        return adjacency
+
+
+    def get_weight(self, node1_name: str, node2_name: str, default: float = 1):
+        weight = getattr(self.edges[(node1_name, node2_name)], 'weight', None)
+        return default if weight is None else weight
+
+
     def set_node_highlight(
         self,
         color: ManimColor = RED,
         width: float = 8,
     ):
-        for node in self.nodes:
-            self.nodes[node].set_highlight(color, width)
+        # The style is applied when nodes are highlighted, not stored on every node
+        self.node_highlight_args = (color, width)
         return self
 
     def set_edge_highlight(
@@ -567,11 +1481,405 @@ class MGraph(VDict, Labelable):
         color: ManimColor = RED,
         width: float = 8,
     ):
-        for edge in self.edges:
-            self.edges[edge].set_highlight(color, width)
+        self.edge_highlight_args = (color, width)
+        return self
+
+
+    def _highlight_style(self, style: tuple, stroke_color: ManimColor, stroke_width: float):
+        color, width = style
+        return (
+            stroke_color if stroke_color is not None else color,
+            stroke_width if stroke_width is not None else width
+        )
+
+
+    def _path_edges(self, node_list: list[str]):
+        return list(zip(node_list[:-1], node_list[1:]))
+
+
+    def highlight_nodes(
+        self,
+        names: list[str],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None
+    ):
+        stroke_color, stroke_width = self._highlight_style(self.node_highlight_args, stroke_color, stroke_width)
+        for name in names:
+            self.nodes[name].highlight(stroke_color, stroke_width)
+        return self
+
+
+    @override_animate(highlight_nodes)
+    def _highlight_nodes_animation(
+        self,
+        names: list[str],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        self.highlight_nodes(names, stroke_color, stroke_width)
+        return batch_animation([Create(self.nodes[name].highlighting) for name in names], self, **anim_args)
+
+
+    def unhighlight_nodes(self, names: list[str]):
+        for name in names:
+            self.nodes[name].unhighlight()
+        return self
+
+
+    @override_animate(unhighlight_nodes)
+    def _unhighlight_nodes_animation(self, names: list[str], anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        self.unhighlight_nodes(names)
+        return batch_animation([FadeOut(self.nodes[name].highlighting) for name in names], self, **anim_args)
+
+
+    def highlight_edges(
+        self,
+        keys: list[tuple[str, str]],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None
+    ):
+        stroke_color, stroke_width = self._highlight_style(self.edge_highlight_args, stroke_color, stroke_width)
+        self._split_edges(keys)
+        for key in keys:
+            self.edges[key].highlight(stroke_color, stroke_width)
+        return self
+
+
+    @override_animate(highlight_edges)
+    def _highlight_edges_animation(
+        self,
+        keys: list[tuple[str, str]],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        self.highlight_edges(keys, stroke_color, stroke_width)
+        return batch_animation([Create(self.edges[key].highlighting) for key in keys], self, **anim_args)
+
+
+    def unhighlight_edges(self, keys: list[tuple[str, str]]):
+        for key in keys:
+            self.edges[key].unhighlight()
         return self
 
 
+    @override_animate(unhighlight_edges)
+    def _unhighlight_edges_animation(self, keys: list[tuple[str, str]], anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        self.unhighlight_edges(keys)
+        return batch_animation([FadeOut(self.edges[key].highlighting) for key in keys], self, **anim_args)
+
+
+    def highlight_path(
+        self,
+        node_list: list[str],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None
+    ):
+        self.highlight_edges(self._path_edges(node_list), stroke_color, stroke_width)
+        self.highlight_nodes(node_list, stroke_color, stroke_width)
+        return self
+
+
+    @override_animate(highlight_path)
+    def _highlight_path_animation(
+        self,
+        node_list: list[str],
+        stroke_color: ManimColor = None,
+        stroke_width: float = None,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        return AnimationGroup(
+            self._highlight_edges_animation(self._path_edges(node_list), stroke_color, stroke_width),
+            self._highlight_nodes_animation(node_list, stroke_color, stroke_width),
+            group=self,
+            **anim_args
+        )
+
+
+    def unhighlight_path(self, node_list: list[str]):
+        self.unhighlight_edges(self._path_edges(node_list))
+        self.unhighlight_nodes(node_list)
+        return self
+
+
+    @override_animate(unhighlight_path)
+    def _unhighlight_path_animation(self, node_list: list[str], anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        return AnimationGroup(
+            self._unhighlight_edges_animation(self._path_edges(node_list)),
+            self._unhighlight_nodes_animation(node_list),
+            group=self,
+            **anim_args
+        )
+
+
+    def copy(self):
+        return shared_copy(self)
+
+
+    def snapshot(self) -> dict:
+        # Membership is kept as shallow copies, geometry as node centres only:
+        # edges are recomputed from the nodes they connect
+        self._sync_edge_batch()
+        mobjects = [mEdge for _, _, _, mEdge in self.edges.records()]
+        return {
+            "items": dict(self.submob_dict),
+            "nodes": dict(self.nodes),
+            "edges": self.edges.copy(),
+            "centers": {name: node.circle.get_center() for name, node in self.nodes.items()},
+            "node_highlights": {name: node.highlight_state() for name, node in self.nodes.items()},
+            "edge_labels": [(mEdge, getattr(mEdge, 'label', None), getattr(mEdge, 'weight', None)) for mEdge in mobjects],
+            "edge_highlights": [(mEdge, mEdge.highlight_state()) for mEdge in mobjects],
+        }
+
+
+    def _restore_graph(self, snapshot: dict):
+        self.unbatch_edges()
+        self.submob_dict = dict(snapshot["items"])
+        self.submobjects = list(self.submob_dict.values())
+        if self._cull_frame is not None:
+            self.submobjects.append(self._cull_frame)
+        self.nodes = dict(snapshot["nodes"])
+        self.edges = snapshot["edges"].copy()
+
+        moved = set()
+        for name, center in snapshot["centers"].items():
+            node = self.nodes[name]
+            offset = center - node.circle.get_center()
+            if np.any(offset):
+                node.shift(offset)
+                moved.add(name)
+            node.restore_highlight(snapshot["node_highlights"][name])
+
+        for mEdge, label, weight in snapshot["edge_labels"]:
+            current = getattr(mEdge, 'label', None)
+            if current is not label:
+                if current is not None:
+                    mEdge -= current
+                    del mEdge.label
+                if label is not None:
+                    mEdge.label = label
+                    mEdge += label
+            mEdge.weight = weight
+        self._refresh_edges(moved)
+        for mEdge, state in snapshot["edge_highlights"]:
+            mEdge.restore_highlight(state)
+
+
+    def restore(self, snapshot: dict = None):
+        # Without a snapshot this is Mobject.restore, used by save_state
+        if snapshot is None:
+            return super().restore()
+        self._restore_graph(snapshot)
+        return self
+
+
+    @override_animate(restore)
+    def _restore_animation(self, snapshot: dict = None, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+        if snapshot is None:
+            return Restore(self, **anim_args)
+
+        self.unbatch_edges()
+        kept = set(snapshot["items"].values()) | {self._cull_frame}
+        current = list(self.submobjects)
+        removed = [mob for mob in current if mob not in kept]
+        present = set(current)
+        added = [mob for mob in snapshot["items"].values() if mob not in present]
+        # Overlays the snapshot does not have are faded out, not dropped
+        overlays = [
+            node.highlighting for name, node in snapshot["nodes"].items()
+            if node in present and snapshot["node_highlights"][name] is None and node.is_highlighted()
+        ]
+        overlays += [
+            mEdge.highlighting for mEdge, state in snapshot["edge_highlights"]
+            if mEdge in present and state is None and mEdge.is_highlighted()
+        ]
+        morph = BatchMorph(
+            [mob for mob in current if mob in kept],
+            lambda: self._restore_graph(snapshot),
+            group=self
+        )
+        anims = [morph]
+        anims += [FadeOut(mob) for mob in removed]
+        anims += [FadeIn(mob) for mob in added]
+        anims += [FadeOut(overlay) for overlay in overlays]
+        return AnimationGroup(*anims, group=VGroup(self, *removed, *overlays), **anim_args)
+
+
+    def _scale_factor(self) -> float:
+        # Ratio between the drawn node radius and the one in node_args
+        if not self.nodes:
+            return 1
+        node = next(iter(self.nodes.values()))
+        return node.circle.width / 2 / self.node_args.get("radius", 0.5)
+
+
+    def save(self, path: str):
+        self._sync_edge_batch()
+        names = list(self.nodes)
+        index = {name: i for i, name in enumerate(names)}
+        nodes = [self.nodes[name] for name in names]
+        rows = list(self.edges.records())
+        mobjects = [mEdge for _, _, _, mEdge in rows]
+        highlighted_nodes = [node for node in nodes if node.is_highlighted()]
+        highlighted_edges = [mEdge for mEdge in mobjects if mEdge.is_highlighted()]
+
+        header = {
+            "node_args": encode_args(self.node_args),
+            "value_args": encode_args(self.value_args),
+            "edge_args": encode_args(self.edge_args),
+            "weight_args": encode_args(self.weight_args),
+            "node_highlight": encode_args(dict(zip(("color", "width"), self.node_highlight_args))),
+            "edge_highlight": encode_args(dict(zip(("color", "width"), self.edge_highlight_args))),
+            "scale": self._scale_factor(),
+        }
+        arrays = {
+            "node_names": np.array(names, dtype=str),
+            "node_positions": np.array([node.circle.get_center() for node in nodes]).reshape(-1, 3),
+            "node_highlighted": np.array([node.is_highlighted() for node in nodes], dtype=bool),
+            "node_highlight_colors": encode_colors([node.highlighting.get_stroke_color() for node in highlighted_nodes]),
+            "node_highlight_widths": np.array([node.highlighting.get_stroke_width() for node in highlighted_nodes]),
+            # One row per drawn edge, oriented as it is drawn
+            "edge_ids": np.array([edge_id for edge_id, _, _, _ in rows], dtype=np.int64),
+            "edge_src": np.array([index[src] for _, src, _, _ in rows], dtype=np.int64),
+            "edge_dest": np.array([index[dest] for _, _, dest, _ in rows], dtype=np.int64),
+            "edge_flags": np.array([self.edges.flags[edge_id] for edge_id, _, _, _ in rows], dtype=np.uint8),
+            "edge_reverse": np.array([src != self.edges.sources[edge_id] for edge_id, src, _, _ in rows], dtype=bool),
+            "edge_weights": np.array([
+                format_weight(mEdge.weight) if getattr(mEdge, 'weight', None) is not None else "" for mEdge in mobjects
+            ], dtype=str),
+            "edge_curved": np.array([isinstance(mEdge, self.CurvedEdge) for mEdge in mobjects], dtype=bool),
+            "edge_angles": np.array([
+                [getattr(mEdge, 'node_angle', 0), getattr(mEdge, 'arc_angle', 0)] for mEdge in mobjects
+            ]).reshape(-1, 2),
+            "edge_label_distances": np.array([getattr(mEdge, 'label_distance', 0.3) for mEdge in mobjects]),
+            "edge_starts": np.array([mEdge.line.get_start() for mEdge in mobjects]).reshape(-1, 3),
+            "edge_ends": np.array([mEdge.line.get_end() for mEdge in mobjects]).reshape(-1, 3),
+            "edge_highlighted": np.array([mEdge.is_highlighted() for mEdge in mobjects], dtype=bool),
+            "edge_highlight_colors": encode_colors([mEdge.highlighting.get_stroke_color() for mEdge in highlighted_edges]),
+            "edge_highlight_widths": np.array([mEdge.highlighting.get_stroke_width() for mEdge in highlighted_edges]),
+        }
+        save_structure(path, type(self).__name__, header, **arrays)
+        return self
+
+
+    @classmethod
+    def load(cls, path: str):
+        header, arrays = load_structure(path, cls.__name__)
+
+        def parse_weight(weight: str):
+            if not weight:
+                return None
+            for parse in (int, float):
+                try:
+                    return parse(weight)
+                except ValueError:
+                    pass
+            return weight
+
+        mGraph = cls(
+            node_args=decode_args(header["node_args"]),
+            value_args=decode_args(header["value_args"]),
+            edge_args=decode_args(header["edge_args"])
+        )
+        mGraph.set_weight_args(decode_args(header["weight_args"]))
+        mGraph.set_node_highlight(**decode_args(header["node_highlight"]))
+        mGraph.set_edge_highlight(**decode_args(header["edge_highlight"]))
+
+        # The graph is rebuilt at the size given by node_args and scaled back at the end
+        scale = header["scale"]
+        names = [str(name) for name in arrays["node_names"]]
+        mGraph.add_nodes_from(names, arrays["node_positions"] / scale)
+
+        src = [names[i] for i in arrays["edge_src"]]
+        dest = [names[i] for i in arrays["edge_dest"]]
+        weights = [parse_weight(str(weight)) for weight in arrays["edge_weights"]]
+        both = EdgeTable.FORWARD | EdgeTable.BACKWARD
+        separate = set(arrays["edge_ids"][arrays["edge_reverse"]].tolist())
+
+        # Straight edges go through the bulk path, an undirected record
+        # is expanded into both keys right after each other
+        bulk = {"sources": [], "targets": [], "weights": [], "label_distance": [], "starts": [], "ends": []}
+        backward_rows = {}
+        for row, edge_id in enumerate(arrays["edge_ids"].tolist()):
+            if edge_id in separate:
+                if arrays["edge_reverse"][row]:
+                    backward_rows[edge_id] = row
+                continue
+            if arrays["edge_curved"][row]:
+                node_angle, arc_angle = arrays["edge_angles"][row]
+                keys = [(src[row], dest[row])]
+                if arrays["edge_flags"][row] == both:
+                    keys.append((dest[row], src[row]))
+                for key in keys:
+                    mGraph.add_curved_edge(key[0], key[1], weights[row], arrays["edge_label_distances"][row], node_angle, arc_angle)
+                continue
+            keys = [(src[row], dest[row])]
+            if arrays["edge_flags"][row] == both:
+                keys.append((dest[row], src[row]))
+            for key in keys:
+                bulk["sources"].append(key[0])
+                bulk["targets"].append(key[1])
+                bulk["weights"].append(weights[row])
+                bulk["label_distance"].append(arrays["edge_label_distances"][row])
+                bulk["starts"].append(arrays["edge_starts"][row] / scale)
+                bulk["ends"].append(arrays["edge_ends"][row] / scale)
+
+        if bulk["sources"]:
+            mGraph.add_edges_from(
+                bulk["sources"],
+                bulk["targets"],
+                bulk["weights"],
+                bulk["label_distance"],
+                (np.array(bulk["starts"]), np.array(bulk["ends"]))
+            )
+
+        # Pairs shown with show_backward_edge keep one mobject per direction
+        for row, edge_id in enumerate(arrays["edge_ids"].tolist()):
+            if edge_id in separate and not arrays["edge_reverse"][row]:
+                back = backward_rows[edge_id]
+                node_angle, arc_angle = arrays["edge_angles"][row]
+                mGraph.show_backward_edge(
+                    src[row],
+                    dest[row],
+                    weights[row],
+                    weights[back],
+                    arrays["edge_label_distances"][row],
+                    node_angle,
+                    arc_angle
+                )
+
+        mGraph.scale(scale, about_point=ORIGIN)
+
+        highlighted = np.flatnonzero(arrays["node_highlighted"])
+        for i, color, width in zip(highlighted, arrays["node_highlight_colors"], arrays["node_highlight_widths"]):
+            mGraph.nodes[names[i]].highlight(decode_color(str(color)), float(width))
+        highlighted = np.flatnonzero(arrays["edge_highlighted"])
+        for row, color, width in zip(highlighted, arrays["edge_highlight_colors"], arrays["edge_highlight_widths"]):
+            mGraph.edges[(src[row], dest[row])].highlight(decode_color(str(color)), float(width))
+        return mGraph
+
+
     def set_node_args(self, node_args: dict):
         self.node_args = node_args.copy()
     
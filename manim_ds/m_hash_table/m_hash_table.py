@@ -0,0 +1,330 @@
+from typing import override, Any, Callable
+
+from manim import *
+from manim.typing import Point3D, Vector3D
+
+from manim_ds.constants import *
+from manim_ds.utils.utils import *
+from manim_ds.m_collection.m_collection import MElement
+from manim_ds.m_collection.m_array import MArray
+
+EMPTY_BUCKET = "/"
+
+# Marks a slot freed by a deletion in open addressing,
+# probing has to continue past it
+_TOMBSTONE = object()
+
+
+def default_hash(key: Any, size: int) -> int:
+    if isinstance(key, int):
+        return key % size
+    h = 0
+    for ch in str(key):
+        h = (h * 31 + ord(ch)) % size
+    return h
+
+
+class MHashTable(VGroup, Labelable):
+    def __init__(
+        self,
+        size: int = 8,
+        open_addressing: bool = False,
+        hash_function: Callable[[Any, int], int] = None,
+        margin: float = 0.25,
+        square_args: dict = DEFAULT_SQUARE_ARGS,
+        entry_args: dict = BLUE_SQUARE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        index_args: dict = DEFAULT_INDEX_ARGS
+    ):
+        super().__init__()
+        if size < 1:
+            raise Exception("The hash table needs at least one bucket!")
+
+        self.open_addressing = open_addressing
+        self.hash_function = hash_function if hash_function else default_hash
+        self.margin = margin
+
+        self.set_square_args(square_args)
+        self.set_entry_args(entry_args)
+        self.set_value_args(value_args)
+        self.set_index_args(index_args)
+
+        self.buckets = self._make_buckets(size)
+        self.table = self._make_table(size)
+        self += self.buckets
+        self.move_to(ORIGIN)
+
+
+    def set_square_args(self, square_args: dict):
+        self.square_args = square_args.copy()
+
+
+    def set_entry_args(self, entry_args: dict):
+        self.entry_args = entry_args.copy()
+
+
+    def set_value_args(self, value_args: dict):
+        self.value_args = value_args.copy()
+
+
+    def set_index_args(self, index_args: dict):
+        self.index_args = index_args.copy()
+
+
+    def _make_buckets(self, size: int):
+        return (
+            MArray([EMPTY_BUCKET] * size, DOWN, self.square_args, self.value_args)
+            .add_indexes(LEFT, index_args=self.index_args)
+        )
+
+
+    def _make_table(self, size: int):
+        # Open addressing keeps one entry per slot, chaining a list per bucket
+        return [None] * size if self.open_addressing else [[] for _ in range(size)]
+
+
+    @property
+    def size(self) -> int:
+        return len(self.table)
+
+
+    def entries(self) -> list[MElement]:
+        if self.open_addressing:
+            return [slot for slot in self.table if slot is not None and slot is not _TOMBSTONE]
+        return [entry for chain in self.table for entry in chain]
+
+
+    def _probe(self, key):
+        # Returns the visited buckets and the (bucket, position) of the key, if present
+        h = self.hash_function(key, self.size)
+        if not self.open_addressing:
+            for k, entry in enumerate(self.table[h]):
+                if entry.key == key:
+                    return [h], (h, k)
+            return [h], None
+
+        probes = []
+        for i in range(self.size):
+            bucket = (h + i) % self.size
+            probes.append(bucket)
+            slot = self.table[bucket]
+            if slot is None:
+                break
+            if slot is not _TOMBSTONE and slot.key == key:
+                return probes, (bucket, 0)
+        return probes, None
+
+
+    def _free_slot(self, key):
+        h = self.hash_function(key, self.size)
+        if not self.open_addressing:
+            return [h], (h, len(self.table[h]))
+
+        probes = []
+        for i in range(self.size):
+            bucket = (h + i) % self.size
+            probes.append(bucket)
+            if self.table[bucket] is None or self.table[bucket] is _TOMBSTONE:
+                return probes, (bucket, 0)
+        raise Exception("The hash table is full!")
+
+
+    def _pitch(self, buckets: MArray = None) -> float:
+        buckets = buckets if buckets else self.buckets
+        return buckets[0].square.width * (1 + self.margin)
+
+
+    def _bucket_centers(self, buckets: MArray = None) -> np.ndarray:
+        buckets = buckets if buckets else self.buckets
+        return np.array([bucket.square.get_center() for bucket in buckets.elements])
+
+
+    def _entry_position(self, bucket: int, k: int):
+        center = self.buckets[bucket].square.get_center()
+        if self.open_addressing:
+            return center
+        return center + RIGHT * (k + 1) * self._pitch()
+
+
+    def _probe_animations(self, probes: list[int]):
+        return [Indicate(self.buckets[bucket].square) for bucket in probes]
+
+
+    def find(self, key: Any) -> MElement | None:
+        _, position = self._probe(key)
+        if position is None:
+            return None
+        bucket, k = position
+        return self.table[bucket] if self.open_addressing else self.table[bucket][k]
+
+
+    def __contains__(self, key: Any) -> bool:
+        return self.find(key) is not None
+
+
+    def _logic_insert(self, key: Any):
+        probes, position = self._probe(key)
+        if position is not None:
+            return probes, None
+        probes, (bucket, k) = self._free_slot(key)
+
+        entry = MElement(str(key), self.entry_args, self.value_args)
+        entry.scale(self.buckets[0].square.width / entry.square.width)
+        entry.move_to(self._entry_position(bucket, k))
+        entry.key = key
+
+        if self.open_addressing:
+            self.table[bucket] = entry
+        else:
+            self.table[bucket].append(entry)
+        self += entry
+        return probes, entry
+
+
+    def insert(self, key: Any):
+        self._logic_insert(key)
+        return self
+
+
+    @override_animate(insert)
+    def _insert_animation(self, key: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        probes, entry = self._logic_insert(key)
+        anims = self._probe_animations(probes)
+        if entry is not None:
+            anims.append(Write(entry))
+        return Succession(*anims, group=self, **anim_args)
+
+
+    def lookup(self, key: Any):
+        entry = self.find(key)
+        if entry is not None:
+            entry.highlight()
+        return self
+
+
+    @override_animate(lookup)
+    def _lookup_animation(self, key: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        probes, _ = self._probe(key)
+        anims = self._probe_animations(probes)
+        entry = self.find(key)
+        if entry is not None:
+            anims.append(entry._highlight_animation())
+        return Succession(*anims, group=self, **anim_args)
+
+
+    def _logic_delete(self, key: Any):
+        probes, position = self._probe(key)
+        if position is None:
+            return probes, None, [], []
+
+        bucket, k = position
+        if self.open_addressing:
+            entry = self.table[bucket]
+            self.table[bucket] = _TOMBSTONE
+            moved, targets = [], []
+        else:
+            entry = self.table[bucket].pop(k)
+            # The rest of the chain slides one position back
+            moved = self.table[bucket][k:]
+            targets = [self._entry_position(bucket, i) for i in range(k, len(self.table[bucket]))]
+        self -= entry
+        return probes, entry, moved, targets
+
+
+    def delete(self, key: Any):
+        _, _, moved, targets = self._logic_delete(key)
+        for entry, target in zip(moved, targets):
+            entry.move_to(target)
+        return self
+
+
+    @override_animate(delete)
+    def _delete_animation(self, key: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        probes, entry, moved, targets = self._logic_delete(key)
+        anims = self._probe_animations(probes)
+        if entry is not None:
+            anims.append(FadeOut(entry))
+            if moved:
+                anims.append(BatchMove(moved, targets, group=self))
+        return Succession(*anims, group=VGroup(self, entry) if entry else self, **anim_args)
+
+
+    def _logic_rehash(self, new_size: int):
+        if new_size < 1:
+            raise Exception("The hash table needs at least one bucket!")
+
+        old_buckets = self.buckets
+        entries = self.entries()
+        # Checked before anything is swapped, so a failed rehash leaves the table as it was
+        if self.open_addressing and len(entries) > new_size:
+            raise Exception("The hash table is too small for its entries!")
+
+        new_buckets = self._make_buckets(new_size)
+        new_buckets.scale(old_buckets[0].square.width / new_buckets[0].square.width)
+        new_buckets.shift(old_buckets[0].square.get_center() - new_buckets[0].square.get_center())
+
+        self -= old_buckets
+        self.buckets = new_buckets
+        self.table = self._make_table(new_size)
+        self.add_to_back(new_buckets)
+
+        # Every entry is placed logically first, then all target
+        # positions are computed at once from the new bucket centres
+        bucket_ids = np.empty(len(entries), dtype=int)
+        chain_pos = np.zeros(len(entries))
+        for i, entry in enumerate(entries):
+            _, (bucket, k) = self._free_slot(entry.key)
+            if self.open_addressing:
+                self.table[bucket] = entry
+            else:
+                self.table[bucket].append(entry)
+            bucket_ids[i] = bucket
+            chain_pos[i] = k
+
+        targets = self._bucket_centers()[bucket_ids]
+        if not self.open_addressing:
+            targets = targets + np.outer(chain_pos + 1, RIGHT) * self._pitch()
+        return old_buckets, entries, targets
+
+
+    def rehash(self, new_size: int):
+        _, entries, targets = self._logic_rehash(new_size)
+        for entry, target in zip(entries, targets):
+            entry.move_to(target)
+        return self
+
+
+    @override_animate(rehash)
+    def _rehash_animation(self, new_size: int, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        old_buckets, entries, targets = self._logic_rehash(new_size)
+        return AnimationGroup(
+            FadeOut(old_buckets),
+            FadeIn(self.buckets),
+            BatchMove(entries, targets, group=self),
+            group=VGroup(self, old_buckets),
+            **anim_args
+        )
+
+
+    def add_label(
+        self,
+        text: Text,
+        direction: Vector3D = UP,
+        buff: float = 0.5,
+        **kwargs
+    ):
+        super().add_label(text, direction, buff, **kwargs)
+        self += self.label
+        return self
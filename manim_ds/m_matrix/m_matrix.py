@@ -0,0 +1,257 @@
+from typing import override, Any
+
+from manim import *
+from manim.typing import Point3D, Vector3D
+
+from manim_ds.constants import *
+from manim_ds.utils.utils import *
+from manim_ds.m_collection.m_collection import MElement
+
+class MMatrix(VGroup, Labelable):
+    def __init__(
+        self,
+        mat: list[list] | np.ndarray,
+        margin: float = 0,
+        square_args: dict = DEFAULT_SQUARE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS
+    ):
+        super().__init__()
+        values = np.array(mat, dtype=object)
+        if values.ndim != 2:
+            raise Exception("The matrix must be two-dimensional!")
+
+        self.values = values
+        self.rows, self.cols = values.shape
+        self.margin = margin
+        self.row_headers = None
+        self.col_headers = None
+        self.highlighted_regions = {}
+
+        self.set_square_args(square_args)
+        self.set_value_args(value_args)
+
+        # Cell centres are kept as offsets relative to an invisible frame,
+        # so they follow every shift or scale applied to the matrix
+        pitch = self.square_args.get("width", 1) + margin
+        self.frame = Rectangle(
+            width=max(self.cols, 1) * pitch,
+            height=max(self.rows, 1) * pitch
+        ).set_opacity(0)
+        self += self.frame
+
+        rows, cols = np.indices(values.shape)
+        self._unit_centers = np.zeros((self.rows, self.cols, 3))
+        self._unit_centers[..., 0] = (cols - (self.cols - 1) / 2) * pitch
+        self._unit_centers[..., 1] = ((self.rows - 1) / 2 - rows) * pitch
+        self._unit_centers /= self.frame.width
+
+        self.cells = np.empty(values.shape, dtype=object)
+        self._build_cells()
+        self.move_to(ORIGIN)
+
+
+    def _build_cells(self):
+        # Cells sharing a value are copied from a single prototype,
+        # so each distinct string is laid out only once
+        prerender_texts(self.values.flat, self.value_args)
+        prototypes = {}
+        centers = self.get_centers()
+        for (r, c), value in np.ndenumerate(self.values):
+            key = str(value)
+            if key not in prototypes:
+                prototypes[key] = MElement(key, self.square_args, self.value_args)
+            prototype = prototypes[key]
+            self.cells[r, c] = prototype.copy().shift(centers[r, c] - prototype.square.get_center())
+        self.add(*self.cells.flat)
+
+
+    def set_square_args(self, square_args: dict):
+        self.square_args = square_args.copy()
+
+
+    def set_value_args(self, value_args: dict):
+        self.value_args = value_args.copy()
+
+
+    def get_centers(self) -> np.ndarray:
+        return self.frame.get_center() + self._unit_centers * self.frame.width
+
+
+    def get_cell_width(self) -> float:
+        return self.cells[0, 0].square.width if self.cells.size else self.frame.width
+
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+
+    def _resolve_indices(self, mask_or_indices):
+        selector = np.asarray(mask_or_indices)
+        if selector.dtype == bool:
+            if selector.shape != self.values.shape:
+                raise Exception("The mask shape does not match the matrix shape!")
+            return np.nonzero(selector)
+        selector = selector.reshape(-1, 2)
+        return selector[:, 0], selector[:, 1]
+
+
+    def _resolve_values(self, rows, cols, values):
+        values = np.asarray(values, dtype=object)
+        if values.ndim == 0:
+            return np.full(len(rows), values.item(), dtype=object)
+        if values.shape == self.values.shape:
+            return values[rows, cols]
+        if len(values) != len(rows):
+            raise Exception("The number of values does not match the number of cells!")
+        return values
+
+
+    def _update_cells(self, mask_or_indices, values):
+        rows, cols = self._resolve_indices(mask_or_indices)
+        values = self._resolve_values(rows, cols, values)
+        changed = []
+        for r, c, value in zip(rows, cols, values):
+            if str(self.values[r, c]) == str(value):
+                continue
+            self.values[r, c] = value
+            cell = self.cells[r, c]
+            new_value = get_text(str(value), self.value_args)
+            new_value.font_size = new_value.font_size * cell.square.width
+            new_value.move_to(cell.square)
+            cell -= cell.value
+            cell.value = new_value
+            cell += cell.value
+            changed.append(cell)
+        return changed
+
+
+    def set_values(self, mask_or_indices, values):
+        self._update_cells(mask_or_indices, values)
+        return self
+
+
+    @override_animate(set_values)
+    def _set_values_animation(self, mask_or_indices, values, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        changed = self._update_cells(mask_or_indices, values)
+        return batch_animation([Indicate(cell.value) for cell in changed], self, **anim_args)
+
+
+    def _region_overlay(self, top_left, bottom_right):
+        centers = self.get_centers()
+        half = self.get_cell_width() / 2
+        ul = centers[top_left] + np.array([-half, half, 0])
+        dr = centers[bottom_right] + np.array([half, -half, 0])
+        return Rectangle(width=dr[0] - ul[0], height=ul[1] - dr[1]).move_to((ul + dr) / 2)
+
+
+    def highlight_region(
+        self,
+        top_left: tuple[int, int],
+        bottom_right: tuple[int, int],
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8
+    ):
+        key = (tuple(top_left), tuple(bottom_right))
+        if key in self.highlighted_regions:
+            self -= self.highlighted_regions[key]
+        overlay = (
+            self._region_overlay(key[0], key[1])
+            .set_fill(opacity=0)
+            .set_stroke(stroke_color, stroke_width)
+            .set_z_index(self.z_index + 1)
+        )
+        self.highlighted_regions[key] = overlay
+        self += overlay
+        return self
+
+
+    @override_animate(highlight_region)
+    def _highlight_region_animation(
+        self,
+        top_left: tuple[int, int],
+        bottom_right: tuple[int, int],
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        self.highlight_region(top_left, bottom_right, stroke_color, stroke_width)
+        return Create(self.highlighted_regions[(tuple(top_left), tuple(bottom_right))], **anim_args)
+
+
+    def unhighlight_region(
+        self,
+        top_left: tuple[int, int],
+        bottom_right: tuple[int, int]
+    ):
+        overlay = self.highlighted_regions.pop((tuple(top_left), tuple(bottom_right)), None)
+        if overlay is not None:
+            self -= overlay
+        return self
+
+
+    @override_animate(unhighlight_region)
+    def _unhighlight_region_animation(
+        self,
+        top_left: tuple[int, int],
+        bottom_right: tuple[int, int],
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        overlay = self.highlighted_regions.get((tuple(top_left), tuple(bottom_right)))
+        self.unhighlight_region(top_left, bottom_right)
+        if overlay is None:
+            return Wait(**anim_args)
+        return FadeOut(overlay, **anim_args)
+
+
+    def add_headers(
+        self,
+        row_headers: list | None = None,
+        col_headers: list | None = None,
+        buff: float = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER,
+        header_args: dict = DEFAULT_INDEX_ARGS
+    ):
+        centers = self.get_centers()
+        width = self.get_cell_width()
+
+        def make_header(value, position, direction):
+            header = get_text(str(value), header_args)
+            header.font_size = header.font_size * width
+            return header.next_to(position + direction * width / 2, direction, buff)
+
+        if row_headers is not None:
+            if len(row_headers) != self.rows:
+                raise Exception("The number of row headers does not match the number of rows!")
+            self.row_headers = VGroup(*[
+                make_header(value, centers[r, 0], LEFT) for r, value in enumerate(row_headers)
+            ])
+            self += self.row_headers
+
+        if col_headers is not None:
+            if len(col_headers) != self.cols:
+                raise Exception("The number of column headers does not match the number of columns!")
+            self.col_headers = VGroup(*[
+                make_header(value, centers[0, c], UP) for c, value in enumerate(col_headers)
+            ])
+            self += self.col_headers
+        return self
+
+
+    def add_label(
+        self,
+        text: Text,
+        direction: Vector3D = UP,
+        buff: float = 0.5,
+        **kwargs
+    ):
+        super().add_label(text, direction, buff, **kwargs)
+        self += self.label
+        return self
@@ -0,0 +1,387 @@
+from typing import override, Any
+from bisect import bisect
+
+from manim import *
+from manim.typing import Point3D, Vector3D
+
+from manim_ds.constants import *
+from manim_ds.utils.utils import *
+from manim_ds.m_graph.m_graph import MGraph
+
+class MTrie(VGroup, Labelable):
+    # Leaves take consecutive columns in alphabetical order and every node
+    # is centred over its leaves. A new branch adds at most one column, so
+    # only the subtrees on its right move one pitch and its ancestors re-centre.
+    def __init__(
+        self,
+        words: list[str] = None,
+        pitch: float = 1.25,
+        level_height: float = 1.5,
+        root_label: str = "*",
+        terminal_color: ManimColor = BLUE_D,
+        node_args: dict = DEFAULT_CIRCLE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        edge_args: dict = DEFAULT_EDGE_ARGS
+    ):
+        super().__init__()
+        self.pitch = pitch
+        self.level_height = level_height
+        self.terminal_color = terminal_color
+        self.set_node_args(node_args)
+        self.set_value_args(value_args)
+        self.set_edge_args(edge_args)
+
+        # One record per node, addressed by id; the root is 0
+        self.chars = []
+        self.parents = []
+        self.depth = []
+        self.children = []
+        self.terminal = []
+        self.first = []
+        self.leaves = []
+        self.nodes = []
+        # Edge from the parent, for every node but the root
+        self.edges = {}
+
+        root = self._add_record(root_label, None)
+        self.leaves[root] = 1
+        self.nodes.append(MGraph.Node(root_label, ORIGIN, self.node_args, self.value_args))
+        self += self.nodes[root]
+
+        if words:
+            self.insert_words(words)
+        self.move_to(ORIGIN)
+
+
+    def set_node_args(self, node_args: dict):
+        self.node_args = node_args.copy()
+
+
+    def set_value_args(self, value_args: dict):
+        self.value_args = value_args.copy()
+
+
+    def set_edge_args(self, edge_args: dict):
+        self.edge_args = edge_args.copy()
+
+
+    def _add_record(self, char: str, parent: int | None) -> int:
+        v = len(self.chars)
+        self.chars.append(char)
+        self.parents.append(parent)
+        self.depth.append(0 if parent is None else self.depth[parent] + 1)
+        self.children.append({})
+        self.terminal.append(False)
+        self.first.append(0)
+        self.leaves.append(0)
+        if parent is not None:
+            self.children[parent][char] = v
+        return v
+
+
+    def _unit(self) -> float:
+        # Current scale of the drawing relative to node_args
+        return self.nodes[0].circle.width / 2 / self.node_args.get("radius", 0.5)
+
+
+    def _offset(self, v: int) -> np.ndarray:
+        column = self.first[v] + (self.leaves[v] - 1) / 2
+        return RIGHT * column * self.pitch + DOWN * self.depth[v] * self.level_height
+
+
+    def _origin(self) -> np.ndarray:
+        # Position of column 0 at the root level, taken from the root
+        return self.nodes[0].circle.get_center() - self._offset(0) * self._unit()
+
+
+    def _make_node(self, v: int, origin: np.ndarray, unit: float):
+        node = MGraph.Node(self.chars[v], origin + self._offset(v) * unit, self.node_args, self.value_args)
+        node.scale(unit)
+        self.nodes.append(node)
+        self += node
+        return node
+
+
+    def _mark_terminal(self, v: int):
+        self.terminal[v] = True
+        self.nodes[v].circle.set_fill(self.terminal_color, opacity=0.75)
+
+
+    def _walk(self, word: str) -> tuple[int, int]:
+        # Deepest existing node on the path of word and the characters matched
+        v, i = 0, 0
+        while i < len(word) and word[i] in self.children[v]:
+            v = self.children[v][word[i]]
+            i += 1
+        return v, i
+
+
+    def _shift_subtree(self, v: int) -> list[int]:
+        shifted, stack = [], [v]
+        while stack:
+            u = stack.pop()
+            self.first[u] += 1
+            shifted.append(u)
+            stack.extend(self.children[u].values())
+        return shifted
+
+
+    def _logic_insert(self, word: str):
+        # Returns the new nodes and the existing ones whose place changed,
+        # the latter are only moved by _place
+        origin, unit = self._origin(), self._unit()
+        v, i = self._walk(word)
+        if i == len(word):
+            if not self.terminal[v]:
+                self._mark_terminal(v)
+            return [], [], origin, unit
+
+        moved = []
+        grows = bool(self.children[v])
+        if not grows:
+            # The chain continues below a leaf, in the same column
+            column = self.first[v]
+        else:
+            keys = sorted(self.children[v])
+            k = bisect(keys, word[i])
+            if k < len(keys):
+                column = self.first[self.children[v][keys[k]]]
+            else:
+                last = self.children[v][keys[-1]]
+                column = self.first[last] + self.leaves[last]
+            char, a = word[i], v
+            while a is not None:
+                for sibling_char, sibling in self.children[a].items():
+                    if sibling_char > char:
+                        moved.extend(self._shift_subtree(sibling))
+                self.leaves[a] += 1
+                moved.append(a)
+                char, a = self.chars[a], self.parents[a]
+
+        prerender_texts(word[i:], self.value_args)
+        new_ids = []
+        for char in word[i:]:
+            v = self._add_record(char, v)
+            self.first[v] = column
+            self.leaves[v] = 1
+            self._make_node(v, origin, unit)
+            new_ids.append(v)
+        self._mark_terminal(v)
+        return new_ids, moved, origin, unit
+
+
+    def _layout(self):
+        # Leaf columns and counts of the whole trie, in one depth-first pass
+        column = 0
+        stack = [(0, False)]
+        while stack:
+            v, done = stack.pop()
+            if done:
+                kids = [self.children[v][char] for char in sorted(self.children[v])]
+                self.leaves[v] = sum(self.leaves[u] for u in kids)
+                continue
+            self.first[v] = column
+            if not self.children[v]:
+                self.leaves[v] = 1
+                column += 1
+                continue
+            stack.append((v, True))
+            stack.extend((self.children[v][char], False) for char in sorted(self.children[v], reverse=True))
+
+
+    def _logic_insert_words(self, words: list[str]):
+        # The records are added first, then one layout pass places everything
+        origin, unit = self._origin(), self._unit()
+        old = {v: (self.first[v], self.leaves[v]) for v in range(len(self.chars))}
+        ends = []
+        for word in words:
+            v, i = self._walk(word)
+            for char in word[i:]:
+                v = self._add_record(char, v)
+            ends.append(v)
+        self._layout()
+
+        new_ids = list(range(len(old), len(self.chars)))
+        prerender_texts([self.chars[v] for v in new_ids], self.value_args)
+        for v in new_ids:
+            self._make_node(v, origin, unit)
+        for v in ends:
+            if not self.terminal[v]:
+                self._mark_terminal(v)
+        moved = [v for v, place in old.items() if place != (self.first[v], self.leaves[v])]
+        return new_ids, moved, origin, unit
+
+
+    def _edge_points(self, v: int):
+        parent = self.nodes[self.parents[v]].circle
+        child = self.nodes[v].circle
+        direction = normalize(child.get_center() - parent.get_center())
+        return (
+            parent.get_center() + direction * parent.width / 2,
+            child.get_center() - direction * child.width / 2
+        )
+
+
+    def _place(self, new_ids: list[int], moved: list[int], origin: np.ndarray, unit: float):
+        # Moves the nodes, redraws the edges touching them and adds the new edges
+        for v in moved:
+            node = self.nodes[v]
+            node.shift(origin + self._offset(v) * unit - node.circle.get_center())
+
+        affected = set(moved)
+        for v in moved:
+            affected.update(self.children[v].values())
+        for v in affected:
+            if v in self.edges:
+                start, end = self._edge_points(v)
+                edge = self.edges[v]
+                edge.line.put_start_and_end_on(start, end)
+                if edge.is_highlighted():
+                    edge.highlighting.put_start_and_end_on(start, end)
+                else:
+                    edge.reset_highlight()
+
+        new_edges = []
+        for v in new_ids:
+            start, end = self._edge_points(v)
+            edge = MGraph.StraightEdge(start, end, 0, 0, False, self.edge_args)
+            self.edges[v] = edge
+            self.add_to_back(edge)
+            new_edges.append(edge)
+        return new_edges
+
+
+    def _insert_animation_from(self, logic, anim_args: dict):
+        new_ids, moved, origin, unit = logic()
+        affected = set(moved)
+        for v in moved:
+            affected.update(self.children[v].values())
+        # Only the nodes that move and the edges touching them are morphed
+        new_edges = []
+        morph = BatchMorph(
+            [self.nodes[v] for v in moved] + [self.edges[v] for v in affected if v in self.edges],
+            lambda: new_edges.extend(self._place(new_ids, moved, origin, unit)),
+            group=self
+        )
+        anims = [morph] + [Create(self.nodes[v]) for v in new_ids] + [Create(edge) for edge in new_edges]
+        return batch_animation(anims, self, **anim_args)
+
+
+    def insert(self, word: str):
+        self._place(*self._logic_insert(str(word)))
+        return self
+
+
+    @override_animate(insert)
+    def _insert_animation(self, word: str, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        return self._insert_animation_from(lambda: self._logic_insert(str(word)), anim_args)
+
+
+    def insert_words(self, words: list[str]):
+        self._place(*self._logic_insert_words([str(word) for word in words]))
+        return self
+
+
+    @override_animate(insert_words)
+    def _insert_words_animation(self, words: list[str], anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        return self._insert_animation_from(
+            lambda: self._logic_insert_words([str(word) for word in words]), anim_args
+        )
+
+
+    def __contains__(self, word: str) -> bool:
+        v, i = self._walk(str(word))
+        return i == len(word) and self.terminal[v]
+
+
+    def words_with_prefix(self, prefix: str) -> list[str]:
+        v, i = self._walk(str(prefix))
+        if i < len(prefix):
+            return []
+        words, stack = [], [(v, prefix)]
+        while stack:
+            u, word = stack.pop()
+            if self.terminal[u]:
+                words.append(word)
+            stack.extend((self.children[u][char], word + char) for char in sorted(self.children[u], reverse=True))
+        return words
+
+
+    def _prefix_path(self, prefix: str) -> list[int]:
+        path = [0]
+        for char in str(prefix):
+            if char not in self.children[path[-1]]:
+                break
+            path.append(self.children[path[-1]][char])
+        return path
+
+
+    def highlight_prefix(
+        self,
+        prefix: str,
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8
+    ):
+        path = self._prefix_path(prefix)
+        for v in path:
+            self.nodes[v].highlight(stroke_color, stroke_width)
+        for v in path[1:]:
+            self.edges[v].highlight(stroke_color, stroke_width)
+        return self
+
+
+    @override_animate(highlight_prefix)
+    def _highlight_prefix_animation(
+        self,
+        prefix: str,
+        stroke_color: ManimColor = RED,
+        stroke_width: float = 8,
+        anim_args=None
+    ):
+        if anim_args is None:
+            anim_args = {}
+
+        self.highlight_prefix(prefix, stroke_color, stroke_width)
+        path = self._prefix_path(prefix)
+        anims = [Create(self.nodes[v].highlighting) for v in path]
+        anims += [Create(self.edges[v].highlighting) for v in path[1:]]
+        return batch_animation(anims, self, **anim_args)
+
+
+    def unhighlight_prefix(self, prefix: str):
+        path = self._prefix_path(prefix)
+        for v in path:
+            self.nodes[v].unhighlight()
+        for v in path[1:]:
+            self.edges[v].unhighlight()
+        return self
+
+
+    @override_animate(unhighlight_prefix)
+    def _unhighlight_prefix_animation(self, prefix: str, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        path = self._prefix_path(prefix)
+        self.unhighlight_prefix(prefix)
+        anims = [FadeOut(self.nodes[v].highlighting) for v in path]
+        anims += [FadeOut(self.edges[v].highlighting) for v in path[1:]]
+        return batch_animation(anims, self, **anim_args)
+
+
+    def add_label(
+        self,
+        text: Text,
+        direction: Vector3D = UP,
+        buff: float = 0.5,
+        **kwargs
+    ):
+        super().add_label(text, direction, buff, **kwargs)
+        self += self.label
+        return self
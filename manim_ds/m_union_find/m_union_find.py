@@ -0,0 +1,280 @@
+from typing import override, Any
+
+from manim import *
+from manim.typing import Point3D, Vector3D
+
+from manim_ds.constants import *
+from manim_ds.utils.utils import *
+from manim_ds.m_collection.m_array import MArray
+from manim_ds.m_graph.m_graph import MGraph
+
+class MUnionFind(VGroup, Labelable):
+    # Every element keeps its own column and its row is its depth, so a
+    # union or a path compression only moves the nodes whose depth changed
+    def __init__(
+        self,
+        names: list,
+        pitch: float = 1.5,
+        level_height: float = 1.5,
+        union_by_rank: bool = True,
+        path_compression: bool = True,
+        node_args: dict = DEFAULT_CIRCLE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS,
+        edge_args: dict = DEFAULT_EDGE_ARGS
+    ):
+        super().__init__()
+        self.names = [str(name) for name in names]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise Exception("The element names must be unique!")
+
+        n = len(self.names)
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.depth = [0] * n
+        self.children = [set() for _ in range(n)]
+        self.pitch = pitch
+        self.level_height = level_height
+        self.union_by_rank = union_by_rank
+        self.path_compression = path_compression
+        self.parent_array = None
+
+        self.set_node_args(node_args)
+        self.set_value_args(value_args)
+        self.set_edge_args(edge_args)
+
+        prerender_texts(self.names, self.value_args)
+        self.nodes = [
+            MGraph.Node(name, RIGHT * (i - (n - 1) / 2) * pitch, self.node_args, self.value_args)
+            for i, name in enumerate(self.names)
+        ]
+        # Only non-root elements have an edge, pointing to their parent
+        self.edges = {}
+        self.add(*self.nodes)
+        self.move_to(ORIGIN)
+
+
+    def set_node_args(self, node_args: dict):
+        self.node_args = node_args.copy()
+
+
+    def set_value_args(self, value_args: dict):
+        self.value_args = value_args.copy()
+
+
+    def set_edge_args(self, edge_args: dict):
+        self.edge_args = edge_args.copy()
+
+
+    def _id(self, name: Any) -> int:
+        if str(name) not in self.index:
+            raise Exception(f"The element {name} is not in the union-find!")
+        return self.index[str(name)]
+
+
+    def _root(self, i: int) -> int:
+        while self.parent[i] != i:
+            i = self.parent[i]
+        return i
+
+
+    def root(self, name: Any) -> str:
+        # Query only, the path is not compressed
+        return self.names[self._root(self._id(name))]
+
+
+    def connected(self, name1: Any, name2: Any) -> bool:
+        return self._root(self._id(name1)) == self._root(self._id(name2))
+
+
+    def _tree(self, root: int) -> list[int]:
+        members, stack = [], [root]
+        while stack:
+            i = stack.pop()
+            members.append(i)
+            stack.extend(self.children[i])
+        return members
+
+
+    def _tree_mobjects(self, members: list[int]) -> list[VMobject]:
+        return [self.nodes[i] for i in members] + [self.edges[i] for i in members if i in self.edges]
+
+
+    def _unit(self) -> float:
+        # Current scale of the drawing relative to node_args
+        return self.nodes[0].circle.width / 2 / self.node_args.get("radius", 0.5) if self.nodes else 1
+
+
+    def _edge_points(self, i: int):
+        child = self.nodes[i].circle
+        parent = self.nodes[self.parent[i]].circle
+        direction = normalize(parent.get_center() - child.get_center())
+        return (
+            child.get_center() + direction * child.width / 2,
+            parent.get_center() - direction * parent.width / 2
+        )
+
+
+    def _reparent(self, pairs: list[tuple[int, int]]):
+        # Returns the new edges, the nodes are moved to their new rows
+        # and only the edges of the moved or re-parented nodes are redrawn
+        for child, parent in pairs:
+            self.children[self.parent[child]].discard(child)
+            self.parent[child] = parent
+            self.children[parent].add(child)
+
+        step = self.level_height * self._unit()
+        moved = set()
+        stack = [child for child, _ in pairs]
+        while stack:
+            i = stack.pop()
+            depth = self.depth[self.parent[i]] + 1
+            if depth == self.depth[i]:
+                continue
+            self.nodes[i].shift(DOWN * (depth - self.depth[i]) * step)
+            self.depth[i] = depth
+            moved.add(i)
+            stack.extend(self.children[i])
+
+        new_edges = []
+        for i in moved | {child for child, _ in pairs}:
+            start, end = self._edge_points(i)
+            if i in self.edges:
+                edge = self.edges[i]
+                edge.line.put_start_and_end_on(start, end)
+                if edge.is_highlighted():
+                    edge.highlighting.put_start_and_end_on(start, end)
+                else:
+                    edge.reset_highlight()
+            else:
+                edge = MGraph.StraightEdge(start, end, 0, 0, True, self.edge_args)
+                self.edges[i] = edge
+                self.add_to_back(edge)
+                new_edges.append(edge)
+
+        if self.parent_array is not None:
+            indices = [child for child, _ in pairs]
+            self.parent_array.set_values(indices, [self.names[self.parent[i]] for i in indices])
+        return new_edges
+
+
+    def _compression_pairs(self, i: int) -> list[tuple[int, int]]:
+        root = self._root(i)
+        if not self.path_compression:
+            return []
+        pairs = []
+        while self.parent[i] != root and i != root:
+            pairs.append((i, root))
+            i = self.parent[i]
+        return pairs
+
+
+    def _logic_find(self, i: int):
+        pairs = self._compression_pairs(i)
+        return pairs, self._reparent(pairs)
+
+
+    def find(self, name: Any):
+        self._logic_find(self._id(name))
+        return self
+
+
+    @override_animate(find)
+    def _find_animation(self, name: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        i = self._id(name)
+        path = [i]
+        while self.parent[path[-1]] != path[-1]:
+            path.append(self.parent[path[-1]])
+        changes = []
+        morph = BatchMorph(
+            self._tree_mobjects(self._tree(path[-1])),
+            lambda: changes.extend(self._logic_find(i)),
+            group=self
+        )
+        pairs, _ = changes
+        anims = [Indicate(self.nodes[j].circle) for j in path]
+        if pairs:
+            anims.append(morph)
+            anims += self._parent_array_animations(pairs)
+        return Succession(*anims, group=self, **anim_args)
+
+
+    def _logic_union(self, i: int, j: int):
+        # Both finds compress their paths, then the root of lower rank
+        # goes under the other one
+        pairs = self._compression_pairs(i) + self._compression_pairs(j)
+        root_i, root_j = self._root(i), self._root(j)
+        if root_i != root_j:
+            if self.union_by_rank and self.rank[root_i] < self.rank[root_j]:
+                root_i, root_j = root_j, root_i
+            if self.union_by_rank and self.rank[root_i] == self.rank[root_j]:
+                self.rank[root_i] += 1
+            pairs.append((root_j, root_i))
+        return pairs, self._reparent(pairs)
+
+
+    def union(self, name1: Any, name2: Any):
+        self._logic_union(self._id(name1), self._id(name2))
+        return self
+
+
+    @override_animate(union)
+    def _union_animation(self, name1: Any, name2: Any, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+
+        i, j = self._id(name1), self._id(name2)
+        root_i, root_j = self._root(i), self._root(j)
+        # Only the two trees being merged can move
+        members = self._tree(root_i) + (self._tree(root_j) if root_j != root_i else [])
+        changes = []
+        morph = BatchMorph(
+            self._tree_mobjects(members),
+            lambda: changes.extend(self._logic_union(i, j)),
+            group=self
+        )
+        pairs, new_edges = changes
+        anims = [morph] + [Create(edge) for edge in new_edges]
+        anims += self._parent_array_animations(pairs)
+        return batch_animation(anims, self, **anim_args)
+
+
+    def _parent_array_animations(self, pairs: list[tuple[int, int]]) -> list[Animation]:
+        if self.parent_array is None:
+            return []
+        return [Indicate(self.parent_array[child].value) for child, _ in pairs]
+
+
+    def add_parent_array(
+        self,
+        buff: float = 1,
+        square_args: dict = DEFAULT_SQUARE_ARGS,
+        value_args: dict = DEFAULT_VALUE_ARGS
+    ):
+        # One cell per column, above the roots, kept in sync on every re-parenting
+        if self.parent_array is not None:
+            return self
+        self.parent_array = MArray([self.names[p] for p in self.parent], RIGHT, square_args, value_args)
+        first = self.nodes[0].circle
+        self.parent_array.scale(self.pitch * self._unit() / self.parent_array[0].square.width)
+        self.parent_array.shift(
+            first.get_center() + UP * (first.width / 2 + buff * self._unit() + self.parent_array[0].square.height / 2)
+            - self.parent_array[0].square.get_center()
+        )
+        self += self.parent_array
+        return self
+
+
+    def add_label(
+        self,
+        text: Text,
+        direction: Vector3D = UP,
+        buff: float = 0.5,
+        **kwargs
+    ):
+        super().add_label(text, direction, buff, **kwargs)
+        self += self.label
+        return self
@@ -7,7 +7,7 @@ from manim_ds.constants import *
 from manim_ds.utils.utils import *
 from manim_ds.m_collection.m_collection import MElement
 
-class MVariable(MElement, Labelable):
+class MVariable(MElement, Labelable, Footprint):
     def __init__(
         self,
         value: str,
@@ -15,6 +15,15 @@ class MVariable(MElement, Labelable):
         value_args: dict = DEFAULT_VALUE_ARGS
     ):
         super().__init__(value, square_args, value_args)
+
+
+    def _footprint_parts(self) -> dict:
+        return {
+            "highlights": [self._highlighting],
+            "values": [self.value],
+            "squares": [self.square],
+            "label": [getattr(self, "label", None)],
+        }
     
 
     def add_label(
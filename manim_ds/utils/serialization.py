@@ -0,0 +1,63 @@
+import json
+
+from manim import *
+
+# Structures are stored as a NumPy .npz archive: bulk data goes into
+# plain arrays, everything else into a small JSON header
+FORMAT_VERSION = 1
+
+
+def _encode(value):
+    if isinstance(value, ManimColor):
+        return {"color": value.to_hex(with_alpha=True)}
+    if isinstance(value, np.ndarray):
+        return {"array": value.tolist()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict) and "color" in value:
+        return ManimColor(value["color"])
+    if isinstance(value, dict) and "array" in value:
+        return np.array(value["array"])
+    return value
+
+
+def encode_args(args: dict) -> dict:
+    return {key: _encode(value) for key, value in args.items()}
+
+
+def decode_args(args: dict) -> dict:
+    return {key: _decode(value) for key, value in args.items()}
+
+
+def encode_colors(colors: list[ManimColor | None]) -> np.ndarray:
+    return np.array([color.to_hex() if color is not None else "" for color in colors], dtype=str)
+
+
+def decode_color(color: str, default: ManimColor = RED) -> ManimColor:
+    return ManimColor(color) if color else default
+
+
+def _npz_path(path: str) -> str:
+    path = str(path)
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+def save_structure(path: str, kind: str, header: dict, **arrays):
+    header = {"kind": kind, "version": FORMAT_VERSION, **header}
+    encoded = np.frombuffer(json.dumps(header).encode(), dtype=np.uint8)
+    np.savez_compressed(_npz_path(path), header=encoded, **arrays)
+
+
+def load_structure(path: str, kind: str) -> tuple[dict, dict]:
+    with np.load(_npz_path(path), allow_pickle=False) as data:
+        header = json.loads(data["header"].tobytes().decode())
+        arrays = {key: data[key] for key in data.files if key != "header"}
+    if header.get("kind") != kind:
+        raise Exception(f"The file contains a {header.get('kind')}, not a {kind}!")
+    if header.get("version") != FORMAT_VERSION:
+        raise Exception("Unsupported file format version!")
+    return header, arrays
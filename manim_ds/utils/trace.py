@@ -0,0 +1,117 @@
+from typing import Any, Iterator
+
+from manim import *
+
+from manim_ds.utils.utils import BatchMorph
+
+# A trace keeps the calls made on structures instead of animating them,
+# schedule() then plays it in a given time:
+#
+#     trace = Trace()
+#     arr = trace.on(mArray)
+#     for i in range(n):
+#         for j in range(n - i - 1):
+#             if values[j] > values[j + 1]:
+#                 arr.swap(j, j + 1)
+#         trace.mark()
+#     for anim in schedule(trace, duration=30):
+#         self.play(anim)
+#
+# Calls are only recorded, so the algorithm must not read the structure
+# while the trace is built.
+
+
+class _TraceRecorder:
+    def __init__(self, trace: "Trace", mobject: Mobject):
+        self._trace = trace
+        self._mobject = mobject
+
+
+    def __getattr__(self, name: str):
+        # The method is looked up now, so a typo fails while recording
+        getattr(self._mobject, name)
+        def record(*args, **kwargs):
+            self._trace.steps.append((self._mobject, name, args, kwargs))
+            return self
+        return record
+
+
+class Trace:
+    def __init__(self):
+        self.steps = []
+        # Number of steps recorded at the end of every pass
+        self.marks = []
+
+
+    def on(self, mobject: Mobject) -> _TraceRecorder:
+        return _TraceRecorder(self, mobject)
+
+
+    def mark(self):
+        if self.steps and (not self.marks or self.marks[-1] != len(self.steps)):
+            self.marks.append(len(self.steps))
+        return self
+
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def _animate_step(step: tuple, run_time: float):
+    mobject, name, args, kwargs = step
+    return getattr(mobject.animate(run_time=run_time), name)(*args, **kwargs)
+
+
+def _merge_steps(steps: list[tuple], run_time: float) -> Animation:
+    # All the calls are applied at once, the structures then morph
+    # from their state before the chunk to the one after it
+    mobjects = list(dict.fromkeys(mobject for mobject, _, _, _ in steps))
+    def update():
+        for mobject, name, args, kwargs in steps:
+            getattr(mobject, name)(*args, **kwargs)
+    return BatchMorph(
+        [sub for mobject in mobjects for sub in mobject.submobjects],
+        update,
+        group=mobjects[0] if len(mobjects) == 1 else VGroup(*mobjects),
+        run_time=run_time
+    )
+
+
+def schedule(
+    trace: Trace,
+    duration: float,
+    detail: float = 0.5,
+    run_time: float = 1,
+    min_run_time: float = 0.1
+) -> Iterator[Animation]:
+    # The first steps (whole passes when marked) are played one by one,
+    # using at most the detail share of the duration. The rest fills the
+    # remaining time: sped up if every step can last min_run_time, merged
+    # into chunks (one per pass when they fit) otherwise. Every call is
+    # applied, so the structures always end in their exact final state.
+    steps = trace.steps
+    detailed = min(len(steps), int(duration * detail // run_time))
+    passes = [mark for mark in trace.marks if mark <= detailed]
+    if passes and detailed < len(steps):
+        detailed = passes[-1]
+    for step in steps[:detailed]:
+        yield _animate_step(step, run_time)
+
+    rest = steps[detailed:]
+    if not rest:
+        return
+    budget = duration - detailed * run_time
+    chunks = max(1, min(len(rest), int(budget // min_run_time)))
+    if chunks == len(rest):
+        for step in rest:
+            yield _animate_step(step, max(budget / len(rest), min_run_time))
+        return
+
+    ends = [mark - detailed for mark in trace.marks if detailed < mark < len(steps)] + [len(rest)]
+    if len(ends) > chunks:
+        ends = np.linspace(0, len(rest), chunks + 1).round().astype(int)[1:].tolist()
+    chunk_time = max(budget / len(ends), min_run_time)
+    start = 0
+    for end in ends:
+        yield _merge_steps(rest[start:end], chunk_time)
+        start = end
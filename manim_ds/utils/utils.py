@@ -1,30 +1,301 @@
+from typing import Any, Callable
+
 from manim import *
 from manim.typing import Point3D, Vector3D
+import atexit
+import copy
+import multiprocessing
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+# Text rendering goes through Pango and SVG parsing, so every distinct
+# (string, style) pair is rendered once and copied afterwards; the
+# least recently used entries are dropped past _TEXT_CACHE_SIZE
+_TEXT_CACHE: OrderedDict = OrderedDict()
+_TEXT_CACHE_SIZE: int = 4096
+
+
+def _text_key(text: str, text_args: dict):
+    return (text, tuple(sorted((k, repr(v)) for k, v in text_args.items())))
+
+
+def _cache_text(key: tuple, mob: Text, text_args: dict):
+    # The style is kept on the text, so set_text can render a new string alike
+    mob._text_args = dict(text_args)
+    _TEXT_CACHE[key] = mob
+    _TEXT_CACHE.move_to_end(key)
+    while len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+
+
+def get_text(text: str, text_args: dict) -> Text:
+    key = _text_key(str(text), text_args)
+    if key in _TEXT_CACHE:
+        _TEXT_CACHE.move_to_end(key)
+    else:
+        _cache_text(key, Text(str(text), **text_args), text_args)
+    return _TEXT_CACHE[key].copy()
+
+
+def clear_text_cache():
+    _TEXT_CACHE.clear()
+
+
+def set_text_cache_size(size: int):
+    global _TEXT_CACHE_SIZE
+    _TEXT_CACHE_SIZE = size
+    while len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+
+
+# Worker processes used by prerender_texts: 1 renders in this process, the
+# default, None means one per core. Below the threshold, sending the work
+# to the pool costs more than it saves.
+_TEXT_WORKERS: int | None = 1
+_PARALLEL_TEXT_THRESHOLD: int = 64
+_TEXT_POOL: ProcessPoolExecutor | None = None
+_TEXT_POOL_WORKERS: int | None = None
+
+
+def _shutdown_text_pool():
+    global _TEXT_POOL
+    if _TEXT_POOL is not None:
+        _TEXT_POOL.shutdown(cancel_futures=True)
+        _TEXT_POOL = None
+
+
+atexit.register(_shutdown_text_pool)
+
+
+def set_text_workers(workers: int | None = None, threshold: int = 64):
+    # Opts in to rendering texts in worker processes
+    global _TEXT_WORKERS, _PARALLEL_TEXT_THRESHOLD
+    _TEXT_WORKERS = workers
+    _PARALLEL_TEXT_THRESHOLD = threshold
+    _shutdown_text_pool()
+
+
+def _text_pool(workers: int | None) -> ProcessPoolExecutor:
+    # One pool for the whole session, started with spawn so the workers do
+    # not inherit the state of a render in progress
+    global _TEXT_POOL, _TEXT_POOL_WORKERS
+    if _TEXT_POOL is None or _TEXT_POOL_WORKERS != workers:
+        _shutdown_text_pool()
+        _TEXT_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _TEXT_POOL_WORKERS = workers
+    return _TEXT_POOL
+
+
+def _render_text(text: str, text_args: dict) -> Text:
+    return Text(text, **text_args)
+
+
+def prerender_texts(texts: list, text_args: dict, workers: int | None = None):
+    # The distinct strings missing from the cache are rendered, in worker
+    # processes if enabled (see set_text_workers); the finished mobjects
+    # (point arrays and style) come back pickled and are cached here
+    missing = [
+        text for text in dict.fromkeys(str(text) for text in texts)
+        if _text_key(text, text_args) not in _TEXT_CACHE
+    ]
+    workers = workers if workers is not None else _TEXT_WORKERS
+    rendered = None
+    if len(missing) >= _PARALLEL_TEXT_THRESHOLD and workers != 1:
+        try:
+            pool = _text_pool(workers)
+            chunksize = max(1, len(missing) // (4 * (workers or os.cpu_count() or 1)))
+            rendered = list(pool.map(_render_text, missing, repeat(text_args), chunksize=chunksize))
+        except BrokenProcessPool:
+            # The workers could not start or died, this batch is rendered here
+            _shutdown_text_pool()
+            rendered = None
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # A style that cannot be sent to the workers: local classes and
+            # functions raise AttributeError, locks and the like TypeError
+            rendered = None
+    if rendered is None:
+        rendered = [_render_text(text, text_args) for text in missing]
+    for text, mob in zip(missing, rendered):
+        _cache_text(_text_key(text, text_args), mob, text_args)
+
+
+def text_args_of(text: Text) -> dict:
+    # The style a text was rendered with, only its font when not from the cache
+    return getattr(text, "_text_args", {"font": text.font})
+
 
 def set_text(old_manim_text: Text, new_text: str):
     NewText = type(old_manim_text)
-    res = (
-        NewText(
+    if NewText is Text:
+        # Plain texts come from the cache and are resized afterwards
+        res = get_text(str(new_text), text_args_of(old_manim_text))
+        res.font_size = old_manim_text.font_size
+    else:
+        res = NewText(
             str(new_text),
             font=old_manim_text.font,
             font_size=old_manim_text.font_size
         )
-        .match_style(old_manim_text)
-        .move_to(old_manim_text)
-    )
-    return res
+    return res.match_style(old_manim_text).move_to(old_manim_text)
 
 
 def TextReplace(scene, scene_mobj1, mObj1: Text, mObj2: Text):
-    old_mobj = mObj1.copy()
+    # The detached old text fades out itself, it does not need a copy
+    # The new text is moved from the source and back, it does not need a copy either
+    old_mobj = mObj1
     scene_mobj1 -= mObj1
     mObj1 = set_text(mObj1, str(mObj2.text))
     scene_mobj1 += mObj1
-    new_mobj = mObj1.copy()
-    mObj1.set_opacity(0)
-    scene.play(ReplacementTransform(mObj2.copy(), new_mobj), ApplyMethod(old_mobj.set_opacity, 0))
-    mObj1.set_opacity(1)
-    new_mobj.set_opacity(0)
+    target = mObj1.get_center()
+    mObj1.move_to(mObj2)
+    scene.play(BatchMove([mObj1], [target], group=scene_mobj1), FadeOut(old_mobj))
+
+
+def shared_copy(mobject: Mobject) -> Mobject:
+    # Style dicts (square_args, value_args, the _text_args of every cached
+    # text, ...) are replaced, never mutated, so a copy can share them.
+    # Point data, cached glyphs included, is always duplicated: scale and
+    # rotate subtract in place and Create writes partial curves into the
+    # array, so a shared array would change every copy at once.
+    memo = {}
+    for mob in mobject.get_family():
+        for name, value in vars(mob).items():
+            if name.endswith("_args") and isinstance(value, dict):
+                memo[id(value)] = value
+        # A copy is what is drawn now, it is not culled along with the scene
+        if vars(mob).get("_culling") is not None:
+            memo[id(mob._culling)] = None
+    return copy.deepcopy(mobject, memo)
+
+
+def merge_by_style(mobjects: list[Mobject]) -> list[VMobject]:
+    # Every drawn part goes into one VMobject per distinct style, so
+    # a static group is a handful of multi-path mobjects instead of a tree
+    groups = {}
+    for mob in mobjects:
+        for sub in mob.family_members_with_points():
+            key = (
+                sub.get_fill_rgbas().tobytes(),
+                sub.get_stroke_rgbas().tobytes(),
+                float(sub.get_stroke_width()),
+                sub.z_index
+            )
+            groups.setdefault(key, []).append(sub)
+
+    merged = []
+    for subs in groups.values():
+        vmob = VMobject().match_style(subs[0]).set_z_index(subs[0].z_index)
+        vmob.set_points(np.concatenate([sub.points for sub in subs]))
+        merged.append(vmob)
+    return sorted(merged, key=lambda vmob: vmob.z_index)
+
+
+class MergedGroup(VGroup):
+    # merge_by_style over chunks of a bounded number of mobjects, so
+    # cutting a few mobjects out only merges their own chunks again
+    def __init__(self, mobjects: list[Mobject], chunk_size: int = 256):
+        super().__init__()
+        self._chunks = [list(mobjects[i:i + chunk_size]) for i in range(0, len(mobjects), chunk_size)]
+        self._chunk_of = {mob: k for k, chunk in enumerate(self._chunks) for mob in chunk}
+        self._merged = [VGroup(*merge_by_style(chunk)) for chunk in self._chunks]
+        self.add(*self._merged)
+
+
+    def members(self) -> set[Mobject]:
+        return set(self._chunk_of)
+
+
+    def cut(self, mobjects: list[Mobject]):
+        # The mobjects must be in sync with the group, as their chunks are
+        # merged again from their current points
+        touched = set()
+        for mob in mobjects:
+            k = self._chunk_of.pop(mob, None)
+            if k is not None:
+                self._chunks[k].remove(mob)
+                touched.add(k)
+        for k in touched:
+            self._merged[k].submobjects = merge_by_style(self._chunks[k])
+        return self
+
+
+def batch_animation(anims: list[Animation], group: Mobject, **anim_args):
+    # A single animation for a whole set of changes, an empty set just waits
+    if not anims:
+        return AnimationGroup(Wait(), group=group, **anim_args)
+    return AnimationGroup(*anims, group=group, **anim_args)
+
+
+class BatchMove(Animation):
+    def __init__(
+        self,
+        mobjects: list[Mobject],
+        targets: np.ndarray,
+        group: Mobject = None,
+        **kwargs
+    ):
+        self.movers = list(mobjects)
+        centers = np.array([mob.get_center() for mob in self.movers]).reshape(-1, 3)
+        self.offsets = np.asarray(targets, dtype=float).reshape(-1, 3) - centers
+        super().__init__(group if group is not None else VGroup(*self.movers), **kwargs)
+
+
+    def create_starting_mobject(self) -> Mobject:
+        # The start state is kept as raw point arrays, copying the group is not needed
+        return self.mobject
+
+
+    def begin(self):
+        self.start_points = [
+            (sub, sub.points.copy(), offset)
+            for mob, offset in zip(self.movers, self.offsets)
+            for sub in mob.family_members_with_points()
+        ]
+        super().begin()
+
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        for sub, points, offset in self.start_points:
+            sub.points = points + alpha * offset
+
+
+class BatchMorph(Animation):
+    def __init__(
+        self,
+        mobjects: list[Mobject],
+        update: Callable[[], Any],
+        group: Mobject = None,
+        **kwargs
+    ):
+        # The points are recorded before and after the in-place update,
+        # then put back to the start state until the animation plays
+        starts = [
+            (sub, sub.points.copy())
+            for mob in mobjects
+            for sub in mob.family_members_with_points()
+        ]
+        update()
+        self.paths = []
+        for sub, start in starts:
+            if sub.points.shape == start.shape and not np.array_equal(sub.points, start):
+                self.paths.append((sub, start, sub.points.copy()))
+                sub.points = start.copy()
+        super().__init__(group if group is not None else VGroup(*mobjects), **kwargs)
+
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        for sub, start, end in self.paths:
+            sub.points = start + alpha * (end - start)
 
 
 class Labelable():
@@ -48,7 +319,7 @@ class Highlightable():
     def __init__(self):
         super().__init__()
         self.__target = None
-        self.highlighting = None
+        self._highlighting = None
 
 
     def _add_highlight(
@@ -56,8 +327,25 @@ class Highlightable():
         target: VMobject
     ):
         self.__target = target
-        self.highlighting = target.copy().set_fill(opacity=0).set_z_index(self.__target.z_index + 1)
+        self._highlighting = None
         self.set_highlight()
+
+
+    @property
+    def highlighting(self) -> VMobject:
+        # The overlay is copied from the target only when it is first needed,
+        # so elements that are never highlighted (and their copies) skip it
+        if self._highlighting is None:
+            self._highlighting = self.__target.copy().set_fill(opacity=0).set_z_index(self.__target.z_index + 1)
+            self._style_highlight()
+        return self._highlighting
+
+
+    def reset_highlight(self):
+        # A hidden overlay is dropped and rebuilt from the target when shown again
+        if not self.is_highlighted():
+            self._highlighting = None
+        return self
     
 
     def highlight(self, stroke_color: ManimColor = RED, stroke_width: float = 8):
@@ -80,11 +368,38 @@ class Highlightable():
     
 
     def set_highlight(self, stroke_color: ManimColor = RED, stroke_width: float = 8):
-        self.highlighting.set_stroke(stroke_color, stroke_width)
+        self._highlight_stroke = (stroke_color, stroke_width)
+        if self._highlighting is not None:
+            self._style_highlight()
+
+
+    def _style_highlight(self):
+        self._highlighting.set_stroke(*self._highlight_stroke)
     
 
+    def is_highlighted(self) -> bool:
+        return self._highlighting is not None and self._highlighting in self.submobjects
+
+
+    def highlight_state(self) -> tuple | None:
+        # Stroke of the shown overlay, None when not highlighted
+        if not self.is_highlighted():
+            return None
+        return self.highlighting.get_stroke_color(), self.highlighting.get_stroke_width()
+
+
+    def restore_highlight(self, state: tuple | None):
+        if state is None:
+            if self.is_highlighted():
+                self.unhighlight()
+        elif state != self.highlight_state():
+            self.highlight(*state)
+        return self
+
+
     def unhighlight(self):
-        self -= self.highlighting
+        if self._highlighting is not None:
+            self -= self._highlighting
         return self
     
 
@@ -94,4 +409,431 @@ class Highlightable():
             anim_args = {}
 
         self.unhighlight()
-        return FadeOut(self.highlighting, **anim_args)
\ No newline at end of file
+        return FadeOut(self.highlighting, **anim_args)
+
+def pixels_per_unit(camera: Camera = None) -> float:
+    # Screen pixels covered by one scene unit, for the scene camera by default
+    frame_width = camera.frame_width if camera is not None else config.frame_width
+    return config.pixel_width / frame_width
+
+
+def _anchor_points(anchor: VMobject) -> tuple[np.ndarray, np.ndarray]:
+    # Two distinct points of the anchor are enough to replay any
+    # shift, rotation and uniform scale applied to it
+    points = anchor.points
+    return points[0].copy(), points[len(points) // 2].copy()
+
+
+def _follow_anchor(mobject: Mobject, before: tuple, after: tuple):
+    if np.array_equal(before[0], after[0]) and np.array_equal(before[1], after[1]):
+        return
+    d0 = (before[1] - before[0])[:2]
+    d1 = (after[1] - after[0])[:2]
+    norm = np.linalg.norm(d0)
+    if norm:
+        angle = np.arctan2(d1[1], d1[0]) - np.arctan2(d0[1], d0[0])
+        factor = np.linalg.norm(d1) / norm
+        if angle:
+            mobject.rotate(angle, about_point=before[0])
+        if factor != 1:
+            mobject.scale(factor, about_point=before[0])
+    mobject.shift(after[0] - before[0])
+
+
+def _update_level_of_detail(mob: Mobject):
+    lod = mob._lod
+    reference = mob._detail_reference()
+    if reference is None:
+        return
+    size = reference.height * pixels_per_unit(lod["camera"])
+    for kind, ratio in lod["ratios"].items():
+        visible = size * ratio >= lod["threshold"]
+        if visible and kind in lod["hidden"]:
+            mob._show_details([kind])
+        elif not visible and kind not in lod["hidden"]:
+            mob._hide_details(kind)
+        elif not visible and kind in lod["pending"]:
+            # Shown for a change since the last frame, hidden again
+            mob._hide_details(kind, lod["pending"].pop(kind))
+
+
+def _camera_frame(camera: Camera) -> tuple[np.ndarray, float, float]:
+    # Centre, width and height of what the camera shows
+    frame = getattr(camera, "frame", None)
+    if frame is not None:
+        return frame.get_center(), frame.width, frame.height
+    return getattr(camera, "frame_center", ORIGIN), camera.frame_width, camera.frame_height
+
+
+def _transforms_family(animation: Animation, mob: Mobject) -> bool:
+    # Animations of a mobject holding the structure interpolate its family
+    # as it was when they began; groups and batch animations only touch parts
+    if isinstance(animation, AnimationGroup):
+        return any(_transforms_family(anim, mob) for anim in animation.animations)
+    if isinstance(animation, (BatchMove, BatchMorph)) or animation.mobject is None:
+        return False
+    return mob in animation.mobject.get_family()
+
+
+def _reattach(mob: Mobject, parts: list[Mobject], order: dict):
+    # Parts go back at their index when the index was built, so edges stay
+    # behind nodes; submobjects added since keep their place
+    parts = sorted(parts, key=order.__getitem__)
+    submobjects, k = [], 0
+    for sub in mob.submobjects:
+        rank = order.get(sub)
+        if rank is not None:
+            while k < len(parts) and order[parts[k]] < rank:
+                submobjects.append(parts[k])
+                k += 1
+        submobjects.append(sub)
+    mob.submobjects = submobjects + parts[k:]
+
+
+def _index_culling(mob: Mobject):
+    # Bounding boxes of all parts, kept in the coordinates of the anchor at
+    # this time; parts move with the anchor until the next play builds it again
+    culling = mob._culling
+    anchor = mob._cull_anchor()
+    parts = mob._cull_parts()
+    boxes = np.array([
+        np.concatenate([part.get_corner(DL)[:2], part.get_corner(UR)[:2]]) for part in parts
+    ]).reshape(-1, 4)
+    if len(boxes):
+        # The anchor spans the parts, so the bounds of the structure are
+        # the same whether they are attached or not
+        low, high = boxes[:, :2].min(axis=0), boxes[:, 2:].max(axis=0)
+        anchor.set_points_as_corners([[*low, 0], [*high, 0]])
+    culling["parts"] = parts
+    culling["index"] = {part: i for i, part in enumerate(parts)}
+    culling["order"] = {sub: i for i, sub in enumerate(mob.submobjects)}
+    culling["boxes"] = boxes
+    culling["anchor"] = culling["synced"] = _anchor_points(anchor)
+    culling["shown"] = np.ones(len(parts), dtype=bool)
+
+
+def _update_culling(mob: Mobject):
+    culling = mob._culling
+    animations = getattr(culling["scene"], "animations", None)
+    # The family must not change under an animation interpolating it
+    if any(_transforms_family(animation, mob) for animation in animations or []):
+        return
+    if animations is not culling["animations"]:
+        # A new play: the structure may have changed since the last one
+        culling["animations"] = animations
+        mob._show_culled()
+    if culling["boxes"] is None:
+        _index_culling(mob)
+
+    before = culling["anchor"]
+    after = _anchor_points(mob._cull_anchor())
+    d0 = (before[1] - before[0])[:2]
+    d1 = (after[1] - after[0])[:2]
+    if not np.linalg.norm(d0) or abs(d0[0] * d1[1] - d0[1] * d1[0]) > 1e-9 * np.linalg.norm(d0) * np.linalg.norm(d1):
+        # A rotation is not replayed on the boxes, they are taken again
+        mob._show_culled()
+        return
+    factor = np.linalg.norm(d1) / np.linalg.norm(d0)
+    # Detached parts follow the transforms of the whole structure right
+    # away, so reading their position never gives a stale one
+    mob._sync_culled(after)
+
+    # The camera frame (plus the margin) in the coordinates of the boxes
+    center, width, height = _camera_frame(culling["camera"])
+    half = np.array([width / 2, height / 2]) + culling["margin"]
+    low = before[0][:2] + (np.asarray(center)[:2] - half - after[0][:2]) / factor
+    high = before[0][:2] + (np.asarray(center)[:2] + half - after[0][:2]) / factor
+    boxes = culling["boxes"]
+    visible = (boxes[:, 0] <= high[0]) & (boxes[:, 2] >= low[0]) & (boxes[:, 1] <= high[1]) & (boxes[:, 3] >= low[1])
+
+    # Only the parts entering or leaving the frame cost anything
+    changed = np.flatnonzero(visible != culling["shown"])
+    if not len(changed):
+        return
+    culled = culling["culled"]
+    attached = set(mob.submobjects)
+    hide, show = [], []
+    for i in changed:
+        part = culling["parts"][i]
+        if visible[i]:
+            # Put back already by a change made meanwhile
+            if culled.pop(part, False) and part not in attached:
+                show.append(part)
+        elif part in attached:
+            culled[part] = True
+            hide.append(part)
+    if hide:
+        gone = set(hide)
+        mob.submobjects = [sub for sub in mob.submobjects if sub not in gone]
+    if show:
+        owned = mob._cull_owned()
+        _reattach(mob, [part for part in show if part in owned], culling["order"])
+    culling["shown"] = visible
+
+
+class LevelOfDetail():
+    # Details (labels, indexes, tips) smaller than the threshold on screen
+    # are detached, so they cost nothing per frame, and put back relative
+    # to their anchor once they are large enough again.
+    # Subclasses describe them through _detail_reference and _detail_parts.
+    def _detail_reference(self) -> VMobject | None:
+        return None
+
+
+    def _detail_parts(self) -> dict:
+        # kind -> list of (parent, attribute holding the part, anchor)
+        return {}
+
+
+    def _detail_parents(self, mobjects: list[Mobject]) -> set[Mobject]:
+        # The parents whose details may change along with the given mobjects
+        return set(mobjects)
+
+
+    def _cull_anchor(self) -> VMobject:
+        # An invisible segment across the parts, only moved by transforms
+        # applied to the whole structure, see _index_culling
+        if getattr(self, "_cull_frame", None) is None:
+            self._cull_frame = Line(ORIGIN, RIGHT).set_opacity(0).move_to(self.get_center())
+            self.submobjects.append(self._cull_frame)
+        return self._cull_frame
+
+
+    def _cull_parts(self) -> list[Mobject]:
+        # Submobjects that can be detached while out of the camera frame
+        return []
+
+
+    def _cull_owned(self) -> set[Mobject]:
+        # The parts still in the structure, a removed one is not put back
+        return set(self._cull_parts())
+
+
+    def set_culling(self, scene: Scene, margin: float = 0.5):
+        # Parts outside the camera frame are detached, so they are neither
+        # drawn nor updated, and put back as they come into view. It runs
+        # as a scene updater: the structure's own updaters are suspended
+        # while it is animated, the camera may still be moving
+        self.remove_culling()
+        self._culling = {
+            "scene": scene,
+            "camera": scene.camera,
+            "margin": margin,
+            "animations": None,
+            "parts": [],
+            "index": {},
+            "order": {},
+            "boxes": None,
+            "anchor": None,
+            "shown": None,
+            # Detached parts, all in sync with the anchor points in synced
+            "culled": {},
+            "synced": None,
+            "updater": lambda dt: _update_culling(self),
+        }
+        scene.add_updater(self._culling["updater"])
+        _update_culling(self)
+        return self
+
+
+    def remove_culling(self):
+        culling = getattr(self, "_culling", None)
+        if culling is None:
+            return self
+        self._show_culled()
+        culling["scene"].remove_updater(culling["updater"])
+        self._culling = None
+        return self
+
+
+    def _sync_culled(self, after: tuple = None):
+        culling = getattr(self, "_culling", None)
+        if culling is None:
+            return
+        if after is None:
+            after = _anchor_points(self._cull_anchor())
+        # Nothing to do until the whole structure is transformed
+        synced = culling["synced"]
+        if synced is not None and not (np.array_equal(synced[0], after[0]) and np.array_equal(synced[1], after[1])):
+            for part in culling["culled"]:
+                _follow_anchor(part, synced, after)
+        culling["synced"] = after
+
+
+    def _uncull(self, parts: list[Mobject]):
+        # Parts returned by __getitem__ are attached and in place, without
+        # touching the rest; the next frame detaches them again if need be
+        culling = getattr(self, "_culling", None)
+        if culling is None or not culling["culled"]:
+            return
+        parts = [part for part in parts if part in culling["culled"]]
+        if not parts:
+            return
+        self._sync_culled()
+        for part in parts:
+            del culling["culled"][part]
+            culling["shown"][culling["index"][part]] = True
+        _reattach(self, [part for part in parts if part not in self.submobjects], culling["order"])
+
+
+    def _show_culled(self):
+        culling = getattr(self, "_culling", None)
+        if culling is None:
+            return
+        # The parts may be changed now, the index is built again
+        culling["boxes"] = None
+        if not culling["culled"]:
+            return
+        self._sync_culled()
+        owned = self._cull_owned()
+        attached = set(self.submobjects)
+        back = [part for part in culling["culled"] if part in owned and part not in attached]
+        culling["culled"] = {}
+        _reattach(self, back, culling["order"])
+
+
+    def set_level_of_detail(self, threshold: float = 4, camera: Camera = None):
+        self.remove_level_of_detail()
+        reference = self._detail_reference()
+        if reference is None:
+            return self
+
+        # Size of each kind of detail relative to the reference, taken once
+        ratios = {}
+        for kind, entries in self._detail_parts().items():
+            for parent, attr, _ in entries:
+                part = getattr(parent, attr, None)
+                if part is not None and reference.height:
+                    ratios[kind] = part.height / reference.height
+                    break
+        # hidden: kind -> {parent: (attr, part, anchor, anchor points)},
+        # pending: kind -> entries shown for a change, hidden on the next frame
+        self._lod = {"threshold": threshold, "camera": camera, "ratios": ratios, "hidden": {}, "pending": {}}
+        self.add_updater(_update_level_of_detail)
+        _update_level_of_detail(self)
+        return self
+
+
+    def remove_level_of_detail(self):
+        if getattr(self, "_lod", None) is None:
+            return self
+        self._show_details()
+        self.remove_updater(_update_level_of_detail)
+        self._lod = None
+        return self
+
+
+    def _hide_details(self, kind: str, entries: list[tuple] = None):
+        hidden = self._lod["hidden"].setdefault(kind, {})
+        for parent, attr, anchor in self._detail_parts().get(kind, []) if entries is None else entries:
+            part = getattr(parent, attr, None)
+            if part is None or part not in parent.submobjects:
+                continue
+            parent.remove(part)
+            hidden[parent] = (attr, part, anchor, _anchor_points(anchor))
+
+
+    def _show_details(self, kinds: list[str] = None, mobjects: list[Mobject] = None):
+        # Called before a change to the structure, so it is made on the full
+        # mobjects: only the details of the given mobjects when they are
+        # known, all of them otherwise. The updater hides them again.
+        if kinds is None and mobjects is None:
+            self._show_culled()
+        lod = getattr(self, "_lod", None)
+        if lod is None or not lod["hidden"]:
+            return
+        parents = None if mobjects is None else self._detail_parents(mobjects)
+        for kind in list(lod["hidden"]) if kinds is None else kinds:
+            hidden = lod["hidden"].get(kind)
+            if hidden is None:
+                continue
+            if parents is None:
+                del lod["hidden"][kind]
+                lod["pending"].pop(kind, None)
+                entries = list(hidden.items())
+            else:
+                entries = [(parent, hidden.pop(parent)) for parent in parents if parent in hidden]
+                lod["pending"].setdefault(kind, []).extend(
+                    (parent, attr, anchor) for parent, (attr, _, anchor, _) in entries
+                )
+            for parent, (attr, part, anchor, before) in entries:
+                # A part replaced in the meantime stays out
+                if getattr(parent, attr, None) is not part:
+                    continue
+                _follow_anchor(part, before, _anchor_points(anchor))
+                parent.add(part)
+
+
+def _mobject_bytes(mob: Mobject) -> int:
+    # Point and colour arrays held by the mobject itself, not its submobjects
+    return sum(value.nbytes for value in vars(mob).values() if isinstance(value, np.ndarray))
+
+
+def _count_families(mobjects: list[Mobject], seen: set) -> dict:
+    # Every mobject is counted once, in the first component reaching it
+    size, count = 0, 0
+    for mob in mobjects:
+        for sub in mob.get_family():
+            if id(sub) in seen:
+                continue
+            seen.add(id(sub))
+            size += _mobject_bytes(sub)
+            count += 1
+    return {"bytes": size, "mobjects": count}
+
+
+def _add_counts(total: dict, counts: dict):
+    total["bytes"] += counts["bytes"]
+    total["mobjects"] += counts["mobjects"]
+
+
+class Footprint():
+    def _footprint_parts(self) -> dict:
+        # component -> mobjects, counted in this order, so overlays and
+        # labels go first and are not counted again in their parents
+        return {}
+
+
+    def _footprint(self, seen: set) -> dict:
+        counts = {}
+        # Detached parts (hidden details, culled or merged ones) are
+        # reached through the structure's own references
+        for component, mobjects in self._footprint_parts().items():
+            counts[component] = _count_families([mob for mob in mobjects if mob is not None], seen)
+        culling = getattr(self, "_culling", None)
+        culled = list(culling["culled"]) if culling is not None else []
+        counts["other"] = _count_families([self, *culled], seen)
+        total = {"bytes": 0, "mobjects": 0}
+        for component_counts in counts.values():
+            _add_counts(total, component_counts)
+        counts["total"] = total
+        return counts
+
+
+    def footprint(self) -> dict:
+        # Bytes of the point and colour arrays and number of mobjects per component
+        return self._footprint(set())
+
+
+def scene_footprint(scene: Scene) -> dict:
+    # One entry per structure found among the scene's mobjects, loose
+    # mobjects are grouped under the top-level mobject holding them
+    seen = set()
+    structures = []
+    for mob in scene.mobjects:
+        for sub in mob.get_family():
+            if isinstance(sub, Footprint) and id(sub) not in seen:
+                structures.append((sub, sub._footprint(seen)))
+        rest = _count_families([mob], seen)
+        if rest["mobjects"]:
+            structures.append((mob, {"other": rest, "total": dict(rest)}))
+
+    components = {}
+    for _, counts in structures:
+        for component, component_counts in counts.items():
+            if component != "total":
+                _add_counts(components.setdefault(component, {"bytes": 0, "mobjects": 0}), component_counts)
+    total = {"bytes": 0, "mobjects": 0}
+    for component_counts in components.values():
+        _add_counts(total, component_counts)
+    return {"structures": structures, "components": components, "total": total}
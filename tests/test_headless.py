@@ -0,0 +1,104 @@
+from manim import *
+
+from manim_ds.m_collection.m_array import *
+from manim_ds.m_graph.m_graph import *
+from manim_ds.m_graph.algorithms import kruskal
+from manim_ds.m_hash_table.m_hash_table import MHashTable
+from manim_ds.headless.headless import dry_run
+import manim_ds.m_collection.m_array as arrays
+from manim_ds.m_collection.m_array import MArray as Array
+
+class BubbleSort(Scene):
+    def construct(self):
+        values = [9, 4, 7, 1, 8, 2, 6, 3]
+        mArray = MArray(values).add_indexes(DOWN)
+        self.play(Create(mArray))
+        for i in range(len(values)):
+            for j in range(len(values) - i - 1):
+                self.play(mArray.animate.highlight_range(j, j + 2))
+                if values[j] > values[j + 1]:
+                    values[j], values[j + 1] = values[j + 1], values[j]
+                    self.play(mArray.animate.swap(j, j + 1))
+                self.play(mArray.animate.unhighlight_range(j, j + 2))
+        self.wait(1)
+
+
+
+class WeightedTree(Scene):
+    def construct(self):
+        graph = {
+            'a': [('b', 4), ('c', 1)],
+            'b': [('c', 2), ('d', 5)],
+            'c': [('d', 8)],
+            'd': []
+        }
+        mGraph = MGraph(graph).node_layout('circular_layout')
+        mGraph.show_backward_edge('a', 'b', 4, 3)
+        self.play(Create(mGraph))
+        for step in kruskal(mGraph):
+            self.play(step)
+        self.wait(1)
+
+
+class Residual(Scene):
+    def construct(self):
+        mGraph = MGraph({'s': [('a', 3), ('b', 2)], 'a': [('t', 2)], 'b': [('t', 3)], 't': []})
+        self.play(Create(mGraph))
+        self.play(mGraph.animate.apply({'s': [('b', 2)], 'a': [('s', 3), ('t', 2)], 'b': [('t', 3)], 't': [], 'c': [('t', 1)]}))
+        self.play(mGraph.animate.remove_edge('a', 't'))
+        self.play(mGraph.animate.remove_node('c'))
+        assert sorted(mGraph.edges) == [('a', 's'), ('b', 't'), ('s', 'b')]
+        assert mGraph.get_weight('a', 's') == 3
+
+
+class UndirectedRemoval(Scene):
+    def construct(self):
+        mGraph = MGraph({'a': [('b', 4), ('c', 1)], 'b': [('a', 4)], 'c': [('a', 1)]})
+        self.play(Create(mGraph))
+        # The reverse of an undirected pair stays, keyed as it is drawn
+        self.play(mGraph.animate.remove_edge('a', 'b'))
+        assert sorted(mGraph.edges) == [('a', 'c'), ('b', 'a'), ('c', 'a')]
+        assert mGraph.get_weight('b', 'a') == 4
+        self.play(mGraph.animate.apply({'a': [], 'b': [('a', 4)], 'c': [('a', 1)]}))
+        assert sorted(mGraph.edges) == [('b', 'a'), ('c', 'a')]
+        for step in kruskal(mGraph):
+            self.play(step)
+
+
+class Aliased(Scene):
+    def construct(self):
+        # Structures reached through aliases and closures are stand-ins too
+        first = Array([3, 1, 2])
+        build = lambda values: arrays.MArray(values)
+        second = build([5, 4])
+        self.play(Create(first), Create(second))
+        self.play(first.animate.swap(0, 1), second.animate.swap(0, 1))
+
+
+class HashTable(Scene):
+    def construct(self):
+        self.play(Create(MHashTable(4)))
+
+
+class DryRuns(Scene):
+    def construct(self):
+        # The scenes above, checked without building any mobject
+        summary = dry_run(BubbleSort).summary()
+        assert summary["counts"]["MArray.swap"] == 18
+        assert summary["plays"] == 1 + 28 * 2 + 18
+        summary = dry_run(WeightedTree).summary()
+        assert summary["counts"]["MGraph.highlight_edges"] == 3
+        assert summary["plays"] == 1 + 3
+        summary = dry_run(Residual).summary()
+        assert summary["counts"]["MGraph.apply"] == 1
+        summary = dry_run(UndirectedRemoval).summary()
+        assert summary["counts"]["MGraph.highlight_edges"] == 2
+        summary = dry_run(Aliased).summary()
+        assert summary["counts"]["MArray.swap"] == 2
+        # A structure without a stand-in is never built for real
+        try:
+            dry_run(HashTable)
+        except Exception as error:
+            assert "dry run" in str(error)
+        else:
+            assert False
@@ -1,6 +1,11 @@
+import os
+import tempfile
+
 from manim import *
 
 from manim_ds.m_collection.m_array import *
+from manim_ds.utils.trace import Trace, schedule
+from manim_ds.utils.utils import _TEXT_CACHE, _text_key
 
 class RandomOperations(Scene):
     def construct(self):
@@ -25,4 +30,183 @@ class RandomOperations(Scene):
         self.play(mArray.animate.swap(0, 3, path_arc=PI/2))
         self.play(mArray[0].value.animate.set_fill(RED))
         self.play(mArray[0].index.animate.set_fill(RED))
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
+
+class SwapAndRevert(Scene):
+    def construct(self):
+        mArray = MArray([5, 3, 8, 1]).add_indexes(DOWN)
+        self.play(Create(mArray))
+        before = mArray.snapshot()
+        self.play(mArray.animate.swap(0, 3))
+        self.play(mArray.animate.highlight_range(0, 2))
+        self.play(mArray.animate.restore(before))
+        self.wait(1)
+
+
+class FrozenArray(Scene):
+    def construct(self):
+        mArray = MArray(list(range(40))).add_indexes(DOWN).scale(0.3)
+        mArray.freeze()
+        self.play(Create(mArray))
+        self.play(mArray.animate.shift(UP))
+        # Only the swapped cells are drawn on their own
+        self.play(mArray.animate.swap(3, 7))
+        # A cell read while frozen is thawed in place
+        self.play(mArray[20].value.animate.set_color(RED))
+        self.play(mArray.animate.highlight_range(10, 15))
+        # Moved while frozen, a new cell still lines up with the last one
+        mArray.freeze()
+        mArray.shift(DOWN)
+        mArray.append(40)
+        mArray.thaw()
+        assert np.isclose(mArray.elements[-1].square.get_y(), mArray.elements[0].square.get_y())
+        self.play(mArray.animate.append(41))
+        self.wait(1)
+
+
+class PrefixSums(Scene):
+    def construct(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        mArray = MArray(values).add_indexes(DOWN).scale(0.6).shift(UP)
+        sums = MArray([0] * len(values)).scale(0.6).shift(DOWN)
+        self.play(Create(mArray), Create(sums))
+        prefix = np.cumsum(values).tolist()
+        # Every sum slides in from the cell it ends at
+        self.play(sums.animate.set_values(
+            range(len(values)), prefix, sources=[element.square for element in mArray.elements]
+        ))
+        self.play(mArray.animate.set_values(np.array(values) > 3, 0))
+        self.play(mArray.animate.assign([7, 7, 7]))
+        self.wait(1)
+
+
+class InsertionSort(Scene):
+    def construct(self):
+        values = [5, 2, 9, 1, 7, 3]
+        mArray = MArray([]).add_indexes(DOWN).shift(LEFT * 3)
+        self.play(Create(mArray))
+        # Each value goes straight to its sorted position
+        inserted = []
+        for value in values:
+            position = sum(1 for v in inserted if v <= value)
+            inserted.insert(position, value)
+            self.play(mArray.animate.insert(position, value))
+        self.wait(1)
+
+
+class SelectionSort(Scene):
+    def construct(self):
+        mArray = MArray([29, 10, 14, 37, 13, 5]).add_indexes(DOWN)
+        self.play(Create(mArray))
+        n = len(mArray.elements)
+        for i in range(n - 1):
+            # The minimum comes from the typed values, not from the texts
+            j = mArray.argmin(i)
+            self.play(mArray.animate.highlight_range(j, j + 1))
+            if j != i:
+                self.play(mArray.animate.swap(i, j))
+            self.play(mArray.animate.unhighlight_range(i, i + 1))
+        assert mArray.is_sorted()
+        self.play(mArray.animate.highlight_range(mArray.search(14), mArray.search(14) + 1))
+        self.play(mArray.animate.set_value(0, 1))
+        self.wait(1)
+
+
+class CompressedBubbleSort(Scene):
+    def construct(self):
+        values = list(np.random.default_rng(0).permutation(60))
+        mArray = MArray(values).scale(0.2)
+        self.play(Create(mArray))
+        trace = Trace()
+        arr = trace.on(mArray)
+        for i in range(len(values)):
+            for j in range(len(values) - i - 1):
+                if values[j] > values[j + 1]:
+                    values[j], values[j + 1] = values[j + 1], values[j]
+                    arr.swap(j, j + 1)
+            trace.mark()
+        # The first pass is shown swap by swap, the others one chunk each
+        for anim in schedule(trace, duration=20, detail=0.5, run_time=0.2):
+            self.play(anim)
+        self.wait(1)
+
+
+class MemoryReport(Scene):
+    def construct(self):
+        mArray = MArray(list(range(200))).add_indexes(DOWN).scale(0.1)
+        self.add(mArray)
+        # Overlays are built when first shown, none is counted yet
+        assert mArray.footprint()["highlights"]["mobjects"] == 0
+        mArray.highlight_range(0, 50)
+        report = mArray.footprint()
+        assert report["highlights"]["mobjects"] == 50
+        # The components add up to the total
+        total = report.pop("total")
+        for key in ("bytes", "mobjects"):
+            assert sum(counts[key] for counts in report.values()) == total[key]
+
+        # Hidden details and culled cells are still held in memory
+        mArray.set_level_of_detail(threshold=1000)
+        mArray.set_culling(self)
+        assert len(mArray.submobjects) < len(mArray.elements)
+        hidden = mArray.footprint()
+        for component in ("highlights", "indices", "values", "squares"):
+            assert hidden[component] == report[component]
+        assert hidden["other"]["mobjects"] >= report["other"]["mobjects"]
+        # Everything the render holds, summed per component
+        assert scene_footprint(self)["total"] == hidden["total"]
+        self.wait()
+
+
+class TextRendering(Scene):
+    def construct(self):
+        texts = [str(i) for i in range(40)]
+        args = dict(DEFAULT_VALUE_ARGS)
+        clear_text_cache()
+        prerender_texts(texts, args)
+        sequential = {text: get_text(text, args) for text in texts}
+
+        # The glyphs rendered by the workers are the ones rendered here
+        clear_text_cache()
+        set_text_workers(2, threshold=8)
+        prerender_texts(texts, args)
+        for text in texts:
+            assert np.allclose(get_text(text, args).get_all_points(), sequential[text].get_all_points())
+
+        # A style the workers cannot receive is rendered here instead
+        class LocalColor(ManimColor):
+            pass
+        local = dict(DEFAULT_VALUE_ARGS, color=LocalColor(BLUE))
+        prerender_texts(texts[:10], local)
+        assert all(_text_key(text, local) in _TEXT_CACHE for text in texts[:10])
+        set_text_workers(1)
+
+        # Past the cache size, the least recently used text is dropped
+        clear_text_cache()
+        set_text_cache_size(3)
+        for text in ["a", "b", "c", "a", "d"]:
+            get_text(text, args)
+        assert [key[0] for key in _TEXT_CACHE] == ["c", "a", "d"]
+        set_text_cache_size(4096)
+
+        mArray = MArray(texts[:8])
+        self.play(Create(mArray))
+        self.wait()
+
+
+class SaveLoad(Scene):
+    def construct(self):
+        mArray = MArray([3, 1, 4, 1, 5]).add_indexes(DOWN, 0.4).scale(0.5).shift(UP)
+        mArray.highlight_range(1, 3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "array.npz")
+            mArray.save(path)
+            loaded = MArray.load(path)
+        # Same values, highlights and place, indexes as far from their cells
+        assert np.array_equal(loaded.values, mArray.values)
+        assert [element.is_highlighted() for element in loaded.elements] == [element.is_highlighted() for element in mArray.elements]
+        for element, original in zip(loaded.elements, mArray.elements):
+            assert np.allclose(element.square.get_center(), original.square.get_center())
+            assert np.allclose(element.index.get_center(), original.index.get_center())
+        self.play(Create(loaded))
+        self.wait()
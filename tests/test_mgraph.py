@@ -1,7 +1,14 @@
+import os
+import tempfile
+
+import networkx as nx
+from scipy import sparse
 from manim import *
 
 from manim_ds.m_collection.m_stack import *
+from manim_ds.m_collection.m_array import *
 from manim_ds.m_graph.m_graph import *
+from manim_ds.m_graph.algorithms import bfs, kruskal, dijkstra, topological_sort, Result
 
 class DfsIterative(Scene):
     def dfs(self, graph, mGraph, mStack, start):
@@ -68,4 +75,271 @@ class DfsIterative(Scene):
         self.play(Create(mGraph))
         self.play(Create(mStack))
         self.dfs(graph, mGraph, mStack, start)
-        self.wait()
\ No newline at end of file
+        self.wait()
+
+
+class BfsLevels(Scene):
+    def construct(self):
+        graph = {
+            '0': ['1', '2'],
+            '1': ['0', '3', '4'],
+            '2': ['0', '5'],
+            '3': ['1'],
+            '4': ['1', '5'],
+            '5': ['2', '4']
+        }
+        nodes_and_positions = {
+            '0': UP * 2,
+            '1': LEFT * 2,
+            '2': RIGHT * 2,
+            '3': LEFT * 3 + DOWN * 2,
+            '4': LEFT + DOWN * 2,
+            '5': RIGHT * 2 + DOWN * 2,
+        }
+
+        mGraph = MGraph(graph, nodes_and_positions, PURPLE_CIRCLE_ARGS).scale(0.7).to_edge(LEFT)
+        mQueue = MArray([], square_args=BLUE_SQUARE_ARGS).scale(0.7).to_edge(RIGHT)
+        # Edges are split out of the batch as they get highlighted
+        mGraph.batch_edges()
+        self.play(Create(mGraph))
+        # One play per BFS level
+        for step in bfs(mGraph, '0', mQueue):
+            self.play(step)
+        self.wait()
+
+
+class IncrementalLayout(Scene):
+    def construct(self):
+        mGraph = MGraph({'0': ['1', '2'], '1': [], '2': []})
+        mGraph.node_layout('force_directed', iterations=100, temperature=3)
+        self.play(Create(mGraph))
+        # Each new node starts next to its parent, the rest of the picture stays put
+        for i in range(3, 10):
+            parent = str((i - 1) // 2)
+            self.play(mGraph.animate.add_node(str(i), mGraph[parent].get_center()))
+            self.play(mGraph.animate.add_edge(parent, str(i)))
+            self.play(mGraph.animate.node_layout('force_directed', pinned=['0'], iterations=30))
+        self.wait()
+
+
+class ClusteredLayout(Scene):
+    def construct(self):
+        # Every node at the origin but one, the layout still spreads them
+        # and stays inside the frame
+        mGraph = MGraph({str(i): [str(i + 1)] for i in range(60)} | {'60': []})
+        mGraph.add_node('far', 3 * RIGHT + 2 * UP)
+        mGraph.node_layout('force_directed', iterations=30)
+        centers = np.array([node.get_center() for node in mGraph.nodes.values()])
+        assert (np.abs(centers[:, 0]) <= config.frame_x_radius).all()
+        assert (np.abs(centers[:, 1]) <= config.frame_y_radius).all()
+        self.play(Create(mGraph))
+        # A layout that fits is not moved back to the centre
+        small = MGraph({'a': ['b'], 'b': []}).node_layout('circular_layout').scale(0.3).shift(4 * LEFT)
+        small.node_layout('force_directed', iterations=10)
+        assert small.get_center()[0] < -3
+        self.play(Create(small))
+        self.wait()
+
+
+class DependencyLayers(Scene):
+    def construct(self):
+        graph = {
+            'a': ['c', 'd'],
+            'b': ['d'],
+            'c': ['e'],
+            'd': ['e', 'f'],
+            'e': [],
+            'f': []
+        }
+        mGraph = MGraph(graph).node_layout('layered')
+        self.play(Create(mGraph))
+        self.play(mGraph.animate.node_layout('bfs', root='d'))
+        self.wait()
+
+
+class OverviewZoom(MovingCameraScene):
+    def construct(self):
+        graph = {str(i): [str((i + 1) % 30), str((i + 7) % 30)] for i in range(30)}
+        mGraph = MGraph(graph).node_layout('circular_layout')
+        # Labels and tips are dropped while they are too small to read
+        mGraph.set_level_of_detail(threshold=6, camera=self.camera)
+        self.play(Create(mGraph))
+        self.play(self.camera.frame.animate.scale(4))
+        self.play(self.camera.frame.animate.scale(0.1).move_to(mGraph['0']))
+        self.wait()
+
+
+class ZoomedTraversal(MovingCameraScene):
+    def construct(self):
+        n = 20
+        graph = {f'{i},{j}': [] for i in range(n) for j in range(n)}
+        for i in range(n):
+            for j in range(n):
+                if i + 1 < n:
+                    graph[f'{i},{j}'].append(f'{i + 1},{j}')
+                if j + 1 < n:
+                    graph[f'{i},{j}'].append(f'{i},{j + 1}')
+        positions = {f'{i},{j}': RIGHT * 2 * i + DOWN * 2 * j for i in range(n) for j in range(n)}
+        mGraph = MGraph(graph, positions)
+        width = mGraph.width
+        self.camera.frame.move_to(mGraph['0,0'])
+        self.add(mGraph)
+        # Only the nodes and edges around the camera frame are drawn, the
+        # detached ones still count in the bounds of the graph
+        mGraph.set_culling(self)
+        assert np.isclose(mGraph.width, width)
+        for k in range(1, 8):
+            node = f'{k},{k}'
+            self.play(
+                mGraph.animate.highlight_nodes([node]),
+                self.camera.frame.animate.move_to(mGraph[node])
+            )
+        # Detached nodes follow the transforms of the whole graph
+        self.play(mGraph.animate.scale(0.5).to_edge(LEFT))
+        self.play(self.camera.frame.animate.move_to(mGraph['0,0']))
+        self.play(self.camera.frame.animate.scale(3))
+        self.wait()
+
+
+class ResidualUpdate(Scene):
+    def construct(self):
+        graph = {
+            's': [('a', 3), ('b', 2)],
+            'a': [('t', 2)],
+            'b': [('a', 1), ('t', 3)],
+            't': []
+        }
+        positions = {'s': LEFT * 4, 'a': UP * 2, 'b': DOWN * 2, 't': RIGHT * 4}
+        mGraph = MGraph(graph, positions)
+        self.play(Create(mGraph))
+        # Only the saturated edge, the new reverse edges and the changed capacities are animated
+        residual = {
+            's': [('b', 2)],
+            'a': [('s', 3), ('t', 2)],
+            'b': [('a', 1), ('t', 3)],
+            't': [],
+            'c': [('t', 1)]
+        }
+        self.play(mGraph.animate.apply(residual, {'c': DOWN * 2 + RIGHT * 4, 't': RIGHT * 4 + UP}))
+        self.play(mGraph.animate.remove_node('c'))
+        self.wait()
+
+
+class BackwardEdgeRemoval(Scene):
+    def construct(self):
+        graph = {'a': [('b', 2)], 'b': [('c', 1)], 'c': []}
+        mGraph = MGraph(graph).node_layout('circular_layout')
+        mGraph.show_backward_edge('a', 'b', 2, 5)
+        self.play(Create(mGraph))
+        # Only b -> a is left, it keeps its own orientation and weight
+        self.play(mGraph.animate.remove_edge('a', 'b'))
+        assert mGraph.edges.key(mGraph.edges.id_of(('b', 'a'))) == ('b', 'a')
+        assert sorted((src, dest) for _, src, dest, _ in mGraph.edges.records()) == [('b', 'a'), ('b', 'c')]
+        self.play(mGraph.animate.node_layout('kamada_kawai_layout'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "backward_edge.npz")
+            mGraph.save(path)
+            loaded = MGraph.load(path)
+        assert ('b', 'a') in loaded.edges and ('a', 'b') not in loaded.edges
+        # The loaded graph is the same picture: nodes, edges and weights
+        assert sorted(loaded.edges) == sorted(mGraph.edges)
+        for name, node in mGraph.nodes.items():
+            assert np.allclose(loaded.nodes[name].circle.get_center(), node.circle.get_center())
+        for key in mGraph.edges:
+            assert loaded.get_weight(*key) == mGraph.get_weight(*key)
+        for step in kruskal(mGraph):
+            self.play(step)
+        self.wait()
+
+
+class Constructors(Scene):
+    def construct(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(1, 2, 3), (2, 3, 1)])
+        fromNetworkx = MGraph.from_networkx(G, {1: (-2, 0), 2: (0, 0), 3: (2, 0)})
+        # An undirected edge is a single record, reachable both ways
+        assert fromNetworkx.edges.is_undirected(('2', '1'))
+        assert fromNetworkx.get_weight('2', '1') == 3
+
+        # A matrix of ones is not weighted, a symmetric entry is the same edge
+        adjacency = sparse.csr_matrix([[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+        fromMatrix = MGraph.from_sparse_matrix(adjacency, directed=False, layout='circular_layout')
+        assert sorted(fromMatrix.edges) == [('0', '1'), ('1', '0'), ('1', '2'), ('2', '1')]
+        assert getattr(fromMatrix.edges[('0', '1')], 'weight', None) is None
+        weighted = MGraph.from_sparse_matrix(sparse.csr_matrix([[0, 2], [0, 0]]), layout='circular_layout')
+        assert weighted.get_weight('0', '1') == 2
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edges.csv")
+            with open(path, "w") as file:
+                file.write("# src,dest,weight\na,b,4\nb,a,4\nb,c\n")
+            fromEdgeList = MGraph.from_edge_list(path, directed=False, layout='circular_layout')
+        assert sorted(fromEdgeList.edges) == [('a', 'b'), ('b', 'a'), ('b', 'c'), ('c', 'b')]
+        assert fromEdgeList.get_weight('b', 'a') == 4
+
+        # The bulk path, one call for many nodes and edges
+        bulk = MGraph()
+        bulk.add_nodes_from(['x', 'y', 'z'], [LEFT, ORIGIN, RIGHT])
+        bulk.add_edges_from(['x', 'y'], ['y', 'x'])
+        bulk.add_edges_from(['y'], ['z'], [5])
+        assert bulk.edges.is_undirected(('x', 'y'))
+        assert bulk.get_weight('y', 'z') == 5
+        try:
+            bulk.add_edges_from(['z', 'x'], ['x', 'y'])
+        except Exception as error:
+            assert "already" in str(error)
+        else:
+            assert False
+        # Nothing of a rejected batch is added
+        assert ('z', 'x') not in bulk.edges
+
+        graphs = VGroup(fromNetworkx, fromMatrix, weighted, fromEdgeList, bulk).arrange_in_grid(2, 3).scale(0.5)
+        self.play(Create(graphs))
+        self.wait()
+
+
+class EdgeLookups(Scene):
+    def construct(self):
+        mGraph = MGraph({'a': ['b', 'c'], 'b': ['a', 'c'], 'c': ['d'], 'd': []}).node_layout('circular_layout')
+        # An undirected pair is one mobject, found from either side
+        assert ('b', 'a') in mGraph.edges and ('b', 'a') in mGraph
+        assert mGraph[('b', 'a')] is mGraph[('a', 'b')]
+        assert ('c', 'a') not in mGraph.edges and ('c', 'a') not in mGraph
+        # Shown as two curved edges, each direction has its own mobject
+        mGraph.show_backward_edge('c', 'd', 2, 3)
+        assert mGraph[('d', 'c')] is not mGraph[('c', 'd')]
+        assert mGraph.get_weight('d', 'c') == 3
+        assert len(mGraph.edges) == 6
+        records = list(mGraph.edges.records())
+        assert len(records) == 5
+        assert len({id(mEdge) for _, _, _, mEdge in records}) == 5
+
+        # A new layout puts every drawn edge back on its nodes exactly once
+        calls = {}
+        for _, src, dest, mEdge in records:
+            def counted(*args, key=(src, dest), put=mEdge.line.put_start_and_end_on):
+                calls[key] = calls.get(key, 0) + 1
+                return put(*args)
+            mEdge.line.put_start_and_end_on = counted
+        mGraph.node_layout('layered')
+        assert calls == {(src, dest): 1 for _, src, dest, _ in records}
+        self.play(Create(mGraph))
+        self.wait()
+
+
+class ShortestPaths(Scene):
+    def construct(self):
+        mGraph = MGraph({'a': [('b', 1), ('c', 4)], 'b': [('c', 2)], 'c': [('d', 1)], 'd': []}).node_layout('circular_layout')
+        self.play(Create(mGraph))
+        # The results are filled once the last step has been played
+        result = Result()
+        for step in dijkstra(mGraph, 'a', result=result):
+            self.play(step)
+        assert result.done
+        assert result.dist == {'a': 0, 'b': 1, 'c': 3, 'd': 4}
+        assert result.prev == {'b': 'a', 'c': 'b', 'd': 'c'}
+        order = Result()
+        for step in topological_sort(mGraph, BLUE, BLUE, result=order):
+            self.play(step)
+        assert order.order == ['a', 'b', 'c', 'd']
+        self.wait()
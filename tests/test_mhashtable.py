@@ -0,0 +1,30 @@
+from manim import *
+
+from manim_ds.m_hash_table.m_hash_table import *
+
+class ChainingAndRehash(Scene):
+    def construct(self):
+        mHashTable = (
+            MHashTable(5, square_args=PURPLE_SQUARE_ARGS, entry_args=BLUE_SQUARE_ARGS)
+            .scale(0.6)
+            .to_edge(LEFT)
+        )
+        self.play(Create(mHashTable))
+        for key in [12, 7, 22, 3, 17, 9]:
+            self.play(mHashTable.animate.insert(key))
+        self.play(mHashTable.animate.lookup(22))
+        self.play(mHashTable.animate.delete(7))
+        self.play(mHashTable.animate.rehash(11))
+        self.wait()
+
+
+class OpenAddressing(Scene):
+    def construct(self):
+        mHashTable = MHashTable(7, open_addressing=True).scale(0.6)
+        self.play(Create(mHashTable))
+        for key in [10, 3, 17, 24, 5]:
+            self.play(mHashTable.animate.insert(key))
+        self.play(mHashTable.animate.delete(17))
+        self.play(mHashTable.animate.lookup(24))
+        self.play(mHashTable.animate.rehash(13))
+        self.wait()
@@ -0,0 +1,30 @@
+from manim import *
+
+from manim_ds.m_matrix.m_matrix import *
+
+class LongestCommonSubsequence(Scene):
+    def construct(self):
+        a, b = "ABCB", "BDCAB"
+        table = np.zeros((len(a) + 1, len(b) + 1), dtype=int)
+        mMatrix = (
+            MMatrix(table, square_args=PURPLE_SQUARE_ARGS)
+            .add_headers([" "] + list(a), [" "] + list(b), header_args=PURPLE_INDEX_ARGS)
+            .scale(0.6)
+        )
+        self.play(Create(mMatrix))
+
+        # Every anti-diagonal only depends on the previous ones,
+        # so the whole diagonal is filled with a single animation
+        for d in range(2, len(a) + len(b) + 1):
+            cells = [(i, d - i) for i in range(1, len(a) + 1) if 1 <= d - i <= len(b)]
+            for i, j in cells:
+                if a[i - 1] == b[j - 1]:
+                    table[i, j] = table[i - 1, j - 1] + 1
+                else:
+                    table[i, j] = max(table[i - 1, j], table[i, j - 1])
+            self.play(mMatrix.animate.set_values(cells, [table[i, j] for i, j in cells]))
+
+        self.play(mMatrix.animate.highlight_region((len(a), len(b)), (len(a), len(b))))
+        self.play(mMatrix.animate.highlight_region((1, 1), (2, 3), BLUE))
+        self.play(mMatrix.animate.unhighlight_region((1, 1), (2, 3)))
+        self.wait()
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from manim import *
 
 from manim_ds.m_collection.m_stack import *
@@ -20,4 +23,23 @@ class Random(Scene):
         self.play(stack.animate.pop())
         self.play(stack.animate.pop())
         self.play(stack.animate.scale(5))
-        self.wait()
\ No newline at end of file
+        self.wait()
+
+
+class SaveLoad(Scene):
+    def construct(self):
+        stack = MStack([1, 2, 3], square_args=PURPLE_SQUARE_ARGS).scale(0.75).shift(LEFT)
+        stack.append('a')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stack.npz")
+            stack.save(path)
+            loaded = MStack.load(path)
+        assert [element.value.original_text for element in loaded.elements] == ['1', '2', '3', 'a']
+        for element, original in zip(loaded.elements, stack.elements):
+            assert np.allclose(element.square.get_center(), original.square.get_center())
+        # A loaded stack keeps growing from the same place
+        loaded.append('b')
+        stack.append('b')
+        assert np.allclose(loaded.elements[-1].square.get_center(), stack.elements[-1].square.get_center())
+        self.play(Create(loaded))
+        self.wait()
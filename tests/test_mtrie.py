@@ -0,0 +1,15 @@
+from manim import *
+
+from manim_ds.m_trie.m_trie import *
+
+class Autocomplete(Scene):
+    def construct(self):
+        mTrie = MTrie(["car", "cat", "do"]).scale(0.5).to_edge(UP)
+        self.play(Create(mTrie))
+        # Only "dog" is new below "do", nothing else moves
+        self.play(mTrie.animate.insert("dog"))
+        # A new branch between "car" and "cat": "cat" and "do" shift right
+        self.play(mTrie.animate.insert("cas"))
+        self.play(mTrie.animate.insert_words(["cart", "dot", "ant", "cab"]))
+        self.play(mTrie.animate.highlight_prefix("ca"))
+        self.wait()
@@ -0,0 +1,14 @@
+from manim import *
+
+from manim_ds.m_union_find.m_union_find import *
+
+class KruskalComponents(Scene):
+    def construct(self):
+        mUnionFind = MUnionFind(list("abcdefgh")).add_parent_array().scale(0.6)
+        self.play(Create(mUnionFind))
+        for a, b in [("a", "b"), ("c", "d"), ("a", "c"), ("e", "f"), ("g", "h"), ("e", "g")]:
+            self.play(mUnionFind.animate.union(a, b))
+        self.play(mUnionFind.animate.union("d", "h"))
+        # h hangs three levels below the root, find pulls it up
+        self.play(mUnionFind.animate.find("h"))
+        self.wait()